@@ -1,4 +1,5 @@
 import streamlit as st
+import streamlit.components.v1 as components
 import folium
 from streamlit_folium import st_folium
 import pandas as pd
@@ -11,14 +12,28 @@ import math
 from datetime import datetime, timedelta
 import datetime as dt
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlsplit
 import matplotlib.pyplot as plt
 import matplotlib.image as mpimg
-from PIL import Image
+from PIL import Image, ImageOps
 import io
+import csv
 import json
-from geopy.distance import geodesic
+import re
+import sqlite3
+import threading
+import zlib
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from geopy.geocoders import Nominatim
-from shapely.geometry import Point, LineString
+import shapely
+from shapely.geometry import Point, LineString, shape
+from shapely.ops import nearest_points
+from shapely.strtree import STRtree
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -145,16 +160,18 @@ st.markdown(f"""
 st.markdown("---")
 
 # Initialize session state for all features
-if 'last_update' not in st.session_state:
-    st.session_state.last_update = time.time()
-if 'breadcrumbs' not in st.session_state:
-    st.session_state.breadcrumbs = []
+if 'panel_renders' not in st.session_state:
+    st.session_state.panel_renders = {}
+if 'track_stats' not in st.session_state:
+    st.session_state.track_stats = None  # Created by the first add_breadcrumb
 if 'tracking_active' not in st.session_state:
     st.session_state.tracking_active = False
 if 'chase_start_time' not in st.session_state:
     st.session_state.chase_start_time = None
 if 'last_warning_check' not in st.session_state:
     st.session_state.last_warning_check = time.time()
+if 'announced_warnings' not in st.session_state:
+    st.session_state.announced_warnings = set()  # CAP ids already announced to this session
 
 # Initialize intelligent targeting cache to prevent excessive cycling
 if 'cached_targets' not in st.session_state:
@@ -165,28 +182,321 @@ if 'cached_weather' not in st.session_state:
     st.session_state.cached_weather = None
 if 'last_ai_enhancement' not in st.session_state:
     st.session_state.last_ai_enhancement = 0
+if 'ai_enhancement_job' not in st.session_state:
+    st.session_state.ai_enhancement_job = None  # Background AI target analysis, see start_ai_enhancement
+
+# Shared HTTP client: one pooled keep-alive session per upstream host
+HTTP_USER_AGENT = "StormChase-Dashboard/2.0 (Educational/Research)"
+HTTP_POOL_MAXSIZE = 10                              # Connections kept alive per host
+HTTP_RETRY_TOTAL = 2                                # Retries on connection errors and retryable statuses
+HTTP_RETRY_BACKOFF_FACTOR = 0.5                     # Sleeps 0.5s, 1s, ... between retries (Retry-After honored)
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+@st.cache_resource
+def get_http_session(host):
+    """Connection-pooled requests session for one upstream host with gzip, retries and backoff"""
+    retry = Retry(
+        total=HTTP_RETRY_TOTAL,
+        read=0,  # Request timeouts are already generous; don't multiply them
+        backoff_factor=HTTP_RETRY_BACKOFF_FACTOR,
+        status_forcelist=HTTP_RETRY_STATUSES,
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({'User-Agent': HTTP_USER_AGENT, 'Accept-Encoding': 'gzip, deflate'})
+    return session
+
+def http_get(url, **kwargs):
+    """GET through the pooled session for the URL's host so repeated calls reuse connections"""
+    return get_http_session(urlsplit(url).netloc).get(url, **kwargs)
+
+# Fallback URL probing for image products
+URL_PROBE_MODE = "hedged"     # "hedged" requests all candidate URLs at once; "sequential" tries one at a time
+URL_PROBE_MAX_WORKERS = 16    # Shared by all sessions; one radar or GOES probe uses up to eight
+
+@st.cache_resource
+def get_url_probe_executor():
+    """Process-wide worker pool for hedged URL probes"""
+    return ThreadPoolExecutor(max_workers=URL_PROBE_MAX_WORKERS, thread_name_prefix="url-probe")
+
+def probe_urls(urls, min_bytes, timeout, headers=None, mode=URL_PROBE_MODE):
+    """Return (url, response) for the first URL in preference order serving a 200 over min_bytes, else (None, None)"""
+    if mode != "hedged" or len(urls) < 2:
+        for url in urls:
+            try:
+                response = http_get(url, timeout=timeout, headers=headers)
+                if response.status_code == 200 and len(response.content) > min_bytes:
+                    return url, response
+            except requests.RequestException:
+                continue
+        return None, None
+
+    # Every candidate is requested at once, headers only; a URL wins once all URLs ahead of it
+    # have failed, so latency is the slowest failure ahead of the first good image, not their sum
+    executor = get_url_probe_executor()
+    futures = [executor.submit(http_get, url, timeout=timeout, headers=headers, stream=True) for url in urls]
+    try:
+        for url, future in zip(urls, futures):
+            try:
+                response = future.result()
+                # Bodies are only read for 200s, in preference order
+                if response.status_code == 200 and len(response.content) > min_bytes:
+                    return url, response
+                response.close()
+            except requests.RequestException:
+                continue
+        return None, None
+    finally:
+        # Cancel probes that have not started; the rest release their connection once they finish
+        for future in futures:
+            if not future.cancel():
+                future.add_done_callback(_close_probe_response)
+
+def _close_probe_response(future):
+    """Release a finished probe's connection (done callback)"""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+# Process-wide caches shared by every browser session
+WEATHER_CACHE_TTL_SECONDS = 600     # Same freshness window as the old per-session caches
+WEATHER_CACHE_MAX_ENTRIES = 2000    # LRU bound on cached grid cells
+WEATHER_CACHE_GRID_DEG = 0.01       # Coordinate quantization for cache keys (~1 km)
+
+class SharedTTLCache:
+    """Thread-safe LRU cache with per-entry TTL and single-flight loading, shared across sessions"""
+
+    def __init__(self, max_entries, ttl_seconds):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()  # key -> (stored_at, value), least recently used first
+        self._inflight = {}            # key -> Future for loads currently running
+        self._lock = threading.Lock()
+
+    def _fresh_value(self, key, now):
+        """Return (True, value) for a live entry, evicting it if expired (lock must be held)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        stored_at, value = entry
+        if now - stored_at >= self.ttl_seconds:
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def get(self, key):
+        """Return a fresh cached value or None"""
+        with self._lock:
+            return self._fresh_value(key, time.time())[1]
+
+    def _store(self, key, value, now):
+        """Insert a value and evict least recently used entries (lock must be held)"""
+        self._entries[key] = (now, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def put(self, key, value):
+        """Store a value, evicting least recently used entries beyond max_entries"""
+        with self._lock:
+            self._store(key, value, time.time())
+
+    def invalidate(self, key):
+        """Drop a cached entry so the next lookup reloads it"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def get_or_load(self, key, loader, wait_timeout=60):
+        """Return the cached value or load it; concurrent callers for one key share a single load"""
+        return self.get_or_load_many([key], lambda keys: [loader()], wait_timeout)[0]
+
+    def get_or_load_many(self, keys, batch_loader, wait_timeout=60):
+        """Resolve many keys at once, calling batch_loader(missing_keys) -> values for keys nobody is loading"""
+        results = [None] * len(keys)
+        claimed = {}   # key -> (Future, [result indexes]) this caller must load
+        waiting = []   # (result index, Future) owned by another caller
+
+        with self._lock:
+            now = time.time()
+            for i, key in enumerate(keys):
+                found, value = self._fresh_value(key, now)
+                if found:
+                    results[i] = value
+                elif key in claimed:
+                    claimed[key][1].append(i)
+                elif key in self._inflight:
+                    waiting.append((i, self._inflight[key]))
+                else:
+                    future = Future()
+                    self._inflight[key] = future
+                    claimed[key] = (future, [i])
+
+        if claimed:
+            claimed_keys = list(claimed)
+            try:
+                values = list(batch_loader(claimed_keys))
+            except BaseException as e:
+                # Includes Streamlit's rerun/stop interrupts: release waiters before propagating
+                with self._lock:
+                    for key in claimed_keys:
+                        self._inflight.pop(key, None)
+                for key in claimed_keys:
+                    claimed[key][0].set_exception(e)
+                raise
+            values += [None] * (len(claimed_keys) - len(values))
+
+            with self._lock:
+                now = time.time()
+                for key, value in zip(claimed_keys, values):
+                    if value is not None:
+                        self._store(key, value, now)
+                    self._inflight.pop(key, None)
+
+            for key, value in zip(claimed_keys, values):
+                future, indexes = claimed[key]
+                future.set_result(value)
+                for i in indexes:
+                    results[i] = value
+
+        for i, future in waiting:
+            try:
+                results[i] = future.result(timeout=wait_timeout)
+            except BaseException:
+                results[i] = None
+
+        return results
+
+@st.cache_resource
+def get_shared_weather_cache():
+    """Process-wide cache of derived weather parameters keyed on quantized coordinates"""
+    return SharedTTLCache(WEATHER_CACHE_MAX_ENTRIES, WEATHER_CACHE_TTL_SECONDS)
+
+def quantize_coordinates(lat, lon, step=WEATHER_CACHE_GRID_DEG):
+    """Snap a coordinate to the shared cache grid so nearby requests share one cell"""
+    return round(round(lat / step) * step, 4), round(round(lon / step) * step, 4)
+
+# Persistent on-disk response cache (survives restarts and redeploys)
+RESPONSE_CACHE_PATH = os.environ.get("STORM_CHASE_CACHE_PATH", os.path.join(".cache", "responses.sqlite3"))
+RESPONSE_CACHE_TTL_SECONDS = {
+    'open_meteo': 600,    # Model data refreshes hourly; matches the in-memory weather cache
+    'spc_reports': 300,   # SPC appends reports through the day
+    'nws_alerts': 60,     # Warnings need to stay current
+    'nws_zones': 7 * 24 * 3600  # Zone outlines rarely change
+}
+RESPONSE_CACHE_RETENTION_SECONDS = 24 * 3600  # Stale entries kept this long as an offline fallback
+
+class PersistentResponseCache:
+    """SQLite store of zlib-compressed JSON responses with fetch time and expiry"""
+
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, payload BLOB NOT NULL, fetched_at REAL NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def get(self, key):
+        """Return {'payload', 'fetched_at', 'expires_at'} for a stored response, fresh or stale, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, fetched_at, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            payload = json.loads(zlib.decompress(row[0]))
+        except (zlib.error, ValueError):
+            return None
+        return {'payload': payload, 'fetched_at': row[1], 'expires_at': row[2]}
+
+    def put(self, key, payload, ttl_seconds):
+        """Store a JSON-serializable payload that expires after ttl_seconds"""
+        now = time.time()
+        blob = zlib.compress(json.dumps(payload, separators=(',', ':')).encode('utf-8'))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, payload, fetched_at, expires_at) VALUES (?, ?, ?, ?)",
+                (key, blob, now, now + ttl_seconds)
+            )
+
+    def purge(self, older_than_seconds):
+        """Delete entries that expired more than older_than_seconds ago"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE expires_at < ?", (time.time() - older_than_seconds,))
+
+@st.cache_resource
+def get_response_cache():
+    """Process-wide persistent response cache"""
+    cache = PersistentResponseCache(RESPONSE_CACHE_PATH)
+    cache.purge(RESPONSE_CACHE_RETENTION_SECONDS)
+    return cache
+
+def cached_response(namespace, key_parts, fetch, refresh=False):
+    """Serve a fresh persisted response or fetch a new one; falls back to the stale copy if fetch fails"""
+    # fetch() must return None on failure so errors are never persisted;
+    # refresh=True skips the freshness check so entries can be renewed before they expire
+    cache = get_response_cache()
+    key = namespace + ":" + ",".join(str(part) for part in key_parts)
+    entry = cache.get(key)
+    if entry and entry['expires_at'] > time.time() and not refresh:
+        return entry['payload']
+
+    payload = fetch()
+    if payload is not None:
+        cache.put(key, payload, RESPONSE_CACHE_TTL_SECONDS[namespace])
+        return payload
+    return entry['payload'] if entry else None
 
 # Weather data fetching functions
 OPEN_METEO_GFS_URL = "https://api.open-meteo.com/v1/gfs"
+OPEN_METEO_MAX_LOCATIONS = 100  # Coordinates per multi-location request; larger grids are chunked
+
+# Target grid fetch strategy: "batch" (multi-location requests) or "concurrent" (per-point worker pool)
+GRID_FETCH_MODE = "batch"
+GRID_FETCH_MAX_WORKERS = 6           # Concurrency cap for the per-point worker pool
+GRID_FETCH_REQUEST_TIMEOUT = 10      # Seconds allowed for each grid point request
+GRID_FETCH_DEADLINE_SECONDS = 30     # Overall budget before unfinished grid points are abandoned
+
+def _open_meteo_params(latitude, longitude):
+    """Build Open-Meteo GFS query parameters (latitude/longitude may be comma-separated lists)"""
+    return {
+        "latitude": latitude,
+        "longitude": longitude,
+        "current": ["temperature_2m", "dewpoint_2m", "surface_pressure", "wind_speed_10m", "wind_direction_10m", "cape"],
+        "hourly": ["cape", "temperature_850hPa", "temperature_700hPa", "temperature_500hPa",
+                   "wind_speed_850hPa", "wind_speed_500hPa", "wind_speed_700hPa",
+                   "wind_direction_850hPa", "wind_direction_500hPa", "wind_direction_700hPa",
+                   "wind_speed_925hPa", "wind_direction_925hPa",
+                   "geopotential_height_500hPa", "geopotential_height_850hPa",
+                   "temperature_2m", "dewpoint_2m", "wind_speed_10m", "wind_direction_10m"],
+        "temperature_unit": "fahrenheit",
+        "wind_speed_unit": "kn",
+        "timezone": "America/Chicago",
+        "forecast_days": 1
+    }
 
-def get_open_meteo_data(lat, lon):
+def get_open_meteo_data(lat, lon, refresh=False):
     """Fetch real weather data from Open-Meteo GFS API including surface and pressure level parameters"""
+    return cached_response(
+        'open_meteo', (f"{lat:.4f}", f"{lon:.4f}"), lambda: _request_open_meteo_data(lat, lon), refresh=refresh
+    )
+
+def _request_open_meteo_data(lat, lon):
+    """Request one location from the Open-Meteo GFS API (None on failure)"""
     try:
-        params = {
-            "latitude": lat,
-            "longitude": lon,
-            "current": ["temperature_2m", "dewpoint_2m", "surface_pressure", "wind_speed_10m", "wind_direction_10m", "cape"],
-            "hourly": ["cape", "temperature_850hPa", "temperature_700hPa", "temperature_500hPa",
-                       "wind_speed_850hPa", "wind_speed_500hPa", "wind_speed_700hPa",
-                       "wind_direction_850hPa", "wind_direction_500hPa", "wind_direction_700hPa",
-                       "wind_speed_925hPa", "wind_direction_925hPa",
-                       "geopotential_height_500hPa", "geopotential_height_850hPa"],
-            "temperature_unit": "fahrenheit",
-            "wind_speed_unit": "kn",
-            "timezone": "America/Chicago",
-            "forecast_days": 1
-        }
-        response = requests.get(OPEN_METEO_GFS_URL, params=params, timeout=15)
+        params = _open_meteo_params(lat, lon)
+        response = http_get(OPEN_METEO_GFS_URL, params=params, timeout=15)
         if response.status_code == 200:
             return response.json()
         else:
@@ -196,16 +506,89 @@ def get_open_meteo_data(lat, lon):
         st.error(f"Open-Meteo API error: {str(e)}")
         return None
 
+def _fetch_open_meteo_point(lat, lon, timeout):
+    """Fetch a single Open-Meteo payload without touching Streamlit state (safe in worker threads)"""
+    response = http_get(OPEN_METEO_GFS_URL, params=_open_meteo_params(lat, lon), timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+def get_open_meteo_concurrent(coordinates, max_workers=GRID_FETCH_MAX_WORKERS,
+                              request_timeout=GRID_FETCH_REQUEST_TIMEOUT, deadline=GRID_FETCH_DEADLINE_SECONDS):
+    """Fetch Open-Meteo GFS data for many (lat, lon) points in parallel using a bounded worker pool"""
+    # Results stay aligned with coordinates regardless of completion order
+    payloads = [None] * len(coordinates)
+    if not coordinates:
+        return payloads
+
+    failed = 0
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(coordinates))))
+    futures = {
+        executor.submit(_fetch_open_meteo_point, point_lat, point_lon, request_timeout): i
+        for i, (point_lat, point_lon) in enumerate(coordinates)
+    }
+    pending = dict(futures)
+    try:
+        for future in as_completed(futures, timeout=deadline):
+            del pending[future]
+            try:
+                payloads[futures[future]] = future.result()
+            except Exception:
+                failed += 1
+    except FutureTimeoutError:
+        # Before Python 3.11 this is not the builtin TimeoutError; points that finished still count
+        for future, i in pending.items():
+            if future.done() and not future.cancelled() and future.exception() is None:
+                payloads[i] = future.result()
+            else:
+                failed += 1
+    finally:
+        # Don't let stragglers hold up the page; queued points are dropped
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if failed:
+        st.warning(f"Open-Meteo data unavailable for {failed} of {len(coordinates)} grid points")
+    return payloads
+
+def get_open_meteo_batch(coordinates):
+    """Fetch Open-Meteo GFS data for many (lat, lon) points using chunked multi-location requests"""
+    # Results stay aligned with coordinates; a failed chunk leaves None for its locations
+    payloads = [None] * len(coordinates)
+
+    for start in range(0, len(coordinates), OPEN_METEO_MAX_LOCATIONS):
+        chunk = coordinates[start:start + OPEN_METEO_MAX_LOCATIONS]
+        try:
+            params = _open_meteo_params(
+                ",".join(f"{point_lat:.4f}" for point_lat, _ in chunk),
+                ",".join(f"{point_lon:.4f}" for _, point_lon in chunk)
+            )
+            response = http_get(OPEN_METEO_GFS_URL, params=params, timeout=15)
+            if response.status_code != 200:
+                st.error(f"Open-Meteo API returned status {response.status_code}")
+                continue
+
+            chunk_data = response.json()
+            # A single coordinate comes back as an object, several as a list in request order
+            if isinstance(chunk_data, dict):
+                chunk_data = [chunk_data]
+            for offset, location_data in enumerate(chunk_data[:len(chunk)]):
+                location_idx = location_data.get('location_id', offset)
+                if isinstance(location_idx, int) and 0 <= location_idx < len(chunk):
+                    payloads[start + location_idx] = location_data
+        except Exception as e:
+            st.error(f"Open-Meteo API error: {str(e)}")
+
+    return payloads
+
 def get_noaa_forecast_data(lat, lon):
     """Fetch NOAA forecast data as secondary fallback"""
     try:
-        response = requests.get(f"{NOAA_API_BASE}/points/{lat},{lon}", timeout=10)
+        response = http_get(f"{NOAA_API_BASE}/points/{lat},{lon}", timeout=10)
         if response.status_code == 200:
             grid_data = response.json()
             grid_x = grid_data['properties']['gridX']
             grid_y = grid_data['properties']['gridY']
             office = grid_data['properties']['gridId']
-            forecast_response = requests.get(
+            forecast_response = http_get(
                 f"{NOAA_API_BASE}/gridpoints/{office}/{grid_x},{grid_y}/forecast",
                 timeout=10
             )
@@ -345,79 +728,420 @@ def calculate_derived_parameters(api_data):
         st.error(f"Parameter calculation error: {str(e)}")
         return None
 
-def generate_weather_data(lat, lon):
-    """Generate weather data using Open-Meteo GFS as primary source, NOAA as fallback"""
-    if 'cached_weather' in st.session_state and st.session_state.cached_weather:
-        cache_age = time.time() - st.session_state.get('last_weather_fetch', 0)
-        if cache_age < 600:
-            return st.session_state.cached_weather
+# Columnar (NumPy) derivation for many locations/hours at once
+# Output fields and rounding match calculate_derived_parameters
+DERIVED_FIELD_DECIMALS = {
+    'CAPE': 0, 'Dewpoint': 1, 'Shear_0_6km': 1, 'CIN': 0, 'SRH_0_1km': 0, 'LCL_Height': 0,
+    'Shear_0_3km': 1, 'Lapse_Rate_700_500': 1, 'Mean_Wind_0_6km': 1, 'Mean_Wind_Dir': 1,
+    'Wind_U_Sfc': 2, 'Wind_V_Sfc': 2, 'Wind_U_500': 2, 'Wind_V_500': 2,
+    'Wind_U_700': 2, 'Wind_V_700': 2, 'Wind_U_925': 2, 'Wind_V_925': 2
+}
+
+_SURFACE_FIELDS = {
+    'temp_f': 'temperature_2m', 'dewpoint_f': 'dewpoint_2m', 'cape': 'cape',
+    'wind_speed_sfc': 'wind_speed_10m', 'wind_dir_sfc': 'wind_direction_10m'
+}
+_UPPER_AIR_FIELDS = {
+    'wind_speed_500': 'wind_speed_500hPa', 'wind_dir_500': 'wind_direction_500hPa',
+    'wind_speed_700': 'wind_speed_700hPa', 'wind_dir_700': 'wind_direction_700hPa',
+    'wind_speed_925': 'wind_speed_925hPa', 'wind_dir_925': 'wind_direction_925hPa',
+    'temp_700_f': 'temperature_700hPa', 'temp_500_f': 'temperature_500hPa',
+    'gph_500': 'geopotential_height_500hPa', 'gph_850': 'geopotential_height_850hPa',
+    'hourly_cape': 'cape'
+}
+
+def _payload_hourly_matrix(payloads, key, hours):
+    """Stack one hourly series from many Open-Meteo payloads into an (N, hours) array (missing -> 0)"""
+    rows = [((payload or {}).get('hourly') or {}).get(key) or [] for payload in payloads]
+    if rows and all(len(row) == hours for row in rows):
+        matrix = np.array(rows, dtype=float)
+    else:
+        matrix = np.zeros((len(payloads), hours))
+        for i, row in enumerate(rows):
+            values = np.array(row[:hours], dtype=float)
+            matrix[i, :len(values)] = values
+    return np.nan_to_num(matrix, nan=0.0)
+
+def payloads_to_parameter_arrays(payloads, hourly=False):
+    """Stack Open-Meteo payloads into (N, 1) current-hour or (N, H) full-forecast input arrays plus a validity mask"""
+    # hourly=False mirrors calculate_derived_parameters: current surface obs + closest upper-air hour
+    n = len(payloads)
+    hours = max([len(((p or {}).get('hourly') or {}).get('time') or []) for p in payloads] + [1])
+    upper = {name: _payload_hourly_matrix(payloads, key, hours) for name, key in _UPPER_AIR_FIELDS.items()}
+
+    if hourly:
+        fields = {name: _payload_hourly_matrix(payloads, key, hours) for name, key in _SURFACE_FIELDS.items()}
+        valid = np.array([bool(((p or {}).get('hourly') or {}).get('temperature_2m')) for p in payloads], dtype=bool)
+    else:
+        # Closest-hour lookup is shared by every payload with the same time axis
+        index_by_axis = {}
+        closest = np.zeros(n, dtype=int)
+        for i, payload in enumerate(payloads):
+            times = ((payload or {}).get('hourly') or {}).get('time') or []
+            axis = (times[0], len(times)) if times else None
+            if axis not in index_by_axis:
+                index_by_axis[axis] = _find_closest_hourly_index({'time': times})
+            closest[i] = index_by_axis[axis]
+        rows = np.arange(n)
+        upper = {name: matrix[rows, closest][:, None] for name, matrix in upper.items()}
+
+        fields = {name: np.zeros((n, 1)) for name in _SURFACE_FIELDS}
+        valid = np.zeros(n, dtype=bool)
+        for i, payload in enumerate(payloads):
+            current = (payload or {}).get('current') or {}
+            if current.get('temperature_2m') is None or current.get('dewpoint_2m') is None:
+                continue
+            valid[i] = True
+            for name, key in _SURFACE_FIELDS.items():
+                fields[name][i, 0] = current.get(key) or 0
+
+    fields.update(upper)
+    return fields, valid
+
+def calculate_derived_parameter_arrays(fields):
+    """Vectorized calculate_derived_parameters over broadcastable arrays (struct-of-arrays result)"""
+    f = {name: np.asarray(value, dtype=float) for name, value in fields.items()}
+
+    cape = np.where((f['cape'] == 0) & (f['hourly_cape'] > 0), f['hourly_cape'], f['cape'])
+
+    def _wind_components(speed, direction):
+        rad = np.radians(direction)
+        return speed * np.sin(rad), speed * np.cos(rad)
+
+    u_sfc, v_sfc = _wind_components(f['wind_speed_sfc'], f['wind_dir_sfc'])
+    u_500, v_500 = _wind_components(f['wind_speed_500'], f['wind_dir_500'])
+    u_700, v_700 = _wind_components(f['wind_speed_700'], f['wind_dir_700'])
+    u_925, v_925 = _wind_components(f['wind_speed_925'], f['wind_dir_925'])
+
+    shear_0_6km = np.sqrt((u_500 - u_sfc) ** 2 + (v_500 - v_sfc) ** 2)
+    shear_0_3km = np.sqrt((u_700 - u_sfc) ** 2 + (v_700 - v_sfc) ** 2)
+
+    temp_c = (f['temp_f'] - 32) * 5 / 9
+    dewpoint_c = (f['dewpoint_f'] - 32) * 5 / 9
+    lcl_height = np.maximum(0, 125 * (temp_c - dewpoint_c))
+    cin_estimate = np.maximum(5, lcl_height / 15)
+
+    gph_500, gph_850 = f['gph_500'], f['gph_850']
+    has_heights = (gph_500 != 0) & (gph_850 != 0) & (gph_500 > gph_850)
+    height_diff_km = np.where(has_heights, gph_500 - gph_850, 3500) / 1000.0
+    t700_c = (f['temp_700_f'] - 32) * 5 / 9
+    t500_c = (f['temp_500_f'] - 32) * 5 / 9
+    lapse_rate_700_500 = (t700_c - t500_c) / height_diff_km
+
+    srh_0_1km = np.abs(u_925 * v_sfc - u_sfc * v_925) * 0.925 * 2.5
+
+    mean_wind_0_6km = (f['wind_speed_sfc'] + f['wind_speed_500']) / 2.0
+    mean_wind_dir = np.mod(np.degrees(np.arctan2((u_sfc + u_500) / 2.0, (v_sfc + v_500) / 2.0)), 360)
+
+    derived = {
+        'CAPE': cape, 'Dewpoint': f['dewpoint_f'], 'Shear_0_6km': shear_0_6km, 'CIN': cin_estimate,
+        'SRH_0_1km': srh_0_1km, 'LCL_Height': lcl_height, 'Shear_0_3km': shear_0_3km,
+        'Lapse_Rate_700_500': lapse_rate_700_500, 'Mean_Wind_0_6km': mean_wind_0_6km,
+        'Mean_Wind_Dir': mean_wind_dir,
+        'Wind_U_Sfc': u_sfc, 'Wind_V_Sfc': v_sfc, 'Wind_U_500': u_500, 'Wind_V_500': v_500,
+        'Wind_U_700': u_700, 'Wind_V_700': v_700, 'Wind_U_925': u_925, 'Wind_V_925': v_925
+    }
+    shape = np.broadcast_shapes(*(value.shape for value in derived.values()))
+    return {
+        name: np.round(np.broadcast_to(value, shape), DERIVED_FIELD_DECIMALS[name])
+        for name, value in derived.items()
+    }
 
-    api_data = get_open_meteo_data(lat, lon)
+def derived_arrays_to_records(derived, valid, hour=0):
+    """Convert one hour column of a struct-of-arrays result into calculate_derived_parameters dicts"""
+    records = []
+    for i in range(len(valid)):
+        if not valid[i]:
+            records.append(None)
+            continue
+        record = {}
+        for name, decimals in DERIVED_FIELD_DECIMALS.items():
+            value = float(derived[name][i, hour])
+            record[name] = round(value) if decimals == 0 else round(value, decimals)
+        record['source'] = 'open_meteo_gfs'
+        records.append(record)
+    return records
+
+def _load_location_weather(lat, lon, refresh=False):
+    """Fetch and derive parameters for one location (loader for the shared weather cache)"""
+    api_data = get_open_meteo_data(lat, lon, refresh=refresh)
     if api_data:
-        derived = calculate_derived_parameters(api_data)
-        if derived:
-            st.session_state.cached_weather = derived
-            st.session_state.last_weather_fetch = time.time()
-            return derived
+        return calculate_derived_parameters(api_data)
+    return None
+
+def generate_weather_data(lat, lon):
+    """Generate weather data using Open-Meteo GFS as primary source, NOAA as fallback"""
+    cell = quantize_coordinates(lat, lon)
+    derived = get_shared_weather_cache().get_or_load(cell, lambda: _load_location_weather(*cell))
+    if derived:
+        return dict(derived)
 
     st.error("⚠️ Unable to fetch real weather data from Open-Meteo API. Parameters may be unavailable. Please check your internet connection and try again.")
     return None
 
+# NEXRAD WSR-88D network: site id -> (lat, lon, name), coordinates from the NWS Radar Operations Center
+NEXRAD_STATIONS = {
+    'KABR': (45.4558, -98.4131, 'Aberdeen, SD'),
+    'KABX': (35.1497, -106.8233, 'Albuquerque, NM'),
+    'KAKQ': (36.9839, -77.0075, 'Wakefield, VA'),
+    'KAMA': (35.2333, -101.7089, 'Amarillo, TX'),
+    'KAMX': (25.6106, -80.4131, 'Miami, FL'),
+    'KAPX': (44.9072, -84.7197, 'Gaylord, MI'),
+    'KARX': (43.8228, -91.1911, 'La Crosse, WI'),
+    'KATX': (48.1947, -122.4944, 'Seattle, WA'),
+    'KBBX': (39.4961, -121.6317, 'Beale AFB, CA'),
+    'KBGM': (42.1997, -75.9850, 'Binghamton, NY'),
+    'KBHX': (40.4983, -124.2919, 'Eureka, CA'),
+    'KBIS': (46.7708, -100.7603, 'Bismarck, ND'),
+    'KBLX': (45.8539, -108.6061, 'Billings, MT'),
+    'KBMX': (33.1719, -86.7697, 'Birmingham, AL'),
+    'KBOX': (41.9558, -71.1375, 'Boston, MA'),
+    'KBRO': (25.9156, -97.4186, 'Brownsville, TX'),
+    'KBUF': (42.9486, -78.7369, 'Buffalo, NY'),
+    'KBYX': (24.5969, -81.7033, 'Key West, FL'),
+    'KCAE': (33.9486, -81.1186, 'Columbia, SC'),
+    'KCBW': (46.0392, -67.8069, 'Caribou, ME'),
+    'KCBX': (43.4908, -116.2344, 'Boise, ID'),
+    'KCCX': (40.9231, -78.0039, 'State College, PA'),
+    'KCLE': (41.4131, -81.8600, 'Cleveland, OH'),
+    'KCLX': (32.6556, -81.0422, 'Charleston, SC'),
+    'KCRP': (27.7839, -97.5108, 'Corpus Christi, TX'),
+    'KCXX': (44.5111, -73.1664, 'Burlington, VT'),
+    'KCYS': (41.1519, -104.8061, 'Cheyenne, WY'),
+    'KDAX': (38.5011, -121.6767, 'Sacramento, CA'),
+    'KDDC': (37.7608, -99.9683, 'Dodge City, KS'),
+    'KDFX': (29.2725, -100.2803, 'Laughlin AFB, TX'),
+    'KDGX': (32.2800, -89.9844, 'Jackson/Brandon, MS'),
+    'KDIX': (39.9469, -74.4111, 'Philadelphia, PA'),
+    'KDLH': (46.8369, -92.2097, 'Duluth, MN'),
+    'KDMX': (41.7311, -93.7228, 'Des Moines, IA'),
+    'KDOX': (38.8256, -75.4400, 'Dover AFB, DE'),
+    'KDTX': (42.6997, -83.4717, 'Detroit, MI'),
+    'KDVN': (41.6117, -90.5808, 'Davenport, IA'),
+    'KDYX': (32.5383, -99.2542, 'Dyess AFB, TX'),
+    'KEAX': (38.8103, -94.2642, 'Kansas City, MO'),
+    'KEMX': (31.8936, -110.6303, 'Tucson, AZ'),
+    'KENX': (42.5864, -74.0644, 'Albany, NY'),
+    'KEOX': (31.4603, -85.4594, 'Fort Rucker, AL'),
+    'KEPZ': (31.8731, -106.6975, 'El Paso, TX'),
+    'KESX': (35.7011, -114.8914, 'Las Vegas, NV'),
+    'KEVX': (30.5642, -85.9214, 'Eglin AFB, FL'),
+    'KEWX': (29.7036, -98.0281, 'Austin/San Antonio, TX'),
+    'KEYX': (35.0978, -117.5600, 'Edwards AFB, CA'),
+    'KFCX': (37.0242, -80.2742, 'Roanoke, VA'),
+    'KFDR': (34.3622, -98.9761, 'Frederick, OK'),
+    'KFDX': (34.6353, -103.6294, 'Cannon AFB, NM'),
+    'KFFC': (33.3633, -84.5658, 'Atlanta, GA'),
+    'KFSD': (43.5878, -96.7289, 'Sioux Falls, SD'),
+    'KFSX': (34.5744, -111.1983, 'Flagstaff, AZ'),
+    'KFTG': (39.7867, -104.5453, 'Denver, CO'),
+    'KFWS': (32.5728, -97.3028, 'Dallas/Fort Worth, TX'),
+    'KGGW': (48.2064, -106.6242, 'Glasgow, MT'),
+    'KGJX': (39.0622, -108.2131, 'Grand Junction, CO'),
+    'KGLD': (39.3669, -101.7000, 'Goodland, KS'),
+    'KGRB': (44.4983, -88.1111, 'Green Bay, WI'),
+    'KGRK': (30.7217, -97.3828, 'Fort Hood, TX'),
+    'KGRR': (42.8939, -85.5447, 'Grand Rapids, MI'),
+    'KGSP': (34.8831, -82.2203, 'Greenville/Spartanburg, SC'),
+    'KGWX': (33.8967, -88.3289, 'Columbus AFB, MS'),
+    'KGYX': (43.8914, -70.2569, 'Portland, ME'),
+    'KHDC': (30.5190, -90.4070, 'Hammond, LA'),
+    'KHDX': (33.0764, -106.1222, 'Holloman AFB, NM'),
+    'KHGX': (29.4719, -95.0789, 'Houston/Galveston, TX'),
+    'KHNX': (36.3142, -119.6311, 'San Joaquin Valley, CA'),
+    'KHPX': (36.7367, -87.2850, 'Fort Campbell, KY'),
+    'KHTX': (34.9306, -86.0836, 'Huntsville, AL'),
+    'KICT': (37.6544, -97.4425, 'Wichita, KS'),
+    'KICX': (37.5908, -112.8622, 'Cedar City, UT'),
+    'KILN': (39.4203, -83.8217, 'Wilmington, OH'),
+    'KILX': (40.1506, -89.3367, 'Lincoln, IL'),
+    'KIND': (39.7075, -86.2803, 'Indianapolis, IN'),
+    'KINX': (36.1750, -95.5644, 'Tulsa, OK'),
+    'KIWA': (33.2892, -111.6692, 'Phoenix, AZ'),
+    'KIWX': (41.4086, -85.7000, 'Northern Indiana, IN'),
+    'KJAX': (30.4844, -81.7019, 'Jacksonville, FL'),
+    'KJGX': (32.6750, -83.3511, 'Robins AFB, GA'),
+    'KJKL': (37.5908, -83.3131, 'Jackson, KY'),
+    'KLBB': (33.6542, -101.8136, 'Lubbock, TX'),
+    'KLCH': (30.1250, -93.2158, 'Lake Charles, LA'),
+    'KLGX': (47.1158, -124.1069, 'Langley Hill, WA'),
+    'KLIX': (30.3367, -89.8253, 'New Orleans, LA'),
+    'KLNX': (41.9578, -100.5758, 'North Platte, NE'),
+    'KLOT': (41.6044, -88.0847, 'Chicago, IL'),
+    'KLRX': (40.7397, -116.8028, 'Elko, NV'),
+    'KLSX': (38.6989, -90.6828, 'St. Louis, MO'),
+    'KLTX': (33.9892, -78.4292, 'Wilmington, NC'),
+    'KLVX': (37.9753, -85.9439, 'Louisville, KY'),
+    'KLWX': (38.9763, -77.4875, 'Sterling, VA'),
+    'KLZK': (34.8364, -92.2619, 'Little Rock, AR'),
+    'KMAF': (31.9433, -102.1889, 'Midland/Odessa, TX'),
+    'KMAX': (42.0811, -122.7161, 'Medford, OR'),
+    'KMBX': (48.3925, -100.8644, 'Minot AFB, ND'),
+    'KMHX': (34.7758, -76.8764, 'Morehead City, NC'),
+    'KMKX': (42.9678, -88.5506, 'Milwaukee, WI'),
+    'KMLB': (28.1131, -80.6544, 'Melbourne, FL'),
+    'KMOB': (30.6794, -88.2397, 'Mobile, AL'),
+    'KMPX': (44.8489, -93.5653, 'Minneapolis/St. Paul, MN'),
+    'KMQT': (46.5311, -87.5483, 'Marquette, MI'),
+    'KMRX': (36.1683, -83.4019, 'Knoxville, TN'),
+    'KMSX': (47.0411, -113.9861, 'Missoula, MT'),
+    'KMTX': (41.2628, -112.4469, 'Salt Lake City, UT'),
+    'KMUX': (37.1553, -121.8975, 'San Francisco, CA'),
+    'KMVX': (47.5281, -97.3250, 'Grand Forks, ND'),
+    'KMXX': (32.5367, -85.7897, 'Maxwell AFB, AL'),
+    'KNKX': (32.9189, -117.0419, 'San Diego, CA'),
+    'KNQA': (35.3447, -89.8733, 'Memphis, TN'),
+    'KOAX': (41.3203, -96.3664, 'Omaha, NE'),
+    'KOHX': (36.2472, -86.5625, 'Nashville, TN'),
+    'KOKX': (40.8656, -72.8644, 'New York City, NY'),
+    'KOTX': (47.6806, -117.6258, 'Spokane, WA'),
+    'KPAH': (37.0683, -88.7719, 'Paducah, KY'),
+    'KPBZ': (40.5317, -80.2183, 'Pittsburgh, PA'),
+    'KPDT': (45.6906, -118.8528, 'Pendleton, OR'),
+    'KPOE': (31.1553, -92.9758, 'Fort Polk, LA'),
+    'KPUX': (38.4594, -104.1814, 'Pueblo, CO'),
+    'KRAX': (35.6653, -78.4900, 'Raleigh/Durham, NC'),
+    'KRGX': (39.7542, -119.4611, 'Reno, NV'),
+    'KRIW': (43.0661, -108.4767, 'Riverton, WY'),
+    'KRLX': (38.3119, -81.7239, 'Charleston, WV'),
+    'KRTX': (45.7150, -122.9642, 'Portland, OR'),
+    'KSFX': (43.1058, -112.6853, 'Pocatello, ID'),
+    'KSGF': (37.2353, -93.4003, 'Springfield, MO'),
+    'KSHV': (32.4506, -93.8411, 'Shreveport, LA'),
+    'KSJT': (31.3711, -100.4922, 'San Angelo, TX'),
+    'KSOX': (33.8178, -117.6350, 'Santa Ana Mountains, CA'),
+    'KSRX': (35.2906, -94.3617, 'Fort Smith, AR'),
+    'KTBW': (27.7053, -82.4019, 'Tampa Bay, FL'),
+    'KTFX': (47.4597, -111.3844, 'Great Falls, MT'),
+    'KTLH': (30.3975, -84.3289, 'Tallahassee, FL'),
+    'KTLX': (35.3331, -97.2775, 'Norman, OK'),
+    'KTWX': (38.9969, -96.2325, 'Topeka, KS'),
+    'KTYX': (43.7558, -75.6800, 'Fort Drum, NY'),
+    'KUDX': (44.1250, -102.8294, 'Rapid City, SD'),
+    'KUEX': (40.3208, -98.4417, 'Hastings, NE'),
+    'KVAX': (30.8900, -83.0019, 'Moody AFB, GA'),
+    'KVBX': (34.8381, -120.3958, 'Vandenberg AFB, CA'),
+    'KVNX': (36.7408, -98.1275, 'Vance AFB, OK'),
+    'KVTX': (34.4117, -119.1786, 'Los Angeles, CA'),
+    'KVWX': (38.2600, -87.7247, 'Evansville, IN'),
+    'KYUX': (32.4953, -114.6558, 'Yuma, AZ'),
+    'LPLA': (38.7303, -27.3217, 'Lajes Field, Azores'),
+    'PABC': (60.7928, -161.8742, 'Bethel, AK'),
+    'PACG': (56.8528, -135.5292, 'Sitka, AK'),
+    'PAEC': (64.5114, -165.2950, 'Nome, AK'),
+    'PAHG': (60.7259, -151.3515, 'Anchorage, AK'),
+    'PAIH': (59.4619, -146.3011, 'Middleton Island, AK'),
+    'PAKC': (58.6794, -156.6294, 'King Salmon, AK'),
+    'PAPD': (65.0356, -147.4992, 'Fairbanks, AK'),
+    'PGUA': (13.4544, 144.8083, 'Andersen AFB, Guam'),
+    'PHKI': (21.8942, -159.5522, 'South Kauai, HI'),
+    'PHKM': (20.1256, -155.7778, 'Kohala, HI'),
+    'PHMO': (21.1328, -157.1800, 'Molokai, HI'),
+    'PHWA': (19.0950, -155.5689, 'South Shore, HI'),
+    'RKJK': (35.9242, 126.6222, 'Kunsan AB, South Korea'),
+    'RKSG': (36.9597, 127.0183, 'Camp Humphreys, South Korea'),
+    'RODN': (26.3019, 127.9097, 'Kadena AB, Okinawa'),
+    'TJUA': (18.1175, -66.0786, 'San Juan, PR'),
+}
+EARTH_RADIUS_KM = 6371.0088
+RADAR_FALLBACK_RADIUS_KM = 500    # Nearest station is still offered (flagged out of range) up to this far
+RADAR_ALTERNATE_COUNT = 3         # Ranked backup stations returned with every lookup
+
+class RadarStationIndex:
+    """Spatial index over radar sites answering nearest-k and within-radius queries"""
+    # With ~160 sites one matrix-vector product over precomputed unit-sphere vectors
+    # beats building a k-d tree: a query is a few microseconds of numpy work
+
+    def __init__(self, stations):
+        self.station_ids = list(stations)
+        self.stations = {
+            station_id: {'lat': site_lat, 'lon': site_lon, 'name': name}
+            for station_id, (site_lat, site_lon, name) in stations.items()
+        }
+        self._unit_vectors = self._to_unit_vectors(
+            np.array([stations[station_id][0] for station_id in self.station_ids]),
+            np.array([stations[station_id][1] for station_id in self.station_ids])
+        )
+
+    @staticmethod
+    def _to_unit_vectors(lat, lon):
+        """Convert degrees to xyz points on the unit sphere"""
+        lat_rad, lon_rad = np.radians(lat), np.radians(lon)
+        return np.stack([np.cos(lat_rad) * np.cos(lon_rad), np.cos(lat_rad) * np.sin(lon_rad), np.sin(lat_rad)], axis=-1)
+
+    def distances_km(self, lat, lon):
+        """Great-circle distance from a point to every site, in station_ids order"""
+        cos_angle = self._unit_vectors @ self._to_unit_vectors(lat, lon)
+        return np.arccos(np.clip(cos_angle, -1.0, 1.0)) * EARTH_RADIUS_KM
+
+    def nearest(self, lat, lon, k=1):
+        """The k closest sites as [(station_id, distance_km)], nearest first"""
+        distances = self.distances_km(lat, lon)
+        k = min(k, len(distances))
+        closest = np.argpartition(distances, k - 1)[:k]
+        closest = closest[np.argsort(distances[closest])]
+        return [(self.station_ids[i], float(distances[i])) for i in closest]
+
+    def within(self, lat, lon, radius_km):
+        """Every site within radius_km as [(station_id, distance_km)], nearest first"""
+        distances = self.distances_km(lat, lon)
+        inside = np.flatnonzero(distances <= radius_km)
+        inside = inside[np.argsort(distances[inside])]
+        return [(self.station_ids[i], float(distances[i])) for i in inside]
+
+@st.cache_resource
+def get_radar_station_index():
+    """Process-wide radar site index, built once"""
+    return RadarStationIndex(NEXRAD_STATIONS)
+
 def get_radar_stations_near_location(lat, lon, radius_km=300):
     """Get nearby NOAA radar stations with expanded coverage for storm chasing"""
-    # Comprehensive NOAA NEXRAD stations for Great Plains storm chasing
-    radar_stations = {
-        'KOAX': {'lat': 41.3203, 'lon': -96.3667, 'name': 'Omaha, NE'},
-        'KGLD': {'lat': 39.3667, 'lon': -101.7000, 'name': 'Goodland, KS'},
-        'KEAX': {'lat': 38.8103, 'lon': -94.2644, 'name': 'Kansas City, MO'},
-        'KICT': {'lat': 37.6544, 'lon': -97.4431, 'name': 'Wichita, KS'},
-        'KTLX': {'lat': 35.3331, 'lon': -97.2778, 'name': 'Norman, OK'},
-        'KSGF': {'lat': 37.2350, 'lon': -93.4006, 'name': 'Springfield, MO'},
-        'KFWS': {'lat': 32.5731, 'lon': -97.3031, 'name': 'Dallas/Fort Worth, TX'},
-        'KAMA': {'lat': 35.2333, 'lon': -101.7089, 'name': 'Amarillo, TX'},
-        'KUEX': {'lat': 40.3208, 'lon': -98.4419, 'name': 'Hastings, NE'},
-        'KLNX': {'lat': 41.9578, 'lon': -100.5756, 'name': 'North Platte, NE'},
-        'KDDC': {'lat': 37.7608, 'lon': -99.9686, 'name': 'Dodge City, KS'},
-        'KTWX': {'lat': 38.9969, 'lon': -96.2325, 'name': 'Topeka, KS'},
-        'KCYS': {'lat': 41.1519, 'lon': -104.8059, 'name': 'Cheyenne, WY'},
-        'KFTG': {'lat': 39.7866, 'lon': -104.5458, 'name': 'Denver, CO'}
-    }
-    
-    # Find closest station within radius (proper distance calculation)
-    from geopy.distance import geodesic
-    
-    min_distance_km = float('inf')
-    closest_station = None
-    
-    for station_id, station_info in radar_stations.items():
-        distance_km = geodesic((lat, lon), (station_info['lat'], station_info['lon'])).kilometers
-        if distance_km <= radius_km and distance_km < min_distance_km:
-            min_distance_km = distance_km
-            closest_station = station_id
+    index = get_radar_station_index()
+    ranked = index.nearest(lat, lon, k=RADAR_ALTERNATE_COUNT + 1)
+    station_id, distance_km = ranked[0]
+    if distance_km > RADAR_FALLBACK_RADIUS_KM:
+        return None, None
     
-    if closest_station:
-        return closest_station, radar_stations[closest_station]
-    else:
+    station_data = dict(index.stations[station_id], distance_km=distance_km)
+    if distance_km > radius_km:
         # No station within radius - return nearest with distance warning
-        nearest_station = None
-        nearest_distance = float('inf')
-        for station_id, station_info in radar_stations.items():
-            distance_km = geodesic((lat, lon), (station_info['lat'], station_info['lon'])).kilometers
-            if distance_km < nearest_distance:
-                nearest_distance = distance_km
-                nearest_station = station_id
-        
-        if nearest_station and nearest_distance <= 500:  # Within 500km fallback
-            station_data = radar_stations[nearest_station].copy()
-            station_data['distance_km'] = nearest_distance
-            station_data['out_of_range'] = True
-            return nearest_station, station_data
-        
-        return None, None
+        station_data['out_of_range'] = True
+    # Ranked backups so the radar panel can switch stations without another lookup
+    station_data['alternates'] = [
+        dict(index.stations[alternate_id], id=alternate_id, distance_km=alternate_km)
+        for alternate_id, alternate_km in ranked[1:] if alternate_km <= RADAR_FALLBACK_RADIUS_KM
+    ]
+    return station_id, station_data
+
+# Radar loop cache: remembers the working RIDGE2 URL per station/product and revalidates it
+RADAR_CACHE_MAX_ENTRIES = 64           # Station/product pairs kept across all sessions
+RADAR_CACHE_RETENTION_SECONDS = 3600   # Loops not revalidated for this long are dropped
+RADAR_REVALIDATE_SECONDS = 60          # Serve a cached loop without any request for this long
+
+@st.cache_resource
+def get_radar_cache():
+    """Process-wide radar loop cache keyed by (station, product), shared by all sessions"""
+    return SharedTTLCache(RADAR_CACHE_MAX_ENTRIES, RADAR_CACHE_RETENTION_SECONDS)
+
+def _radar_cache_entry(url, response):
+    """Radar cache entry for a good response, keeping its validators for conditional GETs"""
+    return {
+        'url': url,
+        'content': response.content,
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'checked_at': time.time()
+    }
 
 def fetch_radar_image(station_id, product='N0Q'):
     """Fetch real-time radar image from NOAA radar.weather.gov (RIDGE2 2025)"""
     try:
+        radar_cache = get_radar_cache()
+        cache_key = (station_id.upper(), product.upper())
+        cached = radar_cache.get(cache_key)
+        if cached and time.time() - cached['checked_at'] < RADAR_REVALIDATE_SECONDS:
+            return cached['content']
+        
         # RIDGE2 correct URLs for 2025 (validated patterns)
         urls_to_try = [
             f"https://radar.weather.gov/ridge/standard/{product.upper()}/{station_id.upper()}_loop.gif",
@@ -429,23 +1153,38 @@ def fetch_radar_image(station_id, product='N0Q'):
         
         # Custom headers for better compatibility
         headers = {
-            'User-Agent': 'StormChase-Dashboard/2.0 (Educational/Research)',
-            'Accept': 'image/gif,image/*,*/*',
-            'Cache-Control': 'no-cache'
+            'Accept': 'image/gif,image/*,*/*'
         }
         
-        for url in urls_to_try:
+        # Revalidate the variant that worked last time; an unchanged loop comes back as an empty 304
+        if cached:
+            conditional_headers = dict(headers)
+            if cached['etag']:
+                conditional_headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                conditional_headers['If-Modified-Since'] = cached['last_modified']
             try:
-                response = requests.get(url, timeout=20, headers=headers)
+                response = http_get(cached['url'], timeout=20, headers=conditional_headers)
+                if response.status_code == 304:
+                    radar_cache.put(cache_key, {**cached, 'checked_at': time.time()})
+                    return cached['content']
                 if response.status_code == 200 and len(response.content) > 1000:  # Valid image check
+                    radar_cache.put(cache_key, _radar_cache_entry(cached['url'], response))
                     return response.content
             except requests.RequestException:
-                continue
+                pass
+            if cached['url'] in urls_to_try:
+                urls_to_try.remove(cached['url'])
+        
+        url, response = probe_urls(urls_to_try, 1000, timeout=20, headers=headers)  # Valid image check
+        if response is not None:
+            radar_cache.put(cache_key, _radar_cache_entry(url, response))
+            return response.content
                 
         # If all fail, try the NWS API endpoint for station status
         try:
             status_url = f"https://api.weather.gov/stations/{station_id}"
-            status_response = requests.get(status_url, timeout=10, headers=headers)
+            status_response = http_get(status_url, timeout=10, headers=headers)
             if status_response.status_code != 200:
                 st.info(f"📡 Radar station {station_id} may be offline for maintenance")
         except:
@@ -467,7 +1206,6 @@ def get_goes_mesoscale_sectors():
         
         # Try to get active mesoscale sectors info first
         headers = {
-            'User-Agent': 'StormChase-Dashboard/2.0 (Educational/Research)',
             'Accept': 'text/html,image/jpeg,image/*,*/*'
         }
         
@@ -480,15 +1218,6 @@ def get_goes_mesoscale_sectors():
             "https://cdn.star.nesdis.noaa.gov/GOES18/ABI/MESO/M2/GEOCOLOR/latest.jpg"
         ]
         
-        for url in mesoscale_sector_urls:
-            try:
-                response = requests.get(url, timeout=15, headers=headers)
-                if response.status_code == 200 and len(response.content) > 5000:
-                    # Only true M1/M2 mesoscale sectors get this type
-                    return {'data': response.content, 'url': url, 'type': 'mesoscale'}
-            except requests.RequestException:
-                continue
-        
         # Fallback to regional sectors (fixed areas, 5-minute updates)
         regional_urls = [
             # Storm chasing corridor coverage
@@ -498,13 +1227,12 @@ def get_goes_mesoscale_sectors():
             "https://cdn.star.nesdis.noaa.gov/GOES16/ABI/SECTOR/pnw/GEOCOLOR/latest.jpg"  # Pacific Northwest
         ]
         
-        for url in regional_urls:
-            try:
-                response = requests.get(url, timeout=15, headers=headers)
-                if response.status_code == 200 and len(response.content) > 5000:
-                    return {'data': response.content, 'url': url, 'type': 'regional'}
-            except requests.RequestException:
-                continue
+        # Mesoscale sectors stay preferred over regional ones; all candidates are probed together
+        url, response = probe_urls(mesoscale_sector_urls + regional_urls, 5000, timeout=15, headers=headers)
+        if response is not None:
+            # Only true M1/M2 mesoscale sectors get this type
+            sector_type = 'mesoscale' if url in mesoscale_sector_urls else 'regional'
+            return {'data': response.content, 'url': url, 'type': sector_type}
                 
     except Exception as e:
         st.warning(f"Mesoscale sector connection issue: {str(e)[:100]}...")
@@ -545,17 +1273,16 @@ def get_hrrr_data(lat, lon, forecast_hour=0):
         # For now, use NOAA's REST API for surface conditions
         points_url = f"https://api.weather.gov/points/{lat:.4f},{lon:.4f}"
         headers = {
-            'User-Agent': 'Diabeteorologist Storm Chase Dashboard (contact@example.com)',
             'Accept': 'application/geo+json'
         }
         
-        response = requests.get(points_url, headers=headers, timeout=10)
+        response = http_get(points_url, headers=headers, timeout=10)
         if response.status_code == 200:
             point_data = response.json()
             
             # Get forecast data
             forecast_url = point_data['properties']['forecast']
-            forecast_response = requests.get(forecast_url, headers=headers, timeout=10)
+            forecast_response = http_get(forecast_url, headers=headers, timeout=10)
             
             if forecast_response.status_code == 200:
                 forecast_data = forecast_response.json()
@@ -584,96 +1311,727 @@ def get_hrrr_data(lat, lon, forecast_hour=0):
     return None
 
 # GPS Breadcrumb Functions
+EARTH_RADIUS_MILES = 3958.7613
+TRACK_MOVING_SPEED_MPH = 3.0   # Slower segments count as stopped (GPS jitter while parked)
+TRACK_MAX_SPEED_MPH = 150.0    # Faster segments are GPS jumps or manual moves, left out of speed stats
+
+def haversine_miles(lat1, lon1, lat2, lon2):
+    """Great-circle distance in miles; works elementwise on numpy arrays"""
+    lat1, lon1, lat2, lon2 = (np.radians(value) for value in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2)**2
+    return 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(a))
+
+def initial_bearing_degrees(lat1, lon1, lat2, lon2):
+    """Compass heading from the first point toward the second (0-360, 0 = north)"""
+    lat1, lon1, lat2, lon2 = (np.radians(value) for value in (lat1, lon1, lat2, lon2))
+    x = np.sin(lon2 - lon1) * np.cos(lat2)
+    y = np.cos(lat1) * np.sin(lat2) - np.sin(lat1) * np.cos(lat2) * np.cos(lon2 - lon1)
+    return (np.degrees(np.arctan2(x, y)) + 360) % 360
+
+def new_track_stats():
+    """Empty running statistics for a chase track"""
+    return {
+        'points': 0,
+        'distance_miles': 0.0,
+        'speed_mph': 0.0,
+        'max_speed_mph': 0.0,
+        'heading_deg': None,
+        'moving_seconds': 0.0,
+        'stopped_seconds': 0.0,
+        'last_lat': None,
+        'last_lon': None,
+        'last_time': None
+    }
+
+def update_track_stats(stats, lats, lons, times):
+    """Fold new points (oldest first, epoch seconds) into the running track statistics"""
+    # Only the new segments are measured, so cost depends on the points added, not the track length
+    lats, lons, times = (np.asarray(values, dtype=float) for values in (lats, lons, times))
+    new_points = len(lats)
+    if stats['points']:
+        lats = np.concatenate(([stats['last_lat']], lats))
+        lons = np.concatenate(([stats['last_lon']], lons))
+        times = np.concatenate(([stats['last_time']], times))
+    
+    if len(lats) >= 2:
+        miles = haversine_miles(lats[:-1], lons[:-1], lats[1:], lons[1:])
+        seconds = np.diff(times)
+        speeds = np.divide(miles * 3600, seconds, out=np.zeros_like(miles), where=seconds > 0)
+        timed = (seconds > 0) & (speeds <= TRACK_MAX_SPEED_MPH)
+        moving = timed & (speeds >= TRACK_MOVING_SPEED_MPH)
+        
+        stats['distance_miles'] += float(miles.sum())
+        stats['moving_seconds'] += float(seconds[moving].sum())
+        stats['stopped_seconds'] += float(seconds[timed & ~moving].sum())
+        if timed.any():
+            stats['speed_mph'] = float(speeds[timed][-1])
+            stats['max_speed_mph'] = max(stats['max_speed_mph'], float(speeds[timed].max()))
+        if moving.any():
+            # Heading only changes while moving; parked jitter would make it spin
+            i = np.flatnonzero(moving)[-1]
+            stats['heading_deg'] = float(initial_bearing_degrees(lats[i], lons[i], lats[i + 1], lons[i + 1]))
+    
+    stats['points'] += new_points
+    stats['last_lat'], stats['last_lon'], stats['last_time'] = float(lats[-1]), float(lons[-1]), float(times[-1])
+    return stats
+
+TRACK_INITIAL_CAPACITY = 256    # Points preallocated per track; capacity doubles when full
+TRACK_SIMPLIFY_PIXELS = 2.0      # Track vertices that shift the drawn line less than this are dropped
+WEB_MERCATOR_METERS_PER_PIXEL = 156543.03392  # At the equator, zoom 0
+
+class BreadcrumbTrack:
+    """Columnar chase track: float32 lat/lon and int64 epoch seconds with amortized O(1) appends"""
+
+    def __init__(self, capacity=TRACK_INITIAL_CAPACITY):
+        self._lat = np.empty(capacity, dtype=np.float32)
+        self._lon = np.empty(capacity, dtype=np.float32)
+        self._time = np.empty(capacity, dtype=np.int64)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def append(self, lat, lon, epoch_seconds):
+        """Add one point, growing the columns geometrically when full"""
+        if self._size == len(self._lat):
+            capacity = 2 * len(self._lat)
+            self._lat = np.resize(self._lat, capacity)
+            self._lon = np.resize(self._lon, capacity)
+            self._time = np.resize(self._time, capacity)
+        self._lat[self._size] = lat
+        self._lon[self._size] = lon
+        self._time[self._size] = epoch_seconds
+        self._size += 1
+
+    @property
+    def lats(self):
+        return self._lat[:self._size]
+
+    @property
+    def lons(self):
+        return self._lon[:self._size]
+
+    @property
+    def times(self):
+        return self._time[:self._size]
+
+    def latest(self):
+        """Most recent point as (lat, lon, epoch_seconds)"""
+        i = self._size - 1
+        return float(self._lat[i]), float(self._lon[i]), int(self._time[i])
+
+def douglas_peucker(x, y, tolerance):
+    """Indices of the vertices kept by Douglas-Peucker simplification of the polyline (x, y)"""
+    keep = np.zeros(len(x), dtype=bool)
+    if len(x) == 0:
+        return np.flatnonzero(keep)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(x) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        # Perpendicular distance of every interior vertex to the start-end chord, in one pass
+        dx, dy = x[end] - x[start], y[end] - y[start]
+        px, py = x[start + 1:end] - x[start], y[start + 1:end] - y[start]
+        chord = np.hypot(dx, dy)
+        distances = np.abs(dx * py - dy * px) / chord if chord > 0 else np.hypot(px, py)
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            split = start + 1 + farthest
+            keep[split] = True
+            stack.extend(((start, split), (split, end)))
+    return np.flatnonzero(keep)
+
+def simplified_track_indices(track, zoom):
+    """Track vertices worth drawing at a map zoom level (tolerance is a few screen pixels)"""
+    lats, lons = track.lats.astype(float), track.lons.astype(float)
+    mean_lat = np.radians(lats.mean())
+    # Local equirectangular projection in meters is accurate enough at chase-track scale
+    x = np.radians(lons) * np.cos(mean_lat) * EARTH_RADIUS_KM * 1000
+    y = np.radians(lats) * EARTH_RADIUS_KM * 1000
+    meters_per_pixel = WEB_MERCATOR_METERS_PER_PIXEL * np.cos(mean_lat) / 2**zoom
+    return douglas_peucker(x, y, TRACK_SIMPLIFY_PIXELS * meters_per_pixel)
+
+if 'breadcrumbs' not in st.session_state:
+    st.session_state.breadcrumbs = BreadcrumbTrack()
+
 def add_breadcrumb(lat, lon):
     """Add a GPS breadcrumb to the chase track"""
     timestamp = datetime.now()
-    breadcrumb = {
-        'lat': lat,
-        'lon': lon, 
-        'timestamp': timestamp,
-        'time_str': timestamp.strftime('%H:%M:%S')
-    }
-    st.session_state.breadcrumbs.append(breadcrumb)
+    st.session_state.breadcrumbs.append(lat, lon, int(timestamp.timestamp()))
+    if st.session_state.track_stats is None:
+        st.session_state.track_stats = new_track_stats()
+    update_track_stats(st.session_state.track_stats, [lat], [lon], [timestamp.timestamp()])
 
 def get_chase_distance():
     """Calculate total chase distance from breadcrumbs"""
-    if len(st.session_state.breadcrumbs) < 2:
-        return 0
-    
-    total_distance = 0
-    for i in range(1, len(st.session_state.breadcrumbs)):
-        point1 = (st.session_state.breadcrumbs[i-1]['lat'], st.session_state.breadcrumbs[i-1]['lon'])
-        point2 = (st.session_state.breadcrumbs[i]['lat'], st.session_state.breadcrumbs[i]['lon'])
-        total_distance += geodesic(point1, point2).miles
-    
-    return total_distance
+    stats = st.session_state.track_stats
+    return stats['distance_miles'] if stats else 0
 
 def clear_breadcrumbs():
     """Clear all breadcrumbs and reset tracking"""
-    st.session_state.breadcrumbs = []
+    st.session_state.breadcrumbs = BreadcrumbTrack()
+    st.session_state.track_stats = None
     st.session_state.tracking_active = False
     st.session_state.chase_start_time = None
 
 # Storm Reports and Alerts Functions
-def get_nws_alerts(lat, lon, radius_miles=100):
-    """Get NWS alerts for the area"""
+# Regional alert snapshot: one conditional poll covers every state around the chase locations
+ALERT_REGION_RADIUS_MILES = 250       # Target search radius plus a margin for warnings just beyond it
+ALERT_REGION_IDLE_SECONDS = 30 * 60   # States no query has touched for this long leave the region
+
+# Approximate state bounding boxes (south, north, west, east) used to pick the alert region
+STATE_BOUNDS = {
+    'AL': (30.14, 35.01, -88.47, -84.89), 'AR': (33.00, 36.50, -94.62, -89.64), 'AZ': (31.33, 37.00, -114.82, -109.04),
+    'CA': (32.53, 42.01, -124.41, -114.13), 'CO': (36.99, 41.00, -109.06, -102.04), 'CT': (40.98, 42.05, -73.73, -71.79),
+    'DC': (38.79, 38.99, -77.12, -76.91), 'DE': (38.45, 39.84, -75.79, -75.05), 'FL': (24.52, 31.00, -87.63, -80.03),
+    'GA': (30.36, 35.00, -85.61, -80.84), 'IA': (40.38, 43.50, -96.64, -90.14), 'ID': (41.99, 49.00, -117.24, -111.04),
+    'IL': (36.97, 42.51, -91.51, -87.02), 'IN': (37.77, 41.76, -88.10, -84.78), 'KS': (36.99, 40.00, -102.05, -94.59),
+    'KY': (36.50, 39.15, -89.57, -81.96), 'LA': (28.93, 33.02, -94.04, -88.82), 'MA': (41.24, 42.89, -73.51, -69.93),
+    'MD': (37.91, 39.72, -79.49, -75.05), 'ME': (43.06, 47.46, -71.08, -66.95), 'MI': (41.70, 48.31, -90.42, -82.41),
+    'MN': (43.50, 49.38, -97.24, -89.49), 'MO': (35.99, 40.61, -95.77, -89.10), 'MS': (30.17, 35.00, -91.66, -88.10),
+    'MT': (44.36, 49.00, -116.05, -104.04), 'NC': (33.84, 36.59, -84.32, -75.46), 'ND': (45.94, 49.00, -104.05, -96.55),
+    'NE': (40.00, 43.00, -104.05, -95.31), 'NH': (42.70, 45.31, -72.56, -70.61), 'NJ': (38.93, 41.36, -75.56, -73.89),
+    'NM': (31.33, 37.00, -109.05, -103.00), 'NV': (35.00, 42.00, -120.01, -114.04), 'NY': (40.50, 45.02, -79.76, -71.86),
+    'OH': (38.40, 41.98, -84.82, -80.52), 'OK': (33.62, 37.00, -103.00, -94.43), 'OR': (41.99, 46.29, -124.57, -116.46),
+    'PA': (39.72, 42.27, -80.52, -74.69), 'RI': (41.15, 42.02, -71.86, -71.12), 'SC': (32.03, 35.22, -83.35, -78.54),
+    'SD': (42.48, 45.95, -104.06, -96.44), 'TN': (34.98, 36.68, -90.31, -81.65), 'TX': (25.84, 36.50, -106.65, -93.51),
+    'UT': (37.00, 42.00, -114.05, -109.04), 'VA': (36.54, 39.47, -83.68, -75.24), 'VT': (42.73, 45.02, -73.44, -71.46),
+    'WA': (45.54, 49.00, -124.85, -116.92), 'WI': (42.49, 47.31, -92.89, -86.25), 'WV': (37.20, 40.64, -82.64, -77.72),
+    'WY': (40.99, 45.01, -111.06, -104.05)
+}
+
+def states_near(lat, lon, radius_miles=ALERT_REGION_RADIUS_MILES):
+    """State codes whose bounding box comes within roughly radius_miles of a point"""
+    lat_span = radius_miles / 69.0  # roughly 69 miles per degree latitude
+    lon_span = radius_miles / (69.0 * max(np.cos(np.radians(min(abs(lat) + lat_span, 89.0))), 0.01))
+    return {
+        state for state, (south, north, west, east) in STATE_BOUNDS.items()
+        if south - lat_span <= lat <= north + lat_span and west - lon_span <= lon <= east + lon_span
+    }
+
+def alert_id(feature):
+    """CAP identifier (urn:oid:...) of an NWS alert feature, the form other alerts' references use"""
+    return feature.get('properties', {}).get('id') or feature.get('id')
+
+def alert_expired(feature, now=None):
+    """True once an alert's expires time has passed"""
+    expires = feature.get('properties', {}).get('expires')
+    if not expires:
+        return False
     try:
-        # Convert miles to approximate lat/lon bounds
-        lat_range = radius_miles / 69.0  # roughly 69 miles per degree latitude
-        lon_range = radius_miles / (69.0 * np.cos(np.radians(lat)))
-        
-        response = requests.get(
-            f"{NWS_ALERTS_BASE}/active",
-            params={
-                'point': f"{lat},{lon}",
-                'radius': radius_miles
-            },
-            timeout=10
+        return datetime.fromisoformat(expires).timestamp() <= (now or time.time())
+    except ValueError:
+        return False
+
+class RegionalAlertSnapshot:
+    """Active NWS alerts for the states around every chase location, keyed by CAP id and kept current with conditional polls"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._alerts = {}        # CAP id -> GeoJSON feature
+        self._states = {}        # state code -> last time a query needed it
+        self._polled_states = frozenset()
+        self._etag = None
+        self._last_modified = None
+        self.checked_at = 0
+        self.version = 0         # Bumped whenever an alert is added, updated or removed
+        self._geometry_index = None
+        self._zone_attempts = {} # zone URL -> last time its outline was requested
+        self._restore()
+
+    def cover(self, lat, lon):
+        """Make sure the region includes the states around a point; new states are fetched on the next poll"""
+        now = time.time()
+        with self._lock:
+            for state in states_near(lat, lon):
+                self._states[state] = now
+
+    def alerts(self, refresh=False):
+        """Active alert features for the region, polled again once older than the NWS alert TTL"""
+        return self._snapshot(refresh)[0]
+
+    def geometry_index(self, refresh=False, load_zones=False):
+        """Polygon index over the active alerts, rebuilt after the alert set changed or missing zones arrived"""
+        # Zone outlines load in the background unless load_zones asks for them inline (scheduler thread only)
+        features, version = self._snapshot(refresh)
+        index = self._geometry_index
+        if index is None or index.version != version or (index.zone_load is not None and index.zone_load.done()):
+            index = AlertGeometryIndex(features, version)
+            if index.missing_zones and load_zones:
+                load_zone_shapes(sorted(self._zones_to_load(index.missing_zones)))
+                index = AlertGeometryIndex(features, version)
+            zone_urls = self._zones_to_load(index.missing_zones)
+            if zone_urls:
+                index.zone_load = get_zone_load_executor().submit(load_zone_shapes, sorted(zone_urls))
+            self._geometry_index = index
+        return index
+
+    def _zones_to_load(self, zone_urls):
+        """Zones not attempted recently, marked as attempted; unavailable zones are retried after a while"""
+        now = time.time()
+        with self._lock:
+            due = {zone_url for zone_url in zone_urls if now - self._zone_attempts.get(zone_url, 0) >= ALERT_ZONE_RETRY_SECONDS}
+            self._zone_attempts.update((zone_url, now) for zone_url in due)
+        return due
+
+    def _snapshot(self, refresh):
+        """(features, version) taken together under the lock"""
+        with self._lock:
+            now = time.time()
+            for state in [state for state, last_used in self._states.items() if now - last_used > ALERT_REGION_IDLE_SECONDS]:
+                del self._states[state]
+            region_changed = frozenset(self._states) != self._polled_states
+            if self._states and (refresh or region_changed or now - self.checked_at >= RESPONSE_CACHE_TTL_SECONDS['nws_alerts']):
+                self._poll(frozenset(self._states), region_changed)
+            return list(self._alerts.values()), self.version
+
+    def _restore(self):
+        """Seed from the persistent cache so a restart still has the last known alerts"""
+        stored = get_response_cache().get("nws_alerts:region")
+        if stored and isinstance(stored['payload'], list):
+            self._apply(stored['payload'])
+
+    def _poll(self, states, region_changed):
+        """Fetch the region's active list unless unchanged since the last poll, then apply the delta"""
+        headers = {}
+        if not region_changed:
+            if self._etag:
+                headers['If-None-Match'] = self._etag
+            if self._last_modified:
+                headers['If-Modified-Since'] = self._last_modified
+        try:
+            response = http_get(
+                f"{NWS_ALERTS_BASE}/active", params={'area': ",".join(sorted(states))}, headers=headers, timeout=10
+            )
+            if response.status_code == 304:
+                self.checked_at = time.time()
+                self._apply(list(self._alerts.values()))  # Still drops alerts that expired meanwhile
+                return
+            if response.status_code != 200:
+                return
+            features = response.json().get('features', [])
+        except (requests.RequestException, ValueError) as e:
+            st.warning(f"Could not fetch weather alerts: {str(e)}")
+            return
+
+        self._etag = response.headers.get('ETag')
+        self._last_modified = response.headers.get('Last-Modified')
+        self._polled_states = states
+        self.checked_at = time.time()
+        if self._apply(features):
+            get_response_cache().put("nws_alerts:region", list(self._alerts.values()), RESPONSE_CACHE_RETENTION_SECONDS)
+
+    def _apply(self, features):
+        """Add new alerts, replace updated ones and drop expired or withdrawn ones; True if anything changed"""
+        now = time.time()
+        current = {alert_id(feature): feature for feature in features if alert_id(feature) and not alert_expired(feature, now)}
+        changed = False
+        for cap_id in [cap_id for cap_id in self._alerts if cap_id not in current]:
+            del self._alerts[cap_id]
+            changed = True
+        for cap_id, feature in current.items():
+            previous = self._alerts.get(cap_id)
+            # CAP revisions change 'sent'; extensions only move 'expires'
+            if previous is None or any(
+                previous.get('properties', {}).get(field) != feature.get('properties', {}).get(field)
+                for field in ('sent', 'expires', 'messageType')
+            ):
+                self._alerts[cap_id] = feature
+                changed = True
+        if changed:
+            self.version += 1
+        return changed
+
+@st.cache_resource
+def get_alert_snapshot():
+    """Process-wide regional alert snapshot shared by all sessions"""
+    return RegionalAlertSnapshot()
+
+def get_alert_geometry_index(lat, lon, refresh=False):
+    """Polygon index over the regional alerts, covering the states around a point"""
+    snapshot = get_alert_snapshot()
+    snapshot.cover(lat, lon)
+    return snapshot.geometry_index(refresh=refresh)
+
+def nearby_alerts(lat, lon, radius_miles=100, events=None, severities=None, refresh=False, include_unlocated=False):
+    """[(feature, distance_miles)] for active alerts covering or within radius_miles of a point, nearest first"""
+    # include_unlocated appends (feature, None) for alerts without a polygon whose states are in range
+    index = get_alert_geometry_index(lat, lon, refresh=refresh)
+    matches = index.near(lat, lon, radius_miles, events)
+    if include_unlocated:
+        matches += [(feature, None) for feature in index.unlocated_near(lat, lon, radius_miles, events)]
+    if severities:
+        matches = [match for match in matches if match[0]['properties'].get('severity') in severities]
+    return matches
+
+def get_nws_alerts(lat, lon, radius_miles=100, refresh=False):
+    """Get NWS alerts for the area"""
+    return [feature for feature, _ in nearby_alerts(lat, lon, radius_miles, refresh=refresh, include_unlocated=True)]
+
+# Alert polygons: any alert's own polygon is indexed; for these events, zone-based alerts fall back to zone outlines
+ALERT_POLYGON_EVENTS = {'Tornado Warning', 'Severe Thunderstorm Warning', 'Tornado Watch', 'Severe Thunderstorm Watch'}
+ALERT_PROXIMITY_MILES = 10     # Distance from a warning polygon that counts as "near"
+ALERT_ZONE_FETCH_WORKERS = 6
+ALERT_ZONE_CACHE_ENTRIES = 4096
+ALERT_ZONE_RETRY_SECONDS = 10 * 60  # Zones that failed to load are requested again after this long
+
+def get_zone_geometry(zone_url):
+    """GeoJSON outline of an NWS forecast or county zone (None if unavailable)"""
+    def fetch():
+        try:
+            response = http_get(zone_url, timeout=10)
+            if response.status_code == 200:
+                return response.json().get('geometry')
+        except (requests.RequestException, ValueError):
+            pass
+        return None
+    return cached_response('nws_zones', (zone_url.rsplit('/', 1)[-1],), fetch)
+
+@st.cache_resource
+def get_zone_shapes():
+    """Process-wide parsed zone outlines, so index rebuilds skip the persistent cache and GeoJSON parsing"""
+    return SharedTTLCache(ALERT_ZONE_CACHE_ENTRIES, RESPONSE_CACHE_TTL_SECONDS['nws_zones'])
+
+@st.cache_resource
+def get_zone_load_executor():
+    """Single background worker that loads zone outlines for the alert index"""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="alert-zones")
+
+def _load_zone_shape(zone_url):
+    """Zone outline as a shapely geometry (None if unavailable)"""
+    zone = get_zone_geometry(zone_url)
+    return shape(zone) if zone else None
+
+def load_zone_shapes(zone_urls):
+    """Fetch zone outlines into the shared zone cache; runs off the page since each zone is a request"""
+    zone_shapes = get_zone_shapes()
+    with ThreadPoolExecutor(max_workers=max(1, min(ALERT_ZONE_FETCH_WORKERS, len(zone_urls)))) as executor:
+        for zone_url, zone in zip(zone_urls, executor.map(_load_zone_shape, zone_urls)):
+            if zone is not None:
+                zone_shapes.put(zone_url, zone)
+
+def alert_geometry(feature, missing_zones=None):
+    """Shapely geometry of an alert: its own polygon, else the union of its affected zones already loaded"""
+    if feature.get('geometry'):
+        return shape(feature['geometry'])
+    zone_urls = feature.get('properties', {}).get('affectedZones') or []
+    zone_shapes = get_zone_shapes()
+    zones = []
+    for zone_url in zone_urls:
+        zone = zone_shapes.get(zone_url)
+        if zone is not None:
+            zones.append(zone)
+        elif missing_zones is not None:
+            missing_zones.add(zone_url)
+    if missing_zones and any(zone_url in missing_zones for zone_url in zone_urls):
+        return None  # A partial outline would understate the alert; it stays unlocated until every zone is in
+    return shapely.union_all(zones) if zones else None
+
+def alert_states(feature):
+    """State codes an alert covers, from its UGC zone codes or failing that its area description"""
+    properties = feature.get('properties', {})
+    codes = properties.get('geocode', {}).get('UGC') or []
+    if codes:
+        return {code[:2] for code in codes}
+    return {part.strip()[-2:] for part in properties.get('areaDesc', '').split(';') if ',' in part}
+
+class AlertGeometryIndex:
+    """STRtree over prepared alert polygons answering containment and within-distance queries locally"""
+
+    def __init__(self, features, version=0, events=ALERT_POLYGON_EVENTS):
+        self.version = version
+        self.features = []
+        self.unlocated = []          # Alerts with no polygon and no resolved zone outline, answered by state instead
+        self.missing_zones = set()   # Zone outlines not cached yet; the index is rebuilt once they load
+        self.zone_load = None        # Future loading missing_zones, set by the owner of the index
+        self._geometries = []
+        for feature in features:
+            # Any alert with its own polygon is indexed; only the events listed get zone outlines fetched
+            if not feature.get('geometry') and feature.get('properties', {}).get('event') not in events:
+                self.unlocated.append(feature)
+                continue
+            try:
+                geometry = alert_geometry(feature, self.missing_zones)
+            except Exception:
+                geometry = None
+            if geometry is None or geometry.is_empty:
+                self.unlocated.append(feature)
+                continue
+            shapely.prepare(geometry)
+            self.features.append(feature)
+            self._geometries.append(geometry)
+        self._tree = STRtree(self._geometries) if self._geometries else None
+
+    def unlocated_near(self, lat, lon, radius_miles=0, events=None):
+        """Alerts without a usable polygon whose states come within radius_miles of a point"""
+        states = states_near(lat, lon, radius_miles)
+        return [
+            feature for feature in self.unlocated
+            if (not events or feature['properties'].get('event') in events) and alert_states(feature) & states
+        ]
+
+    def near(self, lat, lon, radius_miles=0, events=None):
+        """[(feature, distance_miles)] for polygons containing the point or within radius_miles, nearest first"""
+        if self._tree is None:
+            return []
+        lat_span = radius_miles / 69.0  # roughly 69 miles per degree latitude
+        lon_span = radius_miles / (69.0 * max(np.cos(np.radians(min(abs(lat) + lat_span, 89.0))), 0.01))
+        point = Point(lon, lat)
+        search_area = shapely.box(lon - lon_span, lat - lat_span, lon + lon_span, lat + lat_span) if radius_miles > 0 else point
+        matches = []
+        for i in self._tree.query(search_area):
+            feature = self.features[i]
+            if events and feature['properties'].get('event') not in events:
+                continue
+            geometry = self._geometries[i]
+            if geometry.contains(point):
+                distance = 0.0
+            else:
+                closest = nearest_points(geometry, point)[0]
+                distance = float(haversine_miles(lat, lon, closest.y, closest.x))
+                if distance > radius_miles:
+                    continue
+            matches.append((feature, distance))
+        return sorted(matches, key=lambda match: match[1])
+
+# SPC storm report ingestion
+SPC_REPORT_FILES = {'tornado': 'torn', 'hail': 'hail', 'wind': 'wind'}
+SPC_REPORT_RANGE_OVERLAP = 64  # Bytes re-read ahead of the appended tail to confirm SPC only added rows
+SPC_REPORT_FINAL_SECONDS = 2 * 60 * 60  # After a report day's 12Z close, late rows stop arriving within this
+
+def parse_spc_reports(raw, report_type, date):
+    """Parse SPC report CSV bytes (header optional) into a typed table with one row per report"""
+    # Comments may hold unquoted commas, so everything after the longitude column is rejoined
+    rows = [row for row in csv.reader(io.StringIO(raw.decode('latin-1'))) if len(row) >= 7 and row[0].strip().isdigit()]
+    hhmm = np.array([int(row[0]) for row in rows], dtype=np.int64)
+    # An SPC report day runs 12Z to 12Z, so times before 1200 fall on the next calendar day
+    minutes = hhmm // 100 * 60 + hhmm % 100 + np.where(hhmm < 1200, 24 * 60, 0)
+    magnitude = [row[1].strip() for row in rows]
+    magnitude_value = pd.to_numeric(pd.Series(magnitude, dtype=object).str.replace(r'^E?F', '', regex=True), errors='coerce')
+    if report_type == 'hail':
+        magnitude_value = magnitude_value / 100.0  # Hail size is listed in hundredths of an inch
+    return pd.DataFrame({
+        'valid': pd.Timestamp(datetime.strptime(date, '%y%m%d'), tz='UTC') + pd.to_timedelta(minutes, unit='m'),
+        'time': [row[0].strip() for row in rows],
+        'magnitude': magnitude,
+        'magnitude_value': magnitude_value.astype('float32'),
+        'location': [row[2].strip() for row in rows],
+        'county': [row[3].strip() for row in rows],
+        'state': [row[4].strip() for row in rows],
+        'lat': pd.to_numeric(pd.Series([row[5] for row in rows], dtype=object), errors='coerce').astype('float32'),
+        'lon': pd.to_numeric(pd.Series([row[6] for row in rows], dtype=object), errors='coerce').astype('float32'),
+        'comments': [','.join(row[7:]).strip() for row in rows]
+    })
+
+def empty_storm_reports():
+    """Report tables with no rows, for when SPC has nothing for the day or cannot be reached"""
+    return {report_type: parse_spc_reports(b'', report_type, '700101') for report_type in SPC_REPORT_FILES}
+
+class StormReportStore:
+    """Per-date SPC report tables that grow with byte-range requests as SPC appends reports"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}  # (date, report_type) -> {'lock', 'raw', 'frame', 'checked_at'}
+        self._version = 0   # Bumped whenever any table changes
+        self._index = None  # (dates, version, StormReportIndex)
+
+    def reports(self, date, refresh=False):
+        """Report tables for a date keyed by type; each is re-checked once older than the SPC report TTL until final"""
+        return {report_type: self._table(date, report_type, refresh) for report_type in SPC_REPORT_FILES}
+
+    def window_index(self, dates, refresh=False):
+        """Spatial-temporal index over every report on the given SPC days, rebuilt only after a table changed"""
+        # Read the version first so a concurrent update can only cause an extra rebuild, never a stale index
+        version = self._version
+        cached = self._index
+        tables = [
+            (report_type, frame)
+            for date in dates
+            for report_type, frame in self.reports(date, refresh=refresh).items()
+        ]
+        if cached is not None and cached[0] == tuple(dates) and cached[1] == self._version == version:
+            return cached[2]
+        index = StormReportIndex(tables, version=version)
+        self._index = (tuple(dates), version, index)
+        return index
+
+    def _table(self, date, report_type, refresh):
+        with self._lock:
+            entry = self._entries.setdefault(
+                (date, report_type), {'lock': threading.Lock(), 'raw': None, 'frame': None, 'checked_at': 0}
+            )
+        with entry['lock']:
+            if entry['raw'] is None:
+                self._restore(date, report_type, entry)
+            stale = refresh or time.time() - entry['checked_at'] >= RESPONSE_CACHE_TTL_SECONDS['spc_reports']
+            if stale and not self._is_final(date, entry):
+                self._sync(date, report_type, entry)
+            if entry['frame'] is None:
+                return parse_spc_reports(b'', report_type, date)
+            return entry['frame']
+
+    @staticmethod
+    def _is_final(date, entry):
+        """A past day synced after its 12Z close plus the late-report margin never changes again"""
+        closed_at = datetime.strptime(date, '%y%m%d').replace(tzinfo=dt.timezone.utc) + timedelta(days=1, hours=12)
+        return entry['checked_at'] >= closed_at.timestamp() + SPC_REPORT_FINAL_SECONDS
+
+    def _restore(self, date, report_type, entry):
+        """Seed an entry from the persistent cache so a restart only fetches what SPC appended since"""
+        stored = get_response_cache().get(f"spc_reports:{date}:{report_type}")
+        if stored and isinstance(stored['payload'], dict) and 'raw' in stored['payload']:
+            entry['raw'] = stored['payload']['raw'].encode('latin-1')
+            entry['frame'] = parse_spc_reports(entry['raw'], report_type, date)
+            entry['checked_at'] = stored['fetched_at']
+            with self._lock:
+                self._version += 1
+        else:
+            entry['raw'] = b''
+
+    def _sync(self, date, report_type, entry):
+        """Parse only the rows appended since the last check, or the whole file if SPC rewrote it"""
+        url = f"{SPC_REPORTS_BASE}{date}_rpts_{SPC_REPORT_FILES[report_type]}.csv"
+        raw = entry['raw']
+        appended = content = None
+        try:
+            if raw:
+                # Re-read a few known bytes before the tail; a mismatch means the file changed rather than grew
+                overlap = min(len(raw), SPC_REPORT_RANGE_OVERLAP)
+                response = http_get(
+                    url, timeout=10, headers={'Range': f"bytes={len(raw) - overlap}-", 'Accept-Encoding': 'identity'}
+                )
+                if response.status_code == 206 and response.content[:overlap] == raw[-overlap:]:
+                    appended = response.content[overlap:]
+                elif response.status_code == 200:
+                    content = response.content
+                    if content.startswith(raw):
+                        appended, content = content[len(raw):], None
+            if appended is None and content is None:
+                response = http_get(url, timeout=10)
+                if response.status_code == 404:
+                    entry['checked_at'] = time.time()  # Not published yet for this date
+                    return
+                if response.status_code != 200:
+                    return
+                content = response.content
+        except requests.RequestException:
+            return
+
+        entry['checked_at'] = time.time()
+        if content is not None:
+            entry['raw'] = content
+            entry['frame'] = parse_spc_reports(content, report_type, date)
+        elif appended:
+            entry['raw'] = raw + appended
+            entry['frame'] = pd.concat(
+                [entry['frame'], parse_spc_reports(appended, report_type, date)], ignore_index=True
+            )
+        else:
+            return
+        with self._lock:
+            self._version += 1
+        get_response_cache().put(
+            f"spc_reports:{date}:{report_type}", {'raw': entry['raw'].decode('latin-1')},
+            RESPONSE_CACHE_RETENTION_SECONDS
         )
-        
-        if response.status_code == 200:
-            alerts_data = response.json()
-            return alerts_data.get('features', [])
-    except Exception as e:
-        st.warning(f"Could not fetch weather alerts: {str(e)}")
-    return []
 
-def get_spc_storm_reports(date=None):
-    """Get SPC storm reports for the day"""
+@st.cache_resource
+def get_storm_report_store():
+    """Process-wide SPC storm report store"""
+    return StormReportStore()
+
+def spc_report_dates(days=1):
+    """SPC report days as YYMMDD, current day first; a report day runs 12Z to 12Z"""
+    current = datetime.now(dt.timezone.utc) - timedelta(hours=12)
+    return [(current - timedelta(days=offset)).strftime('%y%m%d') for offset in range(days)]
+
+def get_spc_storm_reports(date=None, refresh=False):
+    """Get SPC storm reports for the day as typed tables keyed by report type"""
     if not date:
-        date = datetime.now().strftime('%y%m%d')
+        date = spc_report_dates()[0]
     
     try:
-        # SPC storm reports URLs
-        tornado_url = f"{SPC_REPORTS_BASE}{date}_rpts_torn.csv"
-        hail_url = f"{SPC_REPORTS_BASE}{date}_rpts_hail.csv"  
-        wind_url = f"{SPC_REPORTS_BASE}{date}_rpts_wind.csv"
-        
-        reports = {'tornado': [], 'hail': [], 'wind': []}
-        
-        for report_type, url in [('tornado', tornado_url), ('hail', hail_url), ('wind', wind_url)]:
-            try:
-                response = requests.get(url, timeout=10)
-                if response.status_code == 200:
-                    # Parse CSV data (simplified)
-                    lines = response.text.strip().split('\n')[1:]  # Skip header
-                    for line in lines[:10]:  # Limit to recent reports
-                        parts = line.split(',')
-                        if len(parts) >= 6:
-                            reports[report_type].append({
-                                'time': parts[0],
-                                'lat': float(parts[1]) if parts[1] else 0,
-                                'lon': float(parts[2]) if parts[2] else 0,
-                                'magnitude': parts[3],
-                                'location': parts[5]
-                            })
-            except Exception:
-                continue
-                
-        return reports
+        return get_storm_report_store().reports(date, refresh=refresh)
     except Exception as e:
         st.warning(f"Could not fetch storm reports: {str(e)}")
-    return {'tornado': [], 'hail': [], 'wind': []}
+    return empty_storm_reports()
+
+# Storm report spatial-temporal index
+STORM_REPORT_WINDOW_DAYS = 3          # SPC report days indexed: the current day and the two before it
+STORM_REPORT_CELL_DEGREES = 1.0       # Grid cell size of the report index
+STORM_REPORT_LOOKBACK_HOURS = {'Last hour': 1, 'Last 3 hours': 3, 'Last 24 hours': 24, 'Last 3 days': 72}
+STORM_REPORT_MAP_RADIUS_MILES = 250   # Reports plotted on the chase map
+STORM_REPORT_MAP_HOURS = 24
+STORM_REPORT_COLORS = {'tornado': 'red', 'hail': 'green', 'wind': 'blue'}  # SPC report map colors
+
+class StormReportIndex:
+    """Storm reports bucketed on a lat/lon grid and time-ordered within each cell"""
+    # A radius query touches only the cells overlapping its bounding box, and a time window
+    # is a binary search inside each cell, so outbreak days with thousands of reports stay fast
+
+    def __init__(self, tables, version=0, cell_degrees=STORM_REPORT_CELL_DEGREES):
+        self.version = version
+        self._cell_degrees = cell_degrees
+        frames = [frame.assign(type=report_type) for report_type, frame in tables if len(frame)]
+        if frames:
+            table = pd.concat(frames, ignore_index=True).dropna(subset=['lat', 'lon'])
+        else:
+            table = parse_spc_reports(b'', 'wind', '700101').assign(type=pd.Series(dtype=object))
+        lats = table['lat'].to_numpy(np.float64)
+        lons = table['lon'].to_numpy(np.float64)
+        times = table['valid'].dt.tz_localize(None).to_numpy(dtype='datetime64[s]').astype(np.int64)
+        rows = np.floor(lats / cell_degrees).astype(np.int64)
+        cols = np.floor(lons / cell_degrees).astype(np.int64)
+
+        order = np.lexsort((times, cols, rows))
+        self.table = table.iloc[order].reset_index(drop=True)
+        self._lats, self._lons, self._times = lats[order], lons[order], times[order]
+        rows, cols = rows[order], cols[order]
+        boundaries = np.flatnonzero((np.diff(rows) != 0) | (np.diff(cols) != 0)) + 1
+        starts = np.r_[0, boundaries] if len(order) else boundaries
+        ends = np.r_[starts[1:], len(order)]
+        self._cells = {(int(rows[s]), int(cols[s])): (int(s), int(e)) for s, e in zip(starts, ends)}
+
+    def __len__(self):
+        return len(self.table)
+
+    def query(self, lat, lon, radius_miles, since=None):
+        """Reports within radius_miles of a point, optionally at or after a Unix time, with distance_miles, newest first"""
+        candidates = self._candidates(lat, lon, radius_miles, since)
+        distances = haversine_miles(lat, lon, self._lats[candidates], self._lons[candidates])
+        inside = distances <= radius_miles
+        nearby = self.table.iloc[candidates[inside]].assign(distance_miles=distances[inside])
+        return nearby.sort_values('valid', ascending=False)
+
+    def _candidates(self, lat, lon, radius_miles, since):
+        """Row positions in the grid cells overlapping the query's bounding box and time window"""
+        lat_span = radius_miles / 69.0  # roughly 69 miles per degree latitude
+        lon_span = radius_miles / (69.0 * max(np.cos(np.radians(min(abs(lat) + lat_span, 89.0))), 0.01))
+        row_range = range(int(np.floor((lat - lat_span) / self._cell_degrees)), int(np.floor((lat + lat_span) / self._cell_degrees)) + 1)
+        col_range = range(int(np.floor((lon - lon_span) / self._cell_degrees)), int(np.floor((lon + lon_span) / self._cell_degrees)) + 1)
+        chunks = []
+        for row in row_range:
+            for col in col_range:
+                span = self._cells.get((row, col))
+                if span is None:
+                    continue
+                start, end = span
+                if since is not None:
+                    start += int(np.searchsorted(self._times[start:end], since))
+                if start < end:
+                    chunks.append(np.arange(start, end))
+        return np.concatenate(chunks) if chunks else np.empty(0, dtype=np.int64)
+
+def get_storm_report_index(days=STORM_REPORT_WINDOW_DAYS, refresh=False):
+    """Index over the last `days` SPC report days, shared by all sessions"""
+    try:
+        return get_storm_report_store().window_index(spc_report_dates(days), refresh=refresh)
+    except Exception as e:
+        st.warning(f"Could not index storm reports: {str(e)}")
+    return StormReportIndex([])
 
 # Enhanced Composite Weather Indices Functions - Professional Storm Chasing Grade
 def calculate_composite_indices(weather_data, surface_data=None):
@@ -813,32 +2171,121 @@ def calculate_composite_indices(weather_data, surface_data=None):
             'Mean_Wind_0_6km': 0, 'CHP': 0, 'SHIP': 0, 'VGP': 0, 'SREH': 0
         }
 
+def calculate_composite_index_arrays(params):
+    """Vectorized calculate_composite_indices over struct-of-arrays parameters (e.g. calculate_derived_parameter_arrays output)"""
+    p = {name: np.asarray(value, dtype=float) for name, value in params.items() if name != 'source'}
+    cape = p['CAPE']
+    cin = p['CIN']
+    shear_0_6 = p['Shear_0_6km']
+    srh_0_1 = p['SRH_0_1km']
+    lcl = p['LCL_Height']
+    dewpoint = p['Dewpoint']
+    indices = {}
+
+    mixed_layer_cape = cape * 0.9
+    indices['Mixed_Layer_CAPE'] = np.maximum(0, mixed_layer_cape)
+
+    cin_factor = np.maximum(0, (50 - np.abs(cin)) / 50)
+    lcl_factor_scp = np.maximum(0, np.minimum(1, (2000 - lcl) / 1000))
+    dewpoint_factor = np.maximum(0.5, np.minimum(1.2, dewpoint / 60))
+
+    scp = (mixed_layer_cape / 1000) * (shear_0_6 / 20) * (srh_0_1 / 100) * lcl_factor_scp * cin_factor * dewpoint_factor
+    indices['SCP'] = np.maximum(0, np.minimum(scp, 20))
+
+    lcl_factor_stp = np.maximum(0, (2000 - lcl) / 1000)
+    stp = (mixed_layer_cape / 1500) * lcl_factor_stp * (srh_0_1 / 150) * (shear_0_6 / 20) * cin_factor
+    indices['STP'] = np.maximum(0, np.minimum(stp, 8))
+
+    srh_enhanced = srh_0_1 * (1 + dewpoint_factor * 0.2)
+    indices['SRH_0_1km_Enhanced'] = np.maximum(0, srh_enhanced)
+
+    bulk_shear_squared = (shear_0_6 * 0.514444) ** 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        brn = mixed_layer_cape / (0.5 * bulk_shear_squared)
+    indices['BRN'] = np.where(bulk_shear_squared > 0, np.maximum(0, np.minimum(brn, 100)), 100)
+
+    ehi = (mixed_layer_cape * srh_enhanced) / 160000
+    indices['EHI'] = np.maximum(0, np.minimum(ehi, 8))
+
+    real_lapse = p.get('Lapse_Rate_700_500', np.zeros_like(cape))
+    estimated_lapse = 6.5 + (np.minimum(1.5, cape / 3000) * 2.5)
+    indices['Lapse_Rate_700_500'] = np.maximum(4.0, np.minimum(np.where(real_lapse > 0, real_lapse, estimated_lapse), 12.0))
+
+    real_shear_0_3 = p.get('Shear_0_3km', np.zeros_like(cape))
+    shear_0_3 = np.where(real_shear_0_3 > 0, real_shear_0_3, shear_0_6 * 0.65)
+    indices['Shear_0_3km'] = np.maximum(0, shear_0_3)
+
+    zeros = np.zeros_like(cape)
+    u_sfc, v_sfc = p.get('Wind_U_Sfc', zeros), p.get('Wind_V_Sfc', zeros)
+    u_500, v_500 = p.get('Wind_U_500', zeros), p.get('Wind_V_500', zeros)
+    u_700, v_700 = p.get('Wind_U_700', zeros), p.get('Wind_V_700', zeros)
+    u_925, v_925 = p.get('Wind_U_925', zeros), p.get('Wind_V_925', zeros)
+
+    mean_wind_u = (u_sfc + u_925 + u_700 + u_500) / 4.0
+    mean_wind_v = (v_sfc + v_925 + v_700 + v_500) / 4.0
+    shear_u = u_500 - u_sfc
+    shear_v = v_500 - v_sfc
+    shear_mag = np.where((shear_u != 0) | (shear_v != 0), np.sqrt(shear_u**2 + shear_v**2), 1.0)
+    bunkers_u = mean_wind_u + (-shear_v / shear_mag * 7.5)
+    bunkers_v = mean_wind_v + (shear_u / shear_mag * 7.5)
+    indices['Bunkers_Right_U'] = np.round(bunkers_u, 2)
+    indices['Bunkers_Right_V'] = np.round(bunkers_v, 2)
+    indices['Storm_Motion_Speed'] = np.round(np.sqrt(bunkers_u**2 + bunkers_v**2), 1)
+
+    indices['Mean_Wind_0_6km'] = p['Mean_Wind_0_6km'] if 'Mean_Wind_0_6km' in p else shear_0_6 * 0.5
+
+    chp = (mixed_layer_cape / 1000) * (srh_enhanced / 150)
+    indices['CHP'] = np.maximum(0, np.minimum(chp, 10))
+
+    ship = (mixed_layer_cape / 1000) * (shear_0_6 / 20) * (dewpoint_factor)
+    indices['SHIP'] = np.maximum(0, np.minimum(ship, 12))
+
+    vgp = (srh_enhanced / 200) * (shear_0_3 / 25) * cin_factor
+    indices['VGP'] = np.maximum(0, np.minimum(vgp, 5))
+
+    sreh = np.where(indices['BRN'] < 50, srh_enhanced * (1 + (indices['BRN'] - 20) / 50), srh_enhanced)
+    indices['SREH'] = np.maximum(0, sreh)
+
+    shape = np.broadcast_shapes(*(value.shape for value in indices.values()))
+    return {name: np.broadcast_to(value, shape) for name, value in indices.items()}
+
 # Voice Alert Functions
 def check_tornado_warnings(lat, lon, radius_miles=50):
     """Check for new tornado warnings in the chase area"""
     try:
-        alerts = get_nws_alerts(lat, lon, radius_miles)
+        alerts = nearby_alerts(lat, lon, radius_miles, events={'Tornado Warning'}, include_unlocated=True)
         tornado_warnings = []
         
-        for alert in alerts:
+        for alert, distance in alerts:
             properties = alert.get('properties', {})
-            event = properties.get('event', '').lower()
-            
-            if 'tornado warning' in event:
-                tornado_warnings.append({
-                    'headline': properties.get('headline', ''),
-                    'description': properties.get('description', ''),
-                    'area': properties.get('areaDesc', ''),
-                    'severity': properties.get('severity', ''),
-                    'onset': properties.get('onset', ''),
-                    'expires': properties.get('expires', '')
-                })
+            tornado_warnings.append({
+                'id': alert_id(alert),
+                'references': [reference.get('identifier') for reference in properties.get('references', [])],
+                'headline': properties.get('headline', ''),
+                'description': properties.get('description', ''),
+                'area': properties.get('areaDesc', ''),
+                'severity': properties.get('severity', ''),
+                'onset': properties.get('onset', ''),
+                'expires': properties.get('expires', ''),
+                'distance_miles': distance
+            })
         
         return tornado_warnings
     except Exception as e:
         st.warning(f"Could not check tornado warnings: {str(e)}")
         return []
 
+def unannounced_tornado_warnings(tornado_warnings, announced):
+    """Warnings to voice, marking every warning seen as announced; updates to an announced warning stay quiet"""
+    new_warnings = []
+    for warning in tornado_warnings:
+        if warning['id'] in announced:
+            continue
+        if not announced.intersection(warning['references']):
+            new_warnings.append(warning)
+        announced.add(warning['id'])
+    return new_warnings
+
 # Initialize OpenAI client
 def get_openai_client():
     """Initialize OpenAI client with API key"""
@@ -851,6 +2298,35 @@ def get_openai_client():
         st.error(f"OpenAI initialization error: {str(e)}")
         return None
 
+# Shared AI response cache: prompts are built from quantized inputs, so sessions
+# looking at the same environment send identical requests and share one completion
+AI_CACHE_MAX_ENTRIES = 256
+AI_CACHE_TTL_SECONDS = 30 * 60
+
+def quantize_value(value, step):
+    """Round a prompt input to the nearest step so nearby environments map to the same prompt"""
+    try:
+        return round(float(value) / step) * step
+    except (TypeError, ValueError):
+        return 0
+
+@st.cache_resource
+def get_ai_response_cache():
+    """Process-wide OpenAI completion cache keyed by the canonical request"""
+    return SharedTTLCache(AI_CACHE_MAX_ENTRIES, AI_CACHE_TTL_SECONDS)
+
+def chat_request_key(request):
+    """Cache key of a chat completion request: a digest of its canonical JSON"""
+    return hashlib.sha256(json.dumps(request, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+def cached_chat_completion(client, **request):
+    """Message content of a chat completion, shared by every session sending the same request"""
+    # Concurrent identical requests wait for a single completion; empty or failed ones are not cached
+    key = chat_request_key(request)
+    return get_ai_response_cache().get_or_load(
+        key, lambda: client.chat.completions.create(**request).choices[0].message.content or None
+    )
+
 def calculate_storm_chasability(weather_data, lat, lon):
     """Calculate enhanced AI-powered storm chasability score (0-100) using advanced meteorological parameters"""
     try:
@@ -1040,38 +2516,122 @@ def calculate_storm_chasability(weather_data, lat, lon):
         st.warning(f"Error calculating chasability score: {str(e)}")
         return 50  # Default moderate score
 
-def generate_intelligent_targets(base_lat, base_lon, current_weather_data, radius_miles=150):
+# Table-driven chasability rubric for calculate_chasability_arrays (mirrors calculate_storm_chasability)
+# Each rule is (low, high, points) with inclusive bounds; the first matching rule per parameter wins
+CHASABILITY_BASE_RULES = [
+    ('Mixed_Layer_CAPE', [(4000, math.inf, 20), (3000, math.inf, 18), (2500, math.inf, 15),
+                          (2000, math.inf, 12), (1500, math.inf, 8), (1000, math.inf, 4)]),
+    ('Shear_0_6km', [(60, math.inf, 15), (50, math.inf, 13), (40, math.inf, 11), (30, math.inf, 8), (20, math.inf, 5)]),
+    ('Shear_0_3km', [(35, math.inf, 10), (25, math.inf, 8), (20, math.inf, 6), (15, math.inf, 4)]),
+    ('Dewpoint', [(70, math.inf, 10), (65, math.inf, 8), (60, math.inf, 6), (55, math.inf, 4), (50, math.inf, 2)]),
+    ('CIN', [(-math.inf, 15, 5), (-math.inf, 30, 4), (-math.inf, 50, 3), (-math.inf, 75, 1)]),
+    ('SCP', [(8, math.inf, 10), (6, math.inf, 8), (4, math.inf, 6), (2, math.inf, 4), (1, math.inf, 2)]),
+    ('STP', [(4, math.inf, 10), (3, math.inf, 8), (2, math.inf, 6), (1, math.inf, 4), (0.5, math.inf, 2)]),
+    ('BRN', [(15, 40, 5), (10, 50, 3), (-math.inf, 10, 1)])
+]
+CHASABILITY_BONUS_RULES = [
+    ('SRH_0_1km_Enhanced', [(400, math.inf, 5), (300, math.inf, 4), (200, math.inf, 3), (150, math.inf, 2), (100, math.inf, 1)]),
+    ('EHI', [(3, math.inf, 3), (2, math.inf, 2), (1, math.inf, 1)]),
+    ('Lapse_Rate_700_500', [(8.5, math.inf, 3), (7.5, math.inf, 2), (7.0, math.inf, 1)]),
+    ('Storm_Motion_Speed', [(20, 35, 2), (15, 45, 1)]),
+    ('SHIP', [(4, math.inf, 2), (2, math.inf, 1)])
+]
+CHASABILITY_MAX_BONUS = 15
+# Geographic bonus boxes: (lat_min, lat_max, lon_min, lon_max, points), first match wins
+CHASABILITY_GEO_BONUS = [
+    (40.0, 42.5, -104.0, -95.0, 3),  # Nebraska storm corridor
+    (36.0, 40.0, -102.0, -94.0, 2),  # Kansas storm alley
+    (33.0, 37.0, -103.0, -95.0, 2),  # Oklahoma/Texas panhandle
+    (37.0, 41.0, -99.0, -90.0, 1)    # Missouri/Iowa corridor
+]
+# Quality-control caps: when every parameter is below its limit the score is capped, first match wins
+CHASABILITY_QC_CAPS = [
+    ([('Mixed_Layer_CAPE', 1000), ('Shear_0_6km', 20)], 30),  # Very marginal environment
+    ([('SCP', 1), ('STP', 0.5)], 50)                           # Poor composite environment
+]
+
+def _score_rule_table(values, rules):
+    """Score an array against an ordered (low, high, points) table, first match wins"""
+    conditions = [(values >= low) & (values <= high) for low, high, _ in rules]
+    return np.select(conditions, [points for _, _, points in rules], default=0)
+
+def calculate_chasability_arrays(params, composite_indices, lat, lon):
+    """Vectorized calculate_storm_chasability: 0-100 scores for whole arrays of locations/hours"""
+    # Composite values take precedence, as in the scalar rubric (Shear_0_3km, Lapse_Rate_700_500)
+    fields = {name: np.asarray(value, dtype=float) for name, value in params.items() if name != 'source'}
+    fields.update({name: np.asarray(value, dtype=float) for name, value in composite_indices.items()})
+    lat = np.asarray(lat, dtype=float)
+    lon = np.asarray(lon, dtype=float)
+
+    base_score = sum(_score_rule_table(fields[name], rules) for name, rules in CHASABILITY_BASE_RULES)
+    bonus_points = sum(_score_rule_table(fields[name], rules) for name, rules in CHASABILITY_BONUS_RULES)
+
+    geo_conditions = [
+        (lat >= lat_min) & (lat <= lat_max) & (lon >= lon_min) & (lon <= lon_max)
+        for lat_min, lat_max, lon_min, lon_max, _ in CHASABILITY_GEO_BONUS
+    ]
+    bonus_points = bonus_points + np.select(geo_conditions, [box[-1] for box in CHASABILITY_GEO_BONUS], default=0)
+
+    total_score = base_score + np.minimum(bonus_points, CHASABILITY_MAX_BONUS)
+
+    cap_conditions = [
+        np.logical_and.reduce([fields[name] < limit for name, limit in limits])
+        for limits, _ in CHASABILITY_QC_CAPS
+    ]
+    cap = np.select(cap_conditions, [cap for _, cap in CHASABILITY_QC_CAPS], default=100)
+    return np.minimum(np.minimum(total_score, cap), 100).astype(int)
+
+def get_target_grid_points(base_lat, base_lon, radius_miles=150):
+    """Analysis grid of (lat, lon, distance_miles) points around the base location"""
+    # Define search grid around base location (coarser grid for API efficiency)
+    grid_points = []
+    lat_step = 1.0  # ~69 miles
+    lon_step = 1.0  # ~55 miles at mid-latitudes
+    
+    # Create analysis grid within radius
+    for lat_offset in [-2, -1, 0, 1, 2]:
+        for lon_offset in [-2, -1, 0, 1, 2]:
+            grid_lat = base_lat + lat_offset * lat_step
+            grid_lon = base_lon + lon_offset * lon_step
+            
+            # Calculate distance from base
+            distance = ((grid_lat - base_lat) * 69)**2 + ((grid_lon - base_lon) * 54.6)**2
+            distance = distance**0.5
+            
+            if distance <= radius_miles:
+                grid_points.append((grid_lat, grid_lon, distance))
+    return grid_points
+
+def generate_intelligent_targets(base_lat, base_lon, current_weather_data, radius_miles=150, fetch_mode=GRID_FETCH_MODE):
     """Generate intelligent chase targets based on meteorological analysis"""
     targets = []
     
     try:
-        # Define search grid around base location (coarser grid for API efficiency)
-        grid_points = []
-        lat_step = 1.0  # ~69 miles
-        lon_step = 1.0  # ~55 miles at mid-latitudes
-        
-        # Create analysis grid within radius
-        for lat_offset in [-2, -1, 0, 1, 2]:
-            for lon_offset in [-2, -1, 0, 1, 2]:
-                grid_lat = base_lat + lat_offset * lat_step
-                grid_lon = base_lon + lon_offset * lon_step
-                
-                # Calculate distance from base
-                distance = ((grid_lat - base_lat) * 69)**2 + ((grid_lon - base_lon) * 54.6)**2
-                distance = distance**0.5
-                
-                if distance <= radius_miles:
-                    grid_points.append((grid_lat, grid_lon, distance))
+        grid_points = get_target_grid_points(base_lat, base_lon, radius_miles)
         
-        # Analyze each grid point using real API data
-        for grid_lat, grid_lon, distance in grid_points:
-            location_weather = get_real_weather_for_location(grid_lat, grid_lon)
-            if not location_weather:
-                continue
-            
+        # Analyze each grid point using real API data; results come back in grid order
+        # so scoring and ranking are identical for batched and concurrent fetching
+        grid_weather = get_real_weather_for_locations(
+            [(grid_lat, grid_lon) for grid_lat, grid_lon, _ in grid_points], fetch_mode=fetch_mode
+        )
+        analyzed_points = [(point, weather) for point, weather in zip(grid_points, grid_weather) if weather]
+        
+        # Score every grid point in one vectorized pass (identical to the scalar scoring functions)
+        if analyzed_points:
+            grid_params = {
+                name: np.array([weather[name] for _, weather in analyzed_points], dtype=float)
+                for name in DERIVED_FIELD_DECIMALS
+            }
+            grid_indices = calculate_composite_index_arrays(grid_params)
+            grid_scores = calculate_chasability_arrays(
+                grid_params, grid_indices,
+                [point[0] for point, _ in analyzed_points], [point[1] for point, _ in analyzed_points]
+            )
+        
+        for i, ((grid_lat, grid_lon, distance), location_weather) in enumerate(analyzed_points):
             # Calculate storm potential score
-            chase_score = calculate_storm_chasability(location_weather, grid_lat, grid_lon)
-            composite_indices = calculate_composite_indices(location_weather)
+            chase_score = int(grid_scores[i])
+            composite_indices = {name: float(values[i]) for name, values in grid_indices.items()}
             
             # Enhanced target evaluation with composite parameters
             scp = composite_indices.get('SCP', 0)
@@ -1162,24 +2722,40 @@ def generate_intelligent_targets(base_lat, base_lon, current_weather_data, radiu
 
 def get_real_weather_for_location(target_lat, target_lon):
     """Fetch real weather data from Open-Meteo for a specific target location with caching"""
-    if 'location_weather_cache' not in st.session_state:
-        st.session_state.location_weather_cache = {}
+    cell = quantize_coordinates(target_lat, target_lon)
+    derived = get_shared_weather_cache().get_or_load(cell, lambda: _load_location_weather(*cell))
+    return dict(derived) if derived else None
 
-    cache_key = f"{round(target_lat, 2)},{round(target_lon, 2)}"
-    cache = st.session_state.location_weather_cache
-    if cache_key in cache:
-        entry = cache[cache_key]
-        if time.time() - entry['time'] < 600:
-            return entry['data']
+def _load_grid_weather(cells, fetch_mode, refresh=False):
+    """Fetch and derive parameters for many cells at once (batch loader for the shared weather cache)"""
+    # Cells still fresh in the persistent cache skip the network entirely unless refreshing
+    response_cache = get_response_cache()
+    cache_keys = [f"open_meteo:{cell_lat:.4f},{cell_lon:.4f}" for cell_lat, cell_lon in cells]
+    stored = [response_cache.get(key) for key in cache_keys]
+    now = time.time()
+    payloads = [
+        entry['payload'] if entry and entry['expires_at'] > now and not refresh else None for entry in stored
+    ]
 
-    api_data = get_open_meteo_data(target_lat, target_lon)
-    if api_data:
-        derived = calculate_derived_parameters(api_data)
-        if derived:
-            cache[cache_key] = {'data': derived, 'time': time.time()}
-            return derived
+    stale = [i for i, payload in enumerate(payloads) if payload is None]
+    if stale:
+        fetch = get_open_meteo_concurrent if fetch_mode == "concurrent" else get_open_meteo_batch
+        for i, payload in zip(stale, fetch([cells[i] for i in stale])):
+            if payload is not None:
+                response_cache.put(cache_keys[i], payload, RESPONSE_CACHE_TTL_SECONDS['open_meteo'])
+                payloads[i] = payload
+            elif stored[i]:
+                payloads[i] = stored[i]['payload']  # Stale copy beats no data when the fetch fails
 
-    return None
+    # Derive every fetched location in one vectorized pass
+    fields, valid = payloads_to_parameter_arrays(payloads)
+    return derived_arrays_to_records(calculate_derived_parameter_arrays(fields), valid)
+
+def get_real_weather_for_locations(coordinates, fetch_mode=GRID_FETCH_MODE):
+    """Multi-point variant of get_real_weather_for_location sharing the same cache"""
+    cells = [quantize_coordinates(target_lat, target_lon) for target_lat, target_lon in coordinates]
+    results = get_shared_weather_cache().get_or_load_many(cells, lambda missing: _load_grid_weather(missing, fetch_mode))
+    return [dict(derived) if derived else None for derived in results]
 
 def generate_enhanced_target_reasoning(weather_data, composite_indices, storm_mode, target_type, score):
     """Generate comprehensive AI reasoning using advanced meteorological parameters"""
@@ -1269,92 +2845,127 @@ def generate_target_reasoning(weather_data, composite_indices, score):
     """Legacy function - kept for compatibility"""
     return generate_enhanced_target_reasoning(weather_data, composite_indices, "Organized storms", "Convective target", score)
 
+def quantized_target_reasoning(target):
+    """Target reasoning regenerated from quantized parameters so it does not split the AI cache key"""
+    weather_data = target.get('weather_data')
+    composite_indices = target.get('composite_indices')
+    if not weather_data or composite_indices is None:
+        return target.get('reasoning', '')
+    quantized_weather = {
+        'CAPE': quantize_value(weather_data.get('CAPE', 0), 100),
+        'Shear_0_6km': quantize_value(weather_data.get('Shear_0_6km', 0), 5),
+        'Dewpoint': quantize_value(weather_data.get('Dewpoint', 0), 2),
+        'CIN': quantize_value(weather_data.get('CIN', 0), 25),
+    }
+    quantized_indices = {
+        'Mixed_Layer_CAPE': quantize_value(composite_indices.get('Mixed_Layer_CAPE', 0), 100),
+        'Shear_0_3km': quantize_value(composite_indices.get('Shear_0_3km', 0), 5),
+        'SCP': quantize_value(composite_indices.get('SCP', 0), 0.5),
+        'STP': quantize_value(composite_indices.get('STP', 0), 0.5),
+        'EHI': quantize_value(composite_indices.get('EHI', 0), 0.5),
+        'BRN': quantize_value(composite_indices.get('BRN', 50), 5),
+        'Lapse_Rate_700_500': quantize_value(composite_indices.get('Lapse_Rate_700_500', 6.5), 0.5),
+        'Storm_Motion_Speed': quantize_value(composite_indices.get('Storm_Motion_Speed', 0), 5),
+    }
+    return generate_enhanced_target_reasoning(
+        quantized_weather, quantized_indices, target.get('storm_mode', 'Organized storms'),
+        target.get('target_type', 'Convective target'), quantize_value(target.get('score', 0), 5)
+    )
+
+def target_ai_analysis(targets, weather_data, timeout=None):
+    """AI narrative for the top chase targets, or None when AI is unavailable"""
+    # Enhanced AI analysis with advanced meteorological parameters
+    client = get_openai_client()
+    if not client:
+        return None
+    if timeout:
+        # Bound the request itself so a stalled completion frees its worker
+        client = client.with_options(timeout=timeout, max_retries=0)
+    
+    # Get composite indices for AI analysis
+    composite_indices = calculate_composite_indices(weather_data)
+    
+    # Prepare comprehensive analysis data for AI (quantized so nearby environments share a cached analysis)
+    analysis_data = {
+        'current_time': datetime.now().strftime('%I %p CT'),
+        'base_weather': weather_data,
+        'composite_indices': composite_indices,
+        'targets': [{
+            'lat': quantize_value(t['lat'], 0.1),
+            'lon': quantize_value(t['lon'], 0.1),
+            'score': quantize_value(t['score'], 5),
+            'distance': quantize_value(t['distance_miles'], 10),
+            'weather': t['weather_data'],
+            'reasoning': quantized_target_reasoning(t)
+        } for t in targets[:3]]  # Top 3 targets
+    }
+    
+    # Professional meteorological prompt with advanced parameters
+    scp = quantize_value(composite_indices.get('SCP', 0), 0.5)
+    stp = quantize_value(composite_indices.get('STP', 0), 0.5)
+    ehi = quantize_value(composite_indices.get('EHI', 0), 0.5)
+    brn = quantize_value(composite_indices.get('BRN', 50), 5)
+    ml_cape = quantize_value(composite_indices.get('Mixed_Layer_CAPE', 0), 100)
+    shear_0_3 = quantize_value(composite_indices.get('Shear_0_3km', 0), 5)
+    lapse_rate = quantize_value(composite_indices.get('Lapse_Rate_700_500', 6.5), 0.5)
+    storm_motion = quantize_value(composite_indices.get('Storm_Motion_Speed', 0), 5)
+    deep_shear = quantize_value(weather_data.get('Shear_0_6km', 0), 5)
+    dewpoint = quantize_value(weather_data.get('Dewpoint', 0), 2)
+    cin = quantize_value(weather_data.get('CIN', 0), 25)
+    
+    prompt = f"""
+    You are a professional storm chasing meteorologist analyzing chase targets using advanced meteorological parameters.
+    
+    CURRENT ATMOSPHERIC ENVIRONMENT:
+    Time: {analysis_data['current_time']}
+    Mixed Layer CAPE: {ml_cape:.0f} J/kg
+    Deep Shear (0-6km): {deep_shear:.0f} kts
+    Low-level Shear (0-3km): {shear_0_3:.0f} kts
+    Dewpoint: {dewpoint:.0f}°F
+    CIN: {cin:.0f} J/kg
+    
+    COMPOSITE PARAMETERS:
+    Supercell Composite (SCP): {scp:.1f} | Significant Tornado Parameter (STP): {stp:.1f}
+    Energy Helicity Index (EHI): {ehi:.1f} | Bulk Richardson Number (BRN): {brn:.0f}
+    700-500mb Lapse Rate: {lapse_rate:.1f} °C/km | Storm Motion: {storm_motion:.0f} kts
+    
+    TOP CHASE TARGETS:
+    {chr(10).join([f"Target {i+1} ({t['lat']:.1f}, {t['lon']:.1f}): Score {t['score']:.0f}, Distance {t['distance']:.0f}mi, {t['reasoning']}" for i, t in enumerate(analysis_data['targets'])])}
+    
+    ANALYSIS REQUEST:
+    Provide a professional 3-4 sentence analysis focusing on:
+    1. Primary target recommendation based on composite parameters (SCP/STP/EHI)
+    2. Storm mode expectations (supercells vs multicells based on BRN)
+    3. Tornado potential assessment using STP and low-level shear
+    4. Timing for storm initiation and chase strategy
+    5. Key safety considerations for the environment
+    
+    Use professional meteorological terminology. Keep under 200 words.
+    """
+    
+    ai_analysis = cached_chat_completion(
+        client,
+        model="gpt-3.5-turbo",
+        messages=[{"role": "user", "content": prompt}],
+        max_tokens=250,  # Increased for comprehensive analysis
+        temperature=0.2  # Lower temperature for more precise meteorological analysis
+    )
+    
+    return ai_analysis.strip() if ai_analysis else "AI analysis temporarily unavailable"
+
 def enhance_targets_with_ai(targets, weather_data):
     """Enhance intelligent targets with AI-powered analysis and recommendations"""
     try:
         if not targets:
             return targets
-            
-        # Enhanced AI analysis with advanced meteorological parameters
-        client = get_openai_client()
-        if not client:
-            return targets  # Return basic targets if AI unavailable
-        
-        # Get composite indices for AI analysis
-        composite_indices = calculate_composite_indices(weather_data)
-        
-        # Prepare comprehensive analysis data for AI
-        analysis_data = {
-            'current_time': datetime.now().strftime('%I:%M %p CT'),
-            'base_weather': weather_data,
-            'composite_indices': composite_indices,
-            'targets': [{
-                'lat': t['lat'], 
-                'lon': t['lon'],
-                'score': t['score'],
-                'distance': t['distance_miles'],
-                'weather': t['weather_data'],
-                'reasoning': t['reasoning']
-            } for t in targets[:3]]  # Top 3 targets
-        }
         
-        # Professional meteorological prompt with advanced parameters
-        scp = composite_indices.get('SCP', 0)
-        stp = composite_indices.get('STP', 0)
-        ehi = composite_indices.get('EHI', 0)
-        brn = composite_indices.get('BRN', 50)
-        ml_cape = composite_indices.get('Mixed_Layer_CAPE', 0)
-        shear_0_3 = composite_indices.get('Shear_0_3km', 0)
-        lapse_rate = composite_indices.get('Lapse_Rate_700_500', 6.5)
-        storm_motion = composite_indices.get('Storm_Motion_Speed', 0)
-        
-        prompt = f"""
-        You are a professional storm chasing meteorologist analyzing chase targets using advanced meteorological parameters.
-        
-        CURRENT ATMOSPHERIC ENVIRONMENT:
-        Time: {analysis_data['current_time']}
-        Mixed Layer CAPE: {ml_cape:.0f} J/kg
-        Deep Shear (0-6km): {weather_data.get('Shear_0_6km', 0):.0f} kts
-        Low-level Shear (0-3km): {shear_0_3:.0f} kts
-        Dewpoint: {weather_data.get('Dewpoint', 0):.0f}°F
-        CIN: {weather_data.get('CIN', 0):.0f} J/kg
-        
-        COMPOSITE PARAMETERS:
-        Supercell Composite (SCP): {scp:.1f} | Significant Tornado Parameter (STP): {stp:.1f}
-        Energy Helicity Index (EHI): {ehi:.1f} | Bulk Richardson Number (BRN): {brn:.0f}
-        700-500mb Lapse Rate: {lapse_rate:.1f} °C/km | Storm Motion: {storm_motion:.0f} kts
-        
-        TOP CHASE TARGETS:
-        {chr(10).join([f"Target {i+1}: Score {t['score']:.0f}, Distance {t['distance']:.0f}mi, {t['reasoning']}" for i, t in enumerate(analysis_data['targets'])])}
-        
-        ANALYSIS REQUEST:
-        Provide a professional 3-4 sentence analysis focusing on:
-        1. Primary target recommendation based on composite parameters (SCP/STP/EHI)
-        2. Storm mode expectations (supercells vs multicells based on BRN)
-        3. Tornado potential assessment using STP and low-level shear
-        4. Timing for storm initiation and chase strategy
-        5. Key safety considerations for the environment
-        
-        Use professional meteorological terminology. Keep under 200 words.
-        """
-        
-        response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=250,  # Increased for comprehensive analysis
-            temperature=0.2  # Lower temperature for more precise meteorological analysis
-        )
-        
-        ai_analysis = response.choices[0].message.content
-        if ai_analysis:
-            ai_analysis = ai_analysis.strip()
-        else:
-            ai_analysis = "AI analysis temporarily unavailable"
+        ai_analysis = target_ai_analysis(targets, weather_data)
+        if ai_analysis is None:
+            return targets  # Return basic targets if AI unavailable
         
         # Add AI analysis to the top target
-        if targets:
-            targets[0]['ai_analysis'] = ai_analysis
-            targets[0]['ai_enhanced'] = True
+        targets[0]['ai_analysis'] = ai_analysis
+        targets[0]['ai_enhanced'] = True
         
         return targets
         
@@ -1362,6 +2973,102 @@ def enhance_targets_with_ai(targets, weather_data):
         st.warning(f"AI enhancement temporarily unavailable: {str(e)[:50]}...")
         return targets
 
+# Background AI target enhancement: the map draws from deterministic scores while the narrative is generated
+AI_ENHANCEMENT_INTERVAL_SECONDS = 60 * 60   # Each session asks for a new narrative at most this often
+AI_ENHANCEMENT_TIMEOUT_SECONDS = 45         # A job still running after this is abandoned as timed out
+AI_ENHANCEMENT_RETRY_SECONDS = 5 * 60       # A job that ended without a narrative is retried after this
+AI_ENHANCEMENT_POLL_SECONDS = 3             # How often a running job is checked for completion
+AI_JOB_MAX_WORKERS = 4                      # Kept apart from panel fetches so slow completions never delay data
+
+@st.cache_resource
+def get_ai_job_executor():
+    """Process-wide worker pool for AI target enhancement jobs"""
+    return ThreadPoolExecutor(max_workers=AI_JOB_MAX_WORKERS, thread_name_prefix="ai-enhance")
+
+def start_ai_enhancement(targets, weather_data, targets_version):
+    """Submit an AI analysis of this session's targets, replacing any job still running"""
+    cancel_ai_enhancement()
+    # The worker gets its own copies; the narrative is attached to the session's targets on completion
+    future = get_ai_job_executor().submit(
+        target_ai_analysis, [dict(target) for target in targets[:3]], weather_data, AI_ENHANCEMENT_TIMEOUT_SECONDS
+    )
+    st.session_state.ai_enhancement_job = {
+        'future': future, 'started': time.time(), 'targets_version': targets_version,
+        'status': 'running', 'error': None,
+    }
+
+def retry_ai_enhancement(delay=AI_ENHANCEMENT_RETRY_SECONDS):
+    """Let the next job start `delay` seconds from now rather than a full interval after the one that failed"""
+    st.session_state.last_ai_enhancement = time.time() - AI_ENHANCEMENT_INTERVAL_SECONDS + delay
+
+def cancel_ai_enhancement(status='cancelled'):
+    """Stop waiting for the session's running AI job; a completion that still arrives is ignored"""
+    job = st.session_state.get('ai_enhancement_job')
+    if job and job['status'] == 'running':
+        job['future'].cancel()
+        job['status'] = status
+        retry_ai_enhancement()
+
+def poll_ai_enhancement(targets):
+    """Advance the session's AI job, attaching the narrative to the top target once it completes"""
+    job = st.session_state.get('ai_enhancement_job')
+    if not job or job['status'] != 'running':
+        return job
+    future = job['future']
+    if not future.done():
+        if time.time() - job['started'] > AI_ENHANCEMENT_TIMEOUT_SECONDS:
+            cancel_ai_enhancement('timed out')
+        return job
+    try:
+        ai_analysis = future.result()
+    except Exception as e:
+        job['status'], job['error'] = 'failed', str(e)[:50]
+        retry_ai_enhancement()
+        return job
+    if ai_analysis is None:
+        job['status'] = 'unavailable'
+        retry_ai_enhancement()
+    elif targets and job['targets_version'] == st.session_state.last_target_update:
+        targets[0]['ai_analysis'] = ai_analysis
+        targets[0]['ai_enhanced'] = True
+        st.session_state.ai_enhancement_job = None  # Applied; the narrative now lives on the target
+        return None
+    else:
+        job['status'] = 'stale'  # Targets were re-ranked while the job ran
+        retry_ai_enhancement(0)  # The next full run analyzes the new targets
+    return job
+
+def render_ai_enhancement_status(polling=False):
+    """Top target's AI narrative, or the state of the job producing it"""
+    targets = st.session_state.cached_targets
+    job = poll_ai_enhancement(targets)
+    if polling and (not job or job['status'] != 'running'):
+        # Settled: a full run draws the result without the poller, which also clears its timer
+        st.rerun()
+    if targets and targets[0].get('ai_enhanced'):
+        st.write(targets[0].get('ai_analysis', 'Analysis unavailable'))
+    if not job:
+        return
+    if job['status'] == 'running':
+        status_col, cancel_col = st.columns([3, 1])
+        with status_col:
+            st.caption(f"🧠 Getting AI recommendations... {time.time() - job['started']:.0f}s")
+        with cancel_col:
+            st.button("✖ Cancel", key="cancel_ai_enhancement", on_click=cancel_ai_enhancement)
+    elif job['status'] == 'failed':
+        st.caption(f"AI enhancement temporarily unavailable: {job['error']}...")
+    elif job['status'] == 'timed out':
+        st.caption(f"AI analysis timed out after {AI_ENHANCEMENT_TIMEOUT_SECONDS}s")
+    elif job['status'] == 'cancelled':
+        st.caption("AI analysis cancelled")
+    elif job['status'] == 'unavailable':
+        st.caption(f"AI analysis unavailable, retrying in {AI_ENHANCEMENT_RETRY_SECONDS // 60} min")
+    elif job['status'] == 'stale':
+        st.caption("Targets changed during AI analysis; analyzing the new targets...")
+
+# Polls only while a job runs; the map panel renders the settled result without it
+poll_ai_enhancement_status = st.fragment(render_ai_enhancement_status, run_every=AI_ENHANCEMENT_POLL_SECONDS)
+
 def analyze_storm_personality(weather_data):
     """AI-powered storm personality and characteristics analysis"""
     try:
@@ -1376,17 +3083,18 @@ def analyze_storm_personality(weather_data):
         # Prepare weather context for AI analysis
         weather_context = f"""
         Current Weather Parameters:
-        - CAPE: {weather_data['CAPE']} J/kg
-        - Wind Shear (0-6km): {weather_data['Shear_0_6km']} kts
-        - Dewpoint: {weather_data['Dewpoint']}°F
-        - CIN: {weather_data['CIN']} J/kg
-        - Storm Relative Helicity: {weather_data['SRH_0_1km']} m²/s²
-        - LCL Height: {weather_data['LCL_Height']} m
+        - CAPE: {quantize_value(weather_data['CAPE'], 250):.0f} J/kg
+        - Wind Shear (0-6km): {quantize_value(weather_data['Shear_0_6km'], 5):.0f} kts
+        - Dewpoint: {quantize_value(weather_data['Dewpoint'], 2):.0f}°F
+        - CIN: {quantize_value(weather_data['CIN'], 25):.0f} J/kg
+        - Storm Relative Helicity: {quantize_value(weather_data['SRH_0_1km'], 25):.0f} m²/s²
+        - LCL Height: {quantize_value(weather_data['LCL_Height'], 250):.0f} m
         """
         
         # the newest OpenAI model is "gpt-5" which was released August 7, 2025.
         # do not change this unless explicitly requested by the user
-        response = client.chat.completions.create(
+        content = cached_chat_completion(
+            client,
             model="gpt-5",
             messages=[
                 {
@@ -1402,7 +3110,6 @@ def analyze_storm_personality(weather_data):
             max_tokens=300
         )
         
-        content = response.choices[0].message.content
         if content:
             result = json.loads(content)
         else:
@@ -1428,12 +3135,16 @@ def optimize_chase_route(lat, lon, weather_data, storm_personality):
         if not client:
             return "Route optimization temporarily unavailable. Recommend staying south of storm and moving east with storm motion."
         
-        location_context = f"Current location: {lat:.4f}, {lon:.4f} (Valley, Nebraska area)"
-        weather_summary = f"Storm type: {storm_personality['type']}, CAPE: {weather_data['CAPE']}, Shear: {weather_data['Shear_0_6km']} kts"
+        location_context = f"Current location: {quantize_value(lat, 0.1):.1f}, {quantize_value(lon, 0.1):.1f} (Valley, Nebraska area)"
+        weather_summary = (
+            f"Storm type: {storm_personality['type']}, CAPE: {quantize_value(weather_data['CAPE'], 250):.0f}, "
+            f"Shear: {quantize_value(weather_data['Shear_0_6km'], 5):.0f} kts"
+        )
         
         # the newest OpenAI model is "gpt-5" which was released August 7, 2025.
         # do not change this unless explicitly requested by the user
-        response = client.chat.completions.create(
+        return cached_chat_completion(
+            client,
             model="gpt-5",
             messages=[
                 {
@@ -1448,21 +3159,17 @@ def optimize_chase_route(lat, lon, weather_data, storm_personality):
             max_tokens=200
         )
         
-        return response.choices[0].message.content
-        
     except Exception as e:
         st.warning(f"Route optimization error: {str(e)}")
         return "Manual routing recommended: Stay south of storm, move east with storm motion, maintain 2-3 mile safety distance."
 
-def get_voice_assistant_response(query, weather_data, lat, lon):
-    """AI Voice Assistant for storm chasing questions"""
-    try:
-        client = get_openai_client()
-        if not client:
-            return "Voice assistant temporarily unavailable. Please check weather parameters manually."
-        
-        # Prepare comprehensive context
-        context = f"""
+VOICE_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')  # Sentence boundary for progressive speech
+VOICE_SENTENCE_MIN_CHARS = 20  # Shorter fragments wait for the next sentence before being spoken
+
+def voice_assistant_request(query, weather_data, lat, lon):
+    """Chat completion arguments for a voice assistant question"""
+    # Prepare comprehensive context
+    context = f"""
         Current Weather Conditions (Valley, Nebraska area):
         - Location: {lat:.4f}, {lon:.4f}
         - CAPE: {weather_data['CAPE']} J/kg
@@ -1474,32 +3181,160 @@ def get_voice_assistant_response(query, weather_data, lat, lon):
         
         Storm Chasability Score: {calculate_storm_chasability(weather_data, lat, lon)}/100
         """
-        
-        # the newest OpenAI model is "gpt-5" which was released August 7, 2025.
-        # do not change this unless explicitly requested by the user
-        response = client.chat.completions.create(
-            model="gpt-5",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are an expert storm chasing meteorologist and safety advisor. Answer questions about current conditions, chase strategy, safety, and storm behavior. Be concise but informative. Always prioritize safety."
-                },
-                {
-                    "role": "user",
-                    "content": f"Weather Context: {context}\n\nQuestion: {query}"
-                }
-            ],
-            max_tokens=200
-        )
+    
+    # the newest OpenAI model is "gpt-5" which was released August 7, 2025.
+    # do not change this unless explicitly requested by the user
+    return dict(
+        model="gpt-5",
+        messages=[
+            {
+                "role": "system",
+                "content": "You are an expert storm chasing meteorologist and safety advisor. Answer questions about current conditions, chase strategy, safety, and storm behavior. Be concise but informative. Always prioritize safety."
+            },
+            {
+                "role": "user",
+                "content": f"Weather Context: {context}\n\nQuestion: {query}"
+            }
+        ],
+        max_tokens=200
+    )
+
+def get_voice_assistant_response(query, weather_data, lat, lon):
+    """AI Voice Assistant for storm chasing questions"""
+    try:
+        client = get_openai_client()
+        if not client:
+            return "Voice assistant temporarily unavailable. Please check weather parameters manually."
+        
+        response = client.chat.completions.create(**voice_assistant_request(query, weather_data, lat, lon))
         
         return response.choices[0].message.content
         
     except Exception as e:
         return f"Voice assistant error: {str(e)}. Please check weather parameters manually."
 
+def stream_voice_assistant_response(query, weather_data, lat, lon):
+    """Yield the voice assistant answer chunk by chunk as the completion streams in"""
+    try:
+        client = get_openai_client()
+        if not client:
+            yield "Voice assistant temporarily unavailable. Please check weather parameters manually."
+            return
+        
+        stream = client.chat.completions.create(stream=True, **voice_assistant_request(query, weather_data, lat, lon))
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+        
+    except Exception as e:
+        yield f"Voice assistant error: {str(e)}. Please check weather parameters manually."
+
+def split_spoken_sentences(text):
+    """Split streamed text into complete sentences ready to speak and the unfinished remainder"""
+    parts = VOICE_SENTENCE_END.split(text)
+    sentences, pending = [], ''
+    for part in parts[:-1]:
+        pending = f"{pending} {part}".strip()
+        if len(pending) >= VOICE_SENTENCE_MIN_CHARS:
+            sentences.append(pending)
+            pending = ''
+    remainder = f"{pending} {parts[-1]}".strip() if pending else parts[-1]
+    return sentences, remainder
+
+def queue_voice_sentence(sentence, container, first=False):
+    """Hand one sentence to the browser speech queue in gps-tracker.js"""
+    # Markdown never runs scripts, so each sentence goes through a zero-height component frame
+    # that loads gps-tracker.js; JSON-encoding keeps quotes and newlines from breaking out
+    text = json.dumps(sentence).replace('</', '<\\/')
+    frame = (
+        "<script>window.stormChaseVoiceFrame = true;</script>\n"
+        f"<script>\n{_gps_js}\n</script>\n"
+        f"<script>window.queueVoiceSentence({text}, {'true' if first else 'false'});</script>"
+    )
+    with container:
+        if hasattr(st, 'iframe'):
+            st.iframe(frame, height=1)
+        else:
+            components.html(frame, height=0)  # Streamlit releases before st.iframe
+
+def speak_streamed_response(chunks, container):
+    """Pass chunks through unchanged while queueing each completed sentence for speech"""
+    buffer, first = '', True
+    for chunk in chunks:
+        yield chunk
+        sentences, buffer = split_spoken_sentences(buffer + chunk)
+        for sentence in sentences:
+            queue_voice_sentence(sentence, container, first)
+            first = False
+    if buffer.strip():
+        queue_voice_sentence(buffer.strip(), container, first)
+
+# Storm photo pre-processing: the vision model downsamples high-detail images to fit within
+# 2048 px and then to 768 px on the short side, so anything larger is wasted upload
+PHOTO_MAX_LONG_SIDE = 2048
+PHOTO_MAX_SHORT_SIDE = 768
+PHOTO_JPEG_QUALITY = 85
+PHOTO_HASH_SIZE = 8                 # Difference-hash grid; 8 gives a 64-bit hash
+PHOTO_HASH_MAX_DISTANCE = 4         # Hashes this many bits apart count as the same frame
+PHOTO_CACHE_MAX_ENTRIES = 128
+PHOTO_CACHE_TTL_SECONDS = 6 * 3600
+
+def photo_difference_hash(image):
+    """64-bit perceptual hash comparing neighbouring pixels of a tiny grayscale thumbnail"""
+    pixels = np.asarray(
+        image.convert('L').resize((PHOTO_HASH_SIZE + 1, PHOTO_HASH_SIZE), Image.Resampling.LANCZOS), dtype=np.int16
+    )
+    bits = (pixels[:, 1:] > pixels[:, :-1]).flatten()
+    return int(''.join('1' if bit else '0' for bit in bits), 2)
+
+def preprocess_storm_photo(image_bytes):
+    """Orientation-corrected, EXIF-free JPEG sized for the vision model, plus its perceptual hash"""
+    image = Image.open(io.BytesIO(image_bytes))
+    scale = min(1.0, PHOTO_MAX_LONG_SIDE / max(image.size), PHOTO_MAX_SHORT_SIDE / min(image.size))
+    target = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+    # JPEG decodes straight to a power-of-two reduction of the target instead of full resolution
+    image.draft('RGB', target)
+    # Apply the orientation tag before it is dropped with the rest of the metadata
+    image = ImageOps.exif_transpose(image).convert('RGB')
+    if scale < 1.0:
+        image.thumbnail((max(target), max(target)), Image.Resampling.LANCZOS)
+    output = io.BytesIO()
+    image.save(output, format='JPEG', quality=PHOTO_JPEG_QUALITY, optimize=True)
+    return output.getvalue(), photo_difference_hash(image)
+
+class PhotoAnalysisCache(SharedTTLCache):
+    """Photo analyses keyed by perceptual hash, matching near-identical frames as well as exact ones"""
+
+    def find(self, photo_hash, max_distance=PHOTO_HASH_MAX_DISTANCE):
+        """Return the cached analysis of the closest fresh photo within max_distance bits, or None"""
+        with self._lock:
+            found, value = self._fresh_value(photo_hash, time.time())
+            if found:
+                return value
+            now = time.time()
+            matches = sorted(
+                (bin(key ^ photo_hash).count('1'), key) for key, (stored_at, _) in self._entries.items()
+                if now - stored_at < self.ttl_seconds
+            )
+            if not matches or matches[0][0] > max_distance:
+                return None
+            return self._fresh_value(matches[0][1], now)[1]
+
+@st.cache_resource
+def get_photo_analysis_cache():
+    """Process-wide storm photo analysis cache"""
+    return PhotoAnalysisCache(PHOTO_CACHE_MAX_ENTRIES, PHOTO_CACHE_TTL_SECONDS)
+
 def analyze_storm_photo(uploaded_file):
     """AI-powered storm photo analysis"""
     try:
+        # Shrink and strip the upload first; re-submitting the same or a near-identical frame skips the model
+        image_bytes, photo_hash = preprocess_storm_photo(uploaded_file.getvalue())
+        photo_cache = get_photo_analysis_cache()
+        cached_analysis = photo_cache.find(photo_hash)
+        if cached_analysis is not None:
+            return cached_analysis
+        
         client = get_openai_client()
         if not client:
             return {
@@ -1510,7 +3345,6 @@ def analyze_storm_photo(uploaded_file):
             }
         
         # Convert image to base64 for API
-        image_bytes = uploaded_file.read()
         base64_image = base64.b64encode(image_bytes).decode('utf-8')
         
         # the newest OpenAI model is "gpt-5" which was released August 7, 2025.
@@ -1544,7 +3378,9 @@ def analyze_storm_photo(uploaded_file):
         
         content = response.choices[0].message.content
         if content:
-            return json.loads(content)
+            analysis = json.loads(content)
+            photo_cache.put(photo_hash, analysis)
+            return analysis
         else:
             return {
                 'cloud_types': 'Analysis incomplete',
@@ -1670,6 +3506,202 @@ def display_voice_alert(warning):
     st.markdown(voice_script, unsafe_allow_html=True)
     st.warning("🔊 Voice Alert: TORNADO WARNING announced - Take shelter immediately!")
 
+# Per-rerun panel data aggregation
+PANEL_FETCH_MAX_WORKERS = 16        # Shared by all sessions; each rerun submits up to six fetches
+PANEL_FETCH_TIMEOUT_SECONDS = 90    # Longest a panel waits for its data before showing "unavailable"
+
+@st.cache_resource
+def get_panel_fetch_executor():
+    """Process-wide worker pool that runs independent panel fetches concurrently"""
+    return ThreadPoolExecutor(max_workers=PANEL_FETCH_MAX_WORKERS, thread_name_prefix="panel-fetch")
+
+def start_panel_fetches(tasks):
+    """Launch {name: (fetch_function, args)} concurrently and return {name: Future}"""
+    # Fetchers run off the script thread, so any st.* messages they emit are dropped;
+    # each panel already renders its own "unavailable" state from an empty result
+    executor = get_panel_fetch_executor()
+    return {name: executor.submit(fetch, *args) for name, (fetch, args) in tasks.items()}
+
+def panel_result(futures, name, default=None, timeout=PANEL_FETCH_TIMEOUT_SECONDS):
+    """Wait for one aggregated fetch, returning default on failure, timeout or missing task"""
+    future = futures.get(name)
+    if future is None:
+        return default
+    try:
+        result = future.result(timeout=timeout)
+    except Exception:
+        return default
+    return default if result is None else result
+
+# Fragment refresh: each panel reruns on its own cadence instead of the whole script
+PANEL_REFRESH_SECONDS = {
+    'map': 300,
+    'parameters': 300,
+    'radar': 120,
+    'goes': 60,
+    'hrrr': 600,
+    'alerts': 30,
+    'warnings': 60,
+    'composite': 300,
+    'sidebar': 30,   # Quick stats and the warning polygon banner, on the alerts cadence
+}
+PANEL_REFRESH_TOLERANCE_SECONDS = 5  # Fragment timers drift; a rerun this close to due still counts as due
+
+def tornado_warning_check_due():
+    """Whether a minute has passed since the last tornado warning check, allowing for timer jitter"""
+    elapsed = time.time() - st.session_state.last_warning_check
+    return elapsed >= PANEL_REFRESH_SECONDS['warnings'] - PANEL_REFRESH_TOLERANCE_SECONDS
+
+def fragment_panel_data(futures, name, fetch, args, default=None):
+    """This full run's prefetched result, or a direct fetch when the panel's fragment reruns on its own"""
+    # Fragment reruns reuse the futures dict from the last full run, so each prefetch is consumed once
+    future = futures.pop(name, None)
+    if future is not None:
+        return panel_result({name: future}, name, default)
+    try:
+        result = fetch(*args)
+    except Exception:
+        return default
+    return default if result is None else result
+
+def memoize_panel_render(panel, version, build):
+    """Reuse a panel's built render object until its data version changes"""
+    cached = st.session_state.panel_renders.get(panel)
+    if cached is None or cached[0] != version:
+        cached = (version, build())
+        st.session_state.panel_renders[panel] = cached
+    return cached[1]
+
+# Background refresh scheduler
+TARGET_REFRESH_SECONDS = 15 * 60    # Chase targets are re-ranked at most this often
+SCHEDULER_TICK_SECONDS = 5          # How often the scheduler looks for due jobs
+SCHEDULER_IDLE_SECONDS = 30 * 60    # Locations no session has viewed for this long stop refreshing
+SCHEDULER_JOB_INTERVALS = {         # Each job reruns shortly before the data it renews goes stale
+    'weather': WEATHER_CACHE_TTL_SECONDS - 120,
+    'targets': TARGET_REFRESH_SECONDS - 120,
+    'alerts': RESPONSE_CACHE_TTL_SECONDS['nws_alerts'] - 15,
+    'storm_reports': RESPONSE_CACHE_TTL_SECONDS['spc_reports'] - 60,
+}
+SCHEDULER_LOCATION_JOBS = ('weather', 'targets')
+SCHEDULER_GLOBAL_JOBS = ('alerts', 'storm_reports')  # One refresh serves every location
+
+class BackgroundRefreshScheduler:
+    """Daemon thread that renews weather, targets, alerts and reports for every location in view"""
+
+    def __init__(self, tick_seconds=SCHEDULER_TICK_SECONDS):
+        self.tick_seconds = tick_seconds
+        self._locations = {}   # cell -> {'lat', 'lon', 'last_seen', 'last_run': {job: timestamp}}
+        self._snapshots = {}   # (job, cell) -> (data, published_at); swapped whole, never mutated
+        self._global_last_run = dict.fromkeys(SCHEDULER_GLOBAL_JOBS, time.time())
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="refresh-scheduler", daemon=True)
+        self._thread.start()
+
+    def register(self, lat, lon):
+        """Keep a location warm; the caller's own load this rerun counts as its first refresh"""
+        cell = quantize_coordinates(lat, lon)
+        now = time.time()
+        with self._lock:
+            location = self._locations.get(cell)
+            if location is None:
+                self._locations[cell] = {
+                    'lat': lat, 'lon': lon, 'last_seen': now,
+                    'last_run': dict.fromkeys(SCHEDULER_LOCATION_JOBS, now)
+                }
+            else:
+                location.update(lat=lat, lon=lon, last_seen=now)
+
+    def snapshot(self, job, lat, lon):
+        """Latest (data, published_at) for a location, or (None, 0) if nothing was published yet"""
+        with self._lock:
+            return self._snapshots.get((job, quantize_coordinates(lat, lon)), (None, 0))
+
+    def publish(self, job, lat, lon, data):
+        """Atomically swap in a new result for a location"""
+        with self._lock:
+            self._snapshots[(job, quantize_coordinates(lat, lon))] = (data, time.time())
+
+    def _run(self):
+        """Scheduler loop; a failing cycle never stops later refreshes"""
+        while True:
+            time.sleep(self.tick_seconds)
+            try:
+                self._run_due_jobs()
+            except Exception:
+                pass
+
+    def _run_due_jobs(self):
+        """Drop idle locations, then run every job whose interval has elapsed"""
+        now = time.time()
+        with self._lock:
+            for cell in [cell for cell, location in self._locations.items()
+                         if now - location['last_seen'] > SCHEDULER_IDLE_SECONDS]:
+                del self._locations[cell]
+                for job in SCHEDULER_LOCATION_JOBS:
+                    self._snapshots.pop((job, cell), None)
+            due = [
+                (cell, location['lat'], location['lon'], job)
+                for cell, location in self._locations.items()
+                for job, last_run in location['last_run'].items()
+                if now - last_run >= SCHEDULER_JOB_INTERVALS[job]
+            ]
+            global_due = [
+                job for job, last_run in self._global_last_run.items()
+                if self._locations and now - last_run >= SCHEDULER_JOB_INTERVALS[job]
+            ]
+
+        for cell, job_lat, job_lon, job in due:
+            try:
+                getattr(self, f"_refresh_{job}")(cell, job_lat, job_lon)
+            except Exception:
+                pass  # Retried next interval; reruns still load inline if the cache expires first
+            with self._lock:
+                if cell in self._locations:
+                    self._locations[cell]['last_run'][job] = time.time()
+
+        for job in global_due:
+            try:
+                getattr(self, f"_refresh_{job}")()
+            except Exception:
+                pass
+            self._global_last_run[job] = time.time()
+
+    def _refresh_weather(self, cell, lat, lon):
+        """Renew the base location's derived parameters in the shared weather cache"""
+        derived = _load_location_weather(*cell, refresh=True)
+        if derived:
+            get_shared_weather_cache().put(cell, derived)
+
+    def _refresh_targets(self, cell, lat, lon):
+        """Renew the target grid's weather, then re-rank and publish the targets"""
+        weather_cache = get_shared_weather_cache()
+        grid_cells = [quantize_coordinates(grid_lat, grid_lon) for grid_lat, grid_lon, _ in get_target_grid_points(lat, lon)]
+        grid_weather = _load_grid_weather(grid_cells, GRID_FETCH_MODE, refresh=True)
+        if not any(grid_weather):
+            return  # Keep the previous targets rather than publishing an empty ranking
+        for grid_cell, derived in zip(grid_cells, grid_weather):
+            if derived:
+                weather_cache.put(grid_cell, derived)
+        self.publish('targets', lat, lon, generate_intelligent_targets(lat, lon, weather_cache.get(cell)))
+
+    def _refresh_alerts(self):
+        """Renew the regional alert snapshot for every location in view and rebuild its polygon index off the page"""
+        alert_snapshot = get_alert_snapshot()
+        with self._lock:
+            points = [(location['lat'], location['lon']) for location in self._locations.values()]
+        for point_lat, point_lon in points:
+            alert_snapshot.cover(point_lat, point_lon)
+        alert_snapshot.geometry_index(refresh=True, load_zones=True)
+
+    def _refresh_storm_reports(self):
+        """Renew every SPC report day in the window; past days stop syncing once final"""
+        get_storm_report_index(refresh=True)
+
+@st.cache_resource
+def get_refresh_scheduler():
+    """Process-wide background refresh scheduler shared by all sessions"""
+    return BackgroundRefreshScheduler()
+
 # Weather parameter thresholds and criteria
 # Enhanced Weather Parameter Thresholds for Professional Storm Chasing
 THRESHOLDS = {
@@ -1747,12 +3779,6 @@ def get_status_color(status):
     }
     return colors.get(status, '#6c757d')
 
-# Auto-refresh data every 30 seconds
-current_time = time.time()
-if current_time - st.session_state.last_update > 30:
-    st.session_state.last_update = current_time
-    st.rerun()
-
 # Initialize default coordinates (Valley, Nebraska)
 lat = 41.3114
 lon = -96.3439
@@ -1765,33 +3791,47 @@ with st.sidebar:
     if st.button("🔄 Refresh Data", use_container_width=True):
         st.rerun()
     
-    # Current time
-    st.markdown(f"**Last Update:** {datetime.now().strftime('%H:%M:%S')}")
-    
     # Location input
     st.markdown("### 📍 Chase Location")
     lat = st.number_input("Latitude", value=41.3114, format="%.4f")
     lon = st.number_input("Longitude", value=-96.3439, format="%.4f")
 
+# Launch every independent upstream fetch at once so page time is bounded by the slowest source.
+# Widget-dependent inputs (radar product, HRRR hour) come from their keyed session state.
+refresh_scheduler = get_refresh_scheduler()
+refresh_scheduler.register(lat, lon)  # Background refreshes keep this location's data warm for later reruns
+station_id, station_info = get_radar_stations_near_location(lat, lon)
+warnings_check_due = tornado_warning_check_due()
+panel_tasks = {
+    'alerts': (get_nws_alerts, (lat, lon, 100)),
+    'storm_reports': (get_spc_storm_reports, ()),
+    'goes': (get_goes_mesoscale_sectors, ()),
+    'hrrr': (get_hrrr_data, (lat, lon, st.session_state.get('hrrr_forecast_hour', 0)))
+}
+if station_id:
+    panel_tasks['radar'] = (fetch_radar_image, (station_id, st.session_state.get('radar_product', 'N0Q')))
+if warnings_check_due:
+    panel_tasks['tornado_warnings'] = (check_tornado_warnings, (lat, lon, 50))  # 50 mile radius
+panel_futures = start_panel_fetches(panel_tasks)
+
 # Generate current weather data after coordinates are defined
 weather_data = generate_weather_data(lat, lon)
+if weather_data:
+    # Merge composite indices into weather_data for UI display
+    weather_data = {**weather_data, **calculate_composite_indices(weather_data)}
 
-# Add quick stats to sidebar after weather data is generated
-with st.sidebar:
-    # Quick stats
+@st.fragment(run_every=PANEL_REFRESH_SECONDS['sidebar'])
+def render_sidebar_conditions(lat, lon):
+    """Quick stats and chasability score, refreshed in place while the chaser is not touching the page"""
     st.markdown("### 📊 Quick Stats")
+    st.markdown(f"**Last Update:** {datetime.now().strftime('%H:%M:%S')}")
     
-    # Check if weather_data is available and merge composite indices
+    weather_data = generate_weather_data(lat, lon)
     if weather_data:
-        # Calculate and merge composite indices into weather_data
-        composite_indices = calculate_composite_indices(weather_data)
-        # Merge composite indices into weather_data for UI display
-        enhanced_weather_data = {**weather_data, **composite_indices}
-        
+        weather_data = {**weather_data, **calculate_composite_indices(weather_data)}
         # Count favorable parameters using enhanced data
         favorable_count = sum(1 for param in THRESHOLDS.keys() 
-                             if param in enhanced_weather_data and get_parameter_status(enhanced_weather_data[param], param) == 'favorable')
-        weather_data = enhanced_weather_data  # Update weather_data with composite indices
+                             if param in weather_data and get_parameter_status(weather_data[param], param) == 'favorable')
     else:
         favorable_count = 0
     st.metric("Favorable Parameters", f"{favorable_count}/{len(THRESHOLDS)}")
@@ -1816,6 +3856,20 @@ with st.sidebar:
     else:
         st.error(f"🔴 **POOR CHASE**: {chasability_score}/100")
         st.markdown("*Not recommended for chasing today*")
+
+@st.fragment(run_every=PANEL_REFRESH_SECONDS['sidebar'])
+def render_warning_polygon_status(lat, lon):
+    """Warning polygons around the current position, answered from the local polygon index"""
+    for feature, distance in nearby_alerts(lat, lon, ALERT_PROXIMITY_MILES, events=ALERT_POLYGON_EVENTS):
+        event = feature['properties'].get('event', 'Alert')
+        if distance == 0:
+            st.error(f"🚨 Inside {event} polygon")
+        else:
+            st.warning(f"⚠️ {event} polygon {distance:.1f} mi away")
+
+# Sidebar status panels rerun on their own timer; the controls below only change on interaction
+with st.sidebar:
+    render_sidebar_conditions(lat, lon)
     
     # AI Storm Personality Analysis
     with st.expander("🤖 AI Storm Intelligence", expanded=False):
@@ -1838,6 +3892,8 @@ with st.sidebar:
     # GPS Status and Controls
     tracking_status = "🟢 ACTIVE" if st.session_state.tracking_active else "🔴 INACTIVE"
     st.markdown(f"**Status:** {tracking_status}")
+
+    render_warning_polygon_status(lat, lon)
     
     col_a, col_b = st.columns(2)
     
@@ -1892,574 +3948,668 @@ with st.sidebar:
             else:
                 st.metric("📌 Points", len(st.session_state.breadcrumbs))
         
+        track_stats = st.session_state.track_stats
+        if track_stats and track_stats['points'] > 1:
+            col_stats3, col_stats4 = st.columns(2)
+            with col_stats3:
+                heading = track_stats['heading_deg']
+                heading_text = ['N','NE','E','SE','S','SW','W','NW'][int((heading + 22.5) % 360 / 45)] if heading is not None else "—"
+                st.metric("🚗 Speed", f"{track_stats['speed_mph']:.0f} mph {heading_text}",
+                         delta=f"max {track_stats['max_speed_mph']:.0f} mph", delta_color="off")
+            with col_stats4:
+                moving_minutes = int(track_stats['moving_seconds'] // 60)
+                stopped_minutes = int(track_stats['stopped_seconds'] // 60)
+                st.metric("🟢 Moving", f"{moving_minutes // 60}h {moving_minutes % 60}m",
+                         delta=f"stopped {stopped_minutes // 60}h {stopped_minutes % 60}m", delta_color="off")
+        
         # Latest position info
         if st.session_state.breadcrumbs:
-            latest = st.session_state.breadcrumbs[-1]
-            st.info(f"📍 Latest: {latest['time_str']} at {latest['lat']:.4f}, {latest['lon']:.4f}")
+            latest_lat, latest_lon, latest_time = st.session_state.breadcrumbs.latest()
+            st.info(f"📍 Latest: {datetime.fromtimestamp(latest_time).strftime('%H:%M:%S')} at {latest_lat:.4f}, {latest_lon:.4f}")
     
     # Mobile GPS Integration Notice
     st.markdown("---")
     st.markdown("**📱 iPad Integration:**")
     st.info("• Automatic GPS tracking every 30 seconds while chasing\\n• Voice alerts for tornado warnings\\n• Works offline with cellular data")
 
-# Enhanced Layout: Full-width map on top, parameters below in columns
-st.header("🗺️ Interactive Storm Chase Map")
-st.markdown("Real-time radar data, SPC outlooks, and intelligent chase targets")
-
 # Full-width Interactive Map section (enhanced layout)
-# Map creation and display
+CHASE_MAP_DEFAULT_CENTER = (39.8283, -98.5795)
+CHASE_MAP_DEFAULT_ZOOM = 7
 
-# Create enhanced map with multiple base layers for storm chasing
-m = folium.Map(
-    location=[lat, lon],
-    zoom_start=7,
-    tiles="OpenStreetMap"
-)
+def build_base_chase_map():
+    """Chase map skeleton (base layers, overlays, layer control, legend) without any per-session content"""
+    m = folium.Map(
+        location=list(CHASE_MAP_DEFAULT_CENTER),
+        zoom_start=CHASE_MAP_DEFAULT_ZOOM,
+        tiles="OpenStreetMap"
+    )
 
-# Add specialized map layers for storm chasing
-folium.TileLayer(
-    tiles='https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}',
-    attr='Esri',
-    name='Satellite (High Resolution)',
-    overlay=False,
-    control=True
-).add_to(m)
-
-# Add terrain layer for topographical awareness
-folium.TileLayer(
-    tiles='https://server.arcgisonline.com/ArcGIS/rest/services/World_Topo_Map/MapServer/tile/{z}/{y}/{x}',
-    attr='Esri',
-    name='Topographic',
-    overlay=False,
-    control=True
-).add_to(m)
-
-# Real-time NEXRAD Base Reflectivity overlay
-nexrad_reflectivity = folium.WmsTileLayer(
-    url='https://mesonet.agron.iastate.edu/cgi-bin/wms/nexrad/n0r.cgi',
-    name='🌧️ NEXRAD Reflectivity',
-    layers='nexrad-n0r-wmst',
-    fmt='image/png',
-    transparent=True,
-    overlay=True,
-    control=True,
-    opacity=0.6,
-    version='1.1.1'
-)
-nexrad_reflectivity.add_to(m)
-
-# NEXRAD Base Velocity for rotation detection
-nexrad_velocity = folium.WmsTileLayer(
-    url='https://mesonet.agron.iastate.edu/cgi-bin/wms/nexrad/n0v.cgi',
-    name='🌪️ NEXRAD Velocity', 
-    layers='nexrad-n0v-wmst',
-    fmt='image/png',
-    transparent=True,
-    overlay=True,
-    control=True,
-    opacity=0.7,
-    version='1.1.1'
-)
-nexrad_velocity.add_to(m)
-
-# Storm-Relative Velocity for mesocyclone detection
-nexrad_storm_relative = folium.WmsTileLayer(
-    url='https://mesonet.agron.iastate.edu/cgi-bin/wms/nexrad/n0s.cgi',
-    name='🎯 Storm Relative Motion',
-    layers='nexrad-n0s-wmst',
-    fmt='image/png',
-    transparent=True,
-    overlay=True,
-    control=True,
-    opacity=0.8,
-    version='1.1.1'
-)
-nexrad_storm_relative.add_to(m)
-    
-# Comprehensive SPC Storm Prediction Center Overlays
-
-# SPC Day 1 Convective Outlook 
-spc_day1_outlook = folium.WmsTileLayer(
-    url='https://mesonet.agron.iastate.edu/cgi-bin/wms/us/spc_outlook.cgi',
-    name='🌩️ SPC Day 1 Outlook',
-    layers='day1otlk_cat',
-    fmt='image/png',
-    transparent=True,
-    overlay=True,
-    control=True,
-    opacity=0.6,
-    version='1.1.1'
-)
-spc_day1_outlook.add_to(m)
-    
-# SPC Day 2-3 Extended Outlooks
-spc_day2_outlook = folium.WmsTileLayer(
-    url='https://mesonet.agron.iastate.edu/cgi-bin/wms/us/spc_outlook.cgi',
-    name='🗓️ SPC Day 2 Outlook',
-    layers='day2otlk_cat', 
-    fmt='image/png',
-    transparent=True,
-    overlay=True,
-    control=True,
-    opacity=0.5,
-    version='1.1.1'
-)
-spc_day2_outlook.add_to(m)
-    
-# Active Watches and Warnings
-current_watches = folium.WmsTileLayer(
-    url='https://mesonet.agron.iastate.edu/cgi-bin/wms/us/wwa.cgi',
-    name='⚠️ Active Watches & Warnings',
-    layers='warnings_c',
-    fmt='image/png',
-    transparent=True,
-    overlay=True,
-    control=True,
-    opacity=0.7,
-    version='1.1.1'
-)
-current_watches.add_to(m)
-    
-# SPC Mesoscale Discussions (MCDs)
-spc_mcds = folium.WmsTileLayer(
-    url='https://mesonet.agron.iastate.edu/cgi-bin/wms/us/spc_mcd.cgi',
-    name='📋 SPC Mesoscale Discussions',
-    layers='spc_mcd',
-    fmt='image/png',
-    transparent=True,
-    overlay=True,
-    control=True,
-    opacity=0.6,
-    version='1.1.1'
-)
-spc_mcds.add_to(m)
-    
-# Tornado probability overlay
-tornado_prob = folium.WmsTileLayer(
-    url='https://mesonet.agron.iastate.edu/cgi-bin/wms/us/spc_outlook.cgi',
-    name='🌪️ Tornado Probability', 
-    layers='day1otlk_torn',
-    fmt='image/png',
-    transparent=True,
-    overlay=True,
-    control=True,
-    opacity=0.5,
-    version='1.1.1'
-)
-tornado_prob.add_to(m)
-    
-# Hail probability overlay
-hail_prob = folium.WmsTileLayer(
-    url='https://mesonet.agron.iastate.edu/cgi-bin/wms/us/spc_outlook.cgi',
-    name='🧊 Hail Probability',
-    layers='day1otlk_hail',
-    fmt='image/png', 
-    transparent=True,
-    overlay=True,
-    control=True,
-    opacity=0.5,
-    version='1.1.1'
-)
-hail_prob.add_to(m)
-    
-# Surface Analysis overlay
-surface_analysis = folium.WmsTileLayer(
-    url='https://mesonet.agron.iastate.edu/cgi-bin/wms/us/mrms.cgi',
-    name='🌡️ Surface Analysis',
-    layers='mrms_p1h_00.00',
-    fmt='image/png', 
-    transparent=True,
-    overlay=True,
-    control=True,
-    opacity=0.4,
-    version='1.1.1'
-)
-surface_analysis.add_to(m)
-    
-# Add GPS breadcrumb trail
-if len(st.session_state.breadcrumbs) > 1:
-    # Create the breadcrumb path
-    breadcrumb_coords = [(b['lat'], b['lon']) for b in st.session_state.breadcrumbs]
-    
-    # Add the path line
-    folium.PolyLine(
-        breadcrumb_coords,
-        color='red',
-        weight=3,
-        opacity=0.8,
-        popup=f"Chase Track - {get_chase_distance():.1f} miles"
+    # Add specialized map layers for storm chasing
+    folium.TileLayer(
+        tiles='https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}',
+        attr='Esri',
+        name='Satellite (High Resolution)',
+        overlay=False,
+        control=True
     ).add_to(m)
-        
-    # Add numbered markers for each breadcrumb
-    for i, breadcrumb in enumerate(st.session_state.breadcrumbs):
-        folium.CircleMarker(
-            [breadcrumb['lat'], breadcrumb['lon']],
-            radius=6,
-            popup=f"Point {i+1}<br>Time: {breadcrumb['time_str']}",
-            color='darkred',
-            fillColor='red',
-            fillOpacity=0.7
-        ).add_to(m)
-    
-# Add current location marker  
-marker_color = 'green' if st.session_state.tracking_active else 'blue'
-marker_icon = 'play' if st.session_state.tracking_active else 'home'
-status_text = "ACTIVE CHASE" if st.session_state.tracking_active else "Chase Base"
-
-folium.Marker(
-    [lat, lon],
-    popup=f"Current Location<br>{status_text}",
-    tooltip=status_text,
-    icon=folium.Icon(color=marker_color, icon=marker_icon)
-).add_to(m)
-    
-# Cached intelligent target generation with proper throttling
-
-# Initialize session state for caching
-if 'cached_targets' not in st.session_state:
-    st.session_state.cached_targets = None
-    st.session_state.last_target_update = 0
-    st.session_state.cached_weather = None
-    st.session_state.last_ai_enhancement = 0
+
+    # Add terrain layer for topographical awareness
+    folium.TileLayer(
+        tiles='https://server.arcgisonline.com/ArcGIS/rest/services/World_Topo_Map/MapServer/tile/{z}/{y}/{x}',
+        attr='Esri',
+        name='Topographic',
+        overlay=False,
+        control=True
+    ).add_to(m)
+
+    # Real-time NEXRAD Base Reflectivity overlay
+    nexrad_reflectivity = folium.WmsTileLayer(
+        url='https://mesonet.agron.iastate.edu/cgi-bin/wms/nexrad/n0r.cgi',
+        name='🌧️ NEXRAD Reflectivity',
+        layers='nexrad-n0r-wmst',
+        fmt='image/png',
+        transparent=True,
+        overlay=True,
+        control=True,
+        opacity=0.6,
+        version='1.1.1'
+    )
+    nexrad_reflectivity.add_to(m)
+
+    # NEXRAD Base Velocity for rotation detection
+    nexrad_velocity = folium.WmsTileLayer(
+        url='https://mesonet.agron.iastate.edu/cgi-bin/wms/nexrad/n0v.cgi',
+        name='🌪️ NEXRAD Velocity', 
+        layers='nexrad-n0v-wmst',
+        fmt='image/png',
+        transparent=True,
+        overlay=True,
+        control=True,
+        opacity=0.7,
+        version='1.1.1'
+    )
+    nexrad_velocity.add_to(m)
+
+    # Storm-Relative Velocity for mesocyclone detection
+    nexrad_storm_relative = folium.WmsTileLayer(
+        url='https://mesonet.agron.iastate.edu/cgi-bin/wms/nexrad/n0s.cgi',
+        name='🎯 Storm Relative Motion',
+        layers='nexrad-n0s-wmst',
+        fmt='image/png',
+        transparent=True,
+        overlay=True,
+        control=True,
+        opacity=0.8,
+        version='1.1.1'
+    )
+    nexrad_storm_relative.add_to(m)
     
-current_time = time.time()
+    # Comprehensive SPC Storm Prediction Center Overlays
 
-# Check if targets need refresh (every 15 minutes)
-target_refresh_interval = 15 * 60  # 15 minutes
-needs_target_refresh = (
-    st.session_state.cached_targets is None or 
-    current_time - st.session_state.last_target_update > target_refresh_interval
-)
+    # SPC Day 1 Convective Outlook 
+    spc_day1_outlook = folium.WmsTileLayer(
+        url='https://mesonet.agron.iastate.edu/cgi-bin/wms/us/spc_outlook.cgi',
+        name='🌩️ SPC Day 1 Outlook',
+        layers='day1otlk_cat',
+        fmt='image/png',
+        transparent=True,
+        overlay=True,
+        control=True,
+        opacity=0.6,
+        version='1.1.1'
+    )
+    spc_day1_outlook.add_to(m)
+    
+    # SPC Day 2-3 Extended Outlooks
+    spc_day2_outlook = folium.WmsTileLayer(
+        url='https://mesonet.agron.iastate.edu/cgi-bin/wms/us/spc_outlook.cgi',
+        name='🗓️ SPC Day 2 Outlook',
+        layers='day2otlk_cat', 
+        fmt='image/png',
+        transparent=True,
+        overlay=True,
+        control=True,
+        opacity=0.5,
+        version='1.1.1'
+    )
+    spc_day2_outlook.add_to(m)
+    
+    # Active Watches and Warnings
+    current_watches = folium.WmsTileLayer(
+        url='https://mesonet.agron.iastate.edu/cgi-bin/wms/us/wwa.cgi',
+        name='⚠️ Active Watches & Warnings',
+        layers='warnings_c',
+        fmt='image/png',
+        transparent=True,
+        overlay=True,
+        control=True,
+        opacity=0.7,
+        version='1.1.1'
+    )
+    current_watches.add_to(m)
+    
+    # SPC Mesoscale Discussions (MCDs)
+    spc_mcds = folium.WmsTileLayer(
+        url='https://mesonet.agron.iastate.edu/cgi-bin/wms/us/spc_mcd.cgi',
+        name='📋 SPC Mesoscale Discussions',
+        layers='spc_mcd',
+        fmt='image/png',
+        transparent=True,
+        overlay=True,
+        control=True,
+        opacity=0.6,
+        version='1.1.1'
+    )
+    spc_mcds.add_to(m)
+    
+    # Tornado probability overlay
+    tornado_prob = folium.WmsTileLayer(
+        url='https://mesonet.agron.iastate.edu/cgi-bin/wms/us/spc_outlook.cgi',
+        name='🌪️ Tornado Probability', 
+        layers='day1otlk_torn',
+        fmt='image/png',
+        transparent=True,
+        overlay=True,
+        control=True,
+        opacity=0.5,
+        version='1.1.1'
+    )
+    tornado_prob.add_to(m)
+    
+    # Hail probability overlay
+    hail_prob = folium.WmsTileLayer(
+        url='https://mesonet.agron.iastate.edu/cgi-bin/wms/us/spc_outlook.cgi',
+        name='🧊 Hail Probability',
+        layers='day1otlk_hail',
+        fmt='image/png', 
+        transparent=True,
+        overlay=True,
+        control=True,
+        opacity=0.5,
+        version='1.1.1'
+    )
+    hail_prob.add_to(m)
+    
+    # Surface Analysis overlay
+    surface_analysis = folium.WmsTileLayer(
+        url='https://mesonet.agron.iastate.edu/cgi-bin/wms/us/mrms.cgi',
+        name='🌡️ Surface Analysis',
+        layers='mrms_p1h_00.00',
+        fmt='image/png', 
+        transparent=True,
+        overlay=True,
+        control=True,
+        opacity=0.4,
+        version='1.1.1'
+    )
+    surface_analysis.add_to(m)
+    
+    # Add comprehensive layer control for storm chasing
+    layer_control = folium.LayerControl(
+        position='topright',
+        collapsed=False
+    )
+    layer_control.add_to(m)
+
+    # Collapsible Legend Control (similar to layer control)
+    legend_control_html = '''
+    <div id="legend-control" style="position: fixed; 
+                                   bottom: 50px; left: 50px; z-index:9999;">
+        <div id="legend-toggle" style="
+            background: white; border: 2px solid #333; padding: 8px 12px; 
+            border-radius: 5px; box-shadow: 0 2px 6px rgba(0,0,0,0.3);
+            cursor: pointer; font-weight: bold; text-align: center;
+            margin-bottom: 5px; user-select: none;
+        ">
+            🏷️ Legend ▼
+        </div>
+            <div id="legend-content" style="
+                width: 220px; background-color: rgba(255, 255, 255, 0.95); 
+                border: 2px solid #333; font-size: 11px; padding: 8px; 
+                border-radius: 5px; box-shadow: 0 4px 8px rgba(0,0,0,0.3);
+                display: block;
+            ">
+                <h4 style="margin: 0 0 8px 0; color: #333; border-bottom: 1px solid #ccc; padding-bottom: 4px;">Storm Chase Legend</h4>
+            
+                <div style="margin-bottom: 6px;"><strong>📶 Radar Reflectivity:</strong></div>
+                <div style="color: #00FF00; margin: 2px 0;">🌧️ Light (20-35 dBZ)</div>
+                <div style="color: #FFFF00; margin: 2px 0;">⛈️ Moderate (35-50 dBZ)</div>
+                <div style="color: #FF8000; margin: 2px 0;">🌩️ Heavy (50-60 dBZ)</div>
+                <div style="color: #FF0000; margin: 2px 0;">⚡ Severe (60+ dBZ)</div>
+                <div style="color: #FF00FF; margin: 2px 0;">🧊 Hail Core (65+ dBZ)</div>
+            
+                <div style="margin: 6px 0 2px 0;"><strong>🎯 SPC Risk Areas:</strong></div>
+                <div style="background: #C0E0C0; padding: 1px 3px; margin: 1px 0;">MARGINAL (1)</div>
+                <div style="background: #FFE066; padding: 1px 3px; margin: 1px 0;">SLIGHT (2)</div>
+                <div style="background: #FF9999; padding: 1px 3px; margin: 1px 0;">ENHANCED (3)</div>
+                <div style="background: #FF6666; padding: 1px 3px; margin: 1px 0;">MODERATE (4)</div>
+                <div style="background: #FF3333; padding: 1px 3px; margin: 1px 0; color: white;">HIGH (5)</div>
+            </div>
+        </div>
+    
+        <script>
+        document.getElementById('legend-toggle').addEventListener('click', function() {
+            var content = document.getElementById('legend-content');
+            var toggle = document.getElementById('legend-toggle');
+            if (content.style.display === 'none') {
+                content.style.display = 'block';
+                toggle.innerHTML = '🏷️ Legend ▼';
+            } else {
+                content.style.display = 'none';
+                toggle.innerHTML = '🏷️ Legend ▶';
+            }
+        });
+        </script>
+        '''
+    # Add legend to map (type: ignore for LSP)
+    m.get_root().html.add_child(folium.Element(legend_control_html))  # type: ignore[attr-defined]
+
+    return m
+
+def build_chase_overlays(lat, lon, enhanced_targets, zoom=CHASE_MAP_DEFAULT_ZOOM, storm_reports=None):
+    """Per-session feature groups drawn over the base map: storm reports, GPS track, current location and chase targets"""
+    report_group = folium.FeatureGroup(name="Storm Reports")
+    track_group = folium.FeatureGroup(name="Chase Track")
+    location_group = folium.FeatureGroup(name="Current Location")
+    target_group = folium.FeatureGroup(name="Chase Targets")
+
+    # Recent SPC storm reports around the chaser
+    if storm_reports is not None:
+        for report in storm_reports.itertuples():
+            folium.CircleMarker(
+                [float(report.lat), float(report.lon)],
+                radius=4,
+                color=STORM_REPORT_COLORS[report.type],
+                fill=True,
+                fillOpacity=0.8,
+                tooltip=f"{report.type.title()} {report.magnitude} • {report.valid:%H:%M}Z",
+                popup=f"{report.location}, {report.state}<br>{report.valid:%m/%d %H:%M}Z<br>{report.comments}"
+            ).add_to(report_group)
+
+    # Add GPS breadcrumb trail
+    track = st.session_state.breadcrumbs
+    if len(track) > 1:
+        # Create the breadcrumb path from the vertices still visible at this zoom
+        vertices = simplified_track_indices(track, zoom)
+        breadcrumb_coords = np.column_stack((track.lats[vertices], track.lons[vertices])).astype(float).tolist()
+    
+        # Add the path line
+        folium.PolyLine(
+            breadcrumb_coords,
+            color='red',
+            weight=3,
+            opacity=0.8,
+            popup=f"Chase Track - {get_chase_distance():.1f} miles"
+        ).add_to(track_group)
+        
+        # Add numbered markers at the simplified vertices only
+        for i in vertices:
+            folium.CircleMarker(
+                [float(track.lats[i]), float(track.lons[i])],
+                radius=6,
+                popup=f"Point {i+1}<br>Time: {datetime.fromtimestamp(int(track.times[i])).strftime('%H:%M:%S')}",
+                color='darkred',
+                fillColor='red',
+                fillOpacity=0.7
+            ).add_to(track_group)
+    
+    # Add current location marker  
+    marker_color = 'green' if st.session_state.tracking_active else 'blue'
+    marker_icon = 'play' if st.session_state.tracking_active else 'home'
+    status_text = "ACTIVE CHASE" if st.session_state.tracking_active else "Chase Base"
+
+    folium.Marker(
+        [lat, lon],
+        popup=f"Current Location<br>{status_text}",
+        tooltip=status_text,
+        icon=folium.Icon(color=marker_color, icon=marker_icon)
+    ).add_to(location_group)
+    
+    # Add targets to map (always runs regardless of expander state)
+    if enhanced_targets:
+        for i, target in enumerate(enhanced_targets):
+            if target['severity'] == 'High':
+                color = 'red'
+                icon = 'star'
+            elif target['severity'] == 'Moderate': 
+                color = 'orange'
+                icon = 'flash'
+            else:
+                color = 'green'
+                icon = 'cloud'
+        
+            popup_html = f"""
+            <div style="width: 250px;">
+                <h4>🎯 {target['name']}</h4>
+                <p><strong>Chase Score:</strong> {target['score']:.0f}/100</p>
+                <p><strong>Priority:</strong> {target['priority']}</p>
+                <p><strong>Distance:</strong> {target['distance_miles']:.0f} miles</p>
+                <p><strong>Initiation:</strong> {target['initiation_time']}</p>
+                <p><strong>Analysis:</strong> {target['reasoning']}</p>
+                <hr>
+                <p><small><strong>Weather:</strong><br>
+                CAPE: {target.get('weather_data', {}).get('CAPE', 0):.0f} J/kg<br>
+                Shear: {target.get('weather_data', {}).get('Shear_0_6km', 0):.0f} kts<br>
+                Dewpoint: {target.get('weather_data', {}).get('Dewpoint', 0):.0f}°F</small></p>
+            </div>
+            """
+        
+            folium.Marker(
+                [target['lat'], target['lon']],
+                popup=folium.Popup(popup_html, max_width=280),
+                tooltip=f"{target['name']} • Score: {target['score']:.0f}",
+                icon=folium.Icon(color=color, icon=icon, prefix='fa')
+            ).add_to(target_group)
+
+    return [report_group, track_group, location_group, target_group]
+
+
+def show_chase_map(lat, lon, overlays):
+    """Draw the chase map with this session's overlays; only the zoom level comes back from the browser"""
+    # The skeleton serializes to the same script every run, so the component is never remounted and
+    # the overlays passed through feature_group_to_add are swapped in place on the client
+    st_folium(
+        build_base_chase_map(), width=None, height=600, key="main_chase_map",
+        center=(lat, lon), zoom=CHASE_MAP_DEFAULT_ZOOM,
+        feature_group_to_add=overlays, returned_objects=["zoom"]
+    )
+
+@st.fragment(run_every=PANEL_REFRESH_SECONDS['map'])
+def render_chase_map_panel(lat, lon):
+    """Chase map and targets; reruns on its own cadence and when the map is zoomed"""
+    # Enhanced Layout: Full-width map on top, parameters below in columns
+    st.header("🗺️ Interactive Storm Chase Map")
+    st.markdown("Real-time radar data, SPC outlooks, and intelligent chase targets")
+    
+    # Cached intelligent target generation with proper throttling
+
+    # Initialize session state for caching
+    if 'cached_targets' not in st.session_state:
+        st.session_state.cached_targets = None
+        st.session_state.last_target_update = 0
+        st.session_state.cached_weather = None
+        st.session_state.last_ai_enhancement = 0
+    
+    current_time = time.time()
+    refresh_scheduler = get_refresh_scheduler()
+
+    # Check if targets need refresh (every 15 minutes)
+    needs_target_refresh = (
+        st.session_state.cached_targets is None or 
+        current_time - st.session_state.last_target_update > TARGET_REFRESH_SECONDS
+    )
     
-# Generate or use cached targets (always runs for map plotting)
-if needs_target_refresh:
-    with st.spinner("🧠 Analyzing weather data for optimal chase targets..."):
+    # Generate or use cached targets (always runs for map plotting)
+    if needs_target_refresh:
         current_weather = generate_weather_data(lat, lon)
-        intelligent_targets = generate_intelligent_targets(lat, lon, current_weather)
+        scheduled_targets, scheduled_at = refresh_scheduler.snapshot('targets', lat, lon)
+        if scheduled_targets is not None and current_time - scheduled_at <= TARGET_REFRESH_SECONDS:
+            # Warm ranking from the background scheduler; copies keep per-session AI notes out of the shared list
+            intelligent_targets = [dict(target) for target in scheduled_targets]
+            st.session_state.last_target_update = scheduled_at
+        else:
+            with st.spinner("🧠 Analyzing weather data for optimal chase targets..."):
+                intelligent_targets = generate_intelligent_targets(lat, lon, current_weather)
+                refresh_scheduler.publish('targets', lat, lon, [dict(target) for target in intelligent_targets])
+                st.session_state.last_target_update = current_time
         st.session_state.cached_targets = intelligent_targets
         st.session_state.cached_weather = current_weather
-        st.session_state.last_target_update = current_time
-else:
-    intelligent_targets = st.session_state.cached_targets
-    current_weather = st.session_state.cached_weather
+    else:
+        intelligent_targets = st.session_state.cached_targets
+        current_weather = st.session_state.cached_weather
 
-# AI enhancement with hourly throttling (always runs for map plotting)
-ai_refresh_interval = 60 * 60
-needs_ai_refresh = (
-    current_time - st.session_state.last_ai_enhancement > ai_refresh_interval
-)
-if needs_ai_refresh and intelligent_targets:
-    with st.spinner("🧠 Getting AI recommendations..."):
-        enhanced_targets = enhance_targets_with_ai(intelligent_targets, current_weather)
+    # AI enhancement with hourly throttling runs in the background; the map draws from the scores meanwhile
+    needs_ai_refresh = (
+        current_time - st.session_state.last_ai_enhancement > AI_ENHANCEMENT_INTERVAL_SECONDS
+    )
+    if needs_ai_refresh and intelligent_targets:
+        start_ai_enhancement(intelligent_targets, current_weather, st.session_state.last_target_update)
         st.session_state.last_ai_enhancement = current_time
-else:
     enhanced_targets = intelligent_targets if intelligent_targets else []
 
-# Add targets to map (always runs regardless of expander state)
-if enhanced_targets:
-    for i, target in enumerate(enhanced_targets):
-        if target['severity'] == 'High':
-            color = 'red'
-            icon = 'star'
-        elif target['severity'] == 'Moderate': 
-            color = 'orange'
-            icon = 'flash'
+    # Rebuild the overlay groups only when something drawn on them changed
+    # The track is simplified for the zoom the user last left the map at
+    map_view = st.session_state.get('main_chase_map') or {}
+    map_zoom = int(map_view.get('zoom') or CHASE_MAP_DEFAULT_ZOOM)
+    report_index = get_storm_report_index()
+    map_version = (
+        lat, lon, st.session_state.last_target_update, st.session_state.last_ai_enhancement,
+        len(st.session_state.breadcrumbs), st.session_state.tracking_active,
+        map_zoom if len(st.session_state.breadcrumbs) > 1 else None, report_index.version
+    )
+    overlays = memoize_panel_render(
+        'map', map_version, lambda: build_chase_overlays(
+            lat, lon, enhanced_targets, map_zoom,
+            report_index.query(lat, lon, STORM_REPORT_MAP_RADIUS_MILES, current_time - STORM_REPORT_MAP_HOURS * 3600)
+        )
+    )
+    
+    # Collapsible chase target details and controls
+    with st.expander("🎯 Chase Targets & Controls", expanded=False):
+        col_refresh1, col_refresh2, col_refresh3 = st.columns([3, 1, 1])
+        with col_refresh1:
+            target_count = len(enhanced_targets) if enhanced_targets else 0
+            st.markdown(f"**{target_count} targets plotted** • Auto-refresh: 15min")
+        with col_refresh2:
+            if st.button("🔄 Refresh Targets", key="manual_target_refresh"):
+                st.session_state.cached_targets = None
+                st.session_state.last_target_update = 0
+                st.session_state.last_ai_enhancement = 0
+                st.rerun()
+        with col_refresh3:
+            if st.button("🧠 AI Analysis", key="manual_ai_refresh"):
+                st.session_state.last_ai_enhancement = 0
+                st.rerun()
+
+        if enhanced_targets:
+            top_target = enhanced_targets[0]
+            st.success(f"🎯 **Top Target**: Score {top_target['score']:.0f} • {top_target['distance_miles']:.0f} miles")
+            job = st.session_state.get('ai_enhancement_job')
+            if job and job['status'] == 'running':
+                poll_ai_enhancement_status(polling=True)
+            else:
+                render_ai_enhancement_status()
+        
+            alert_polygons = get_alert_geometry_index(lat, lon)  # The region around the base already covers every target
+            for i, target in enumerate(enhanced_targets):
+                st.markdown(f"**{i+1}. {target['name']}** — Score: {target['score']:.0f} | {target['severity']} | {target['distance_miles']:.0f} mi")
+                for feature, distance in alert_polygons.near(target['lat'], target['lon'], ALERT_PROXIMITY_MILES, ALERT_POLYGON_EVENTS):
+                    where = "inside" if distance == 0 else f"{distance:.0f} mi from"
+                    st.caption(f"⚠️ Target is {where} a {feature['properties'].get('event', 'warning')} polygon")
         else:
-            color = 'green'
-            icon = 'cloud'
-        
-        popup_html = f"""
-        <div style="width: 250px;">
-            <h4>🎯 {target['name']}</h4>
-            <p><strong>Chase Score:</strong> {target['score']:.0f}/100</p>
-            <p><strong>Priority:</strong> {target['priority']}</p>
-            <p><strong>Distance:</strong> {target['distance_miles']:.0f} miles</p>
-            <p><strong>Initiation:</strong> {target['initiation_time']}</p>
-            <p><strong>Analysis:</strong> {target['reasoning']}</p>
-            <hr>
-            <p><small><strong>Weather:</strong><br>
-            CAPE: {target.get('weather_data', {}).get('CAPE', 0):.0f} J/kg<br>
-            Shear: {target.get('weather_data', {}).get('Shear_0_6km', 0):.0f} kts<br>
-            Dewpoint: {target.get('weather_data', {}).get('Dewpoint', 0):.0f}°F</small></p>
-        </div>
-        """
-        
-        folium.Marker(
-            [target['lat'], target['lon']],
-            popup=folium.Popup(popup_html, max_width=280),
-            tooltip=f"{target['name']} • Score: {target['score']:.0f}",
-            icon=folium.Icon(color=color, icon=icon, prefix='fa')
-        ).add_to(m)
-
-# Collapsible chase target details and controls
-with st.expander("🎯 Chase Targets & Controls", expanded=False):
-    col_refresh1, col_refresh2, col_refresh3 = st.columns([3, 1, 1])
-    with col_refresh1:
-        target_count = len(enhanced_targets) if enhanced_targets else 0
-        st.markdown(f"**{target_count} targets plotted** • Auto-refresh: 15min")
-    with col_refresh2:
-        if st.button("🔄 Refresh Targets", key="manual_target_refresh"):
-            st.session_state.cached_targets = None
-            st.session_state.last_target_update = 0
-            st.session_state.last_ai_enhancement = 0
-            st.rerun()
-    with col_refresh3:
-        if st.button("🧠 AI Analysis", key="manual_ai_refresh"):
-            st.session_state.last_ai_enhancement = 0
-            st.rerun()
+            st.warning("No chase-worthy targets in current conditions")
+    
+    # Display comprehensive storm chasing map (full width)
+    show_chase_map(lat, lon, overlays)
+    
+    st.caption("📱 Use layer control (top-right corner of map) to toggle radar, outlooks, and watches")
 
-    if enhanced_targets:
-        top_target = enhanced_targets[0]
-        st.success(f"🎯 **Top Target**: Score {top_target['score']:.0f} • {top_target['distance_miles']:.0f} miles")
-        if top_target.get('ai_enhanced'):
-            st.write(top_target.get('ai_analysis', 'Analysis unavailable'))
-        
-        for i, target in enumerate(enhanced_targets):
-            st.markdown(f"**{i+1}. {target['name']}** — Score: {target['score']:.0f} | {target['severity']} | {target['distance_miles']:.0f} mi")
-    else:
-        st.warning("No chase-worthy targets in current conditions")
+    with st.expander("⚡ SPC Status & Map Info", expanded=False):
+        spc_col1, spc_col2, spc_col3 = st.columns(3)
+        with spc_col1:
+            st.metric("Day 1 Outlook", "Available", help="Current day convective outlook from SPC")
+            st.caption("🎯 Categorical risk levels visible on map")
+        with spc_col2:
+            st.metric("Active Watches", "Real-time", help="Live tornado and severe thunderstorm watches")
+            st.caption("⚠️ Polygon overlays show active warning areas")
+        with spc_col3:
+            st.metric("Mesoscale Discussions", "Updated", help="SPC mesoscale discussions (MCDs)")
+            st.caption("📋 Areas under enhanced surveillance")
     
-# Add comprehensive layer control for storm chasing
-layer_control = folium.LayerControl(
-    position='topright',
-    collapsed=False
-)
-layer_control.add_to(m)
-
-# Collapsible Legend Control (similar to layer control)
-legend_control_html = '''
-<div id="legend-control" style="position: fixed; 
-                               bottom: 50px; left: 50px; z-index:9999;">
-    <div id="legend-toggle" style="
-        background: white; border: 2px solid #333; padding: 8px 12px; 
-        border-radius: 5px; box-shadow: 0 2px 6px rgba(0,0,0,0.3);
-        cursor: pointer; font-weight: bold; text-align: center;
-        margin-bottom: 5px; user-select: none;
-    ">
-        🏷️ Legend ▼
-    </div>
-        <div id="legend-content" style="
-            width: 220px; background-color: rgba(255, 255, 255, 0.95); 
-            border: 2px solid #333; font-size: 11px; padding: 8px; 
-            border-radius: 5px; box-shadow: 0 4px 8px rgba(0,0,0,0.3);
-            display: block;
-        ">
-            <h4 style="margin: 0 0 8px 0; color: #333; border-bottom: 1px solid #ccc; padding-bottom: 4px;">Storm Chase Legend</h4>
-            
-            <div style="margin-bottom: 6px;"><strong>📶 Radar Reflectivity:</strong></div>
-            <div style="color: #00FF00; margin: 2px 0;">🌧️ Light (20-35 dBZ)</div>
-            <div style="color: #FFFF00; margin: 2px 0;">⛈️ Moderate (35-50 dBZ)</div>
-            <div style="color: #FF8000; margin: 2px 0;">🌩️ Heavy (50-60 dBZ)</div>
-            <div style="color: #FF0000; margin: 2px 0;">⚡ Severe (60+ dBZ)</div>
-            <div style="color: #FF00FF; margin: 2px 0;">🧊 Hail Core (65+ dBZ)</div>
-            
-            <div style="margin: 6px 0 2px 0;"><strong>🎯 SPC Risk Areas:</strong></div>
-            <div style="background: #C0E0C0; padding: 1px 3px; margin: 1px 0;">MARGINAL (1)</div>
-            <div style="background: #FFE066; padding: 1px 3px; margin: 1px 0;">SLIGHT (2)</div>
-            <div style="background: #FF9999; padding: 1px 3px; margin: 1px 0;">ENHANCED (3)</div>
-            <div style="background: #FF6666; padding: 1px 3px; margin: 1px 0;">MODERATE (4)</div>
-            <div style="background: #FF3333; padding: 1px 3px; margin: 1px 0; color: white;">HIGH (5)</div>
-        </div>
-    </div>
+        st.markdown("**Probability Overlays:**")
+        prob_col1, prob_col2 = st.columns(2)
+        with prob_col1:
+            st.markdown("• **🌪️ Tornado Probability** - Shows tornado likelihood areas")
+            st.markdown("• **🧊 Hail Probability** - Significant hail risk zones")
+        with prob_col2:
+            st.markdown("• **⚡ Wind Probability** - Damaging wind potential")
+            st.markdown("• **📋 MCDs** - Areas of enhanced surveillance")
     
-    <script>
-    document.getElementById('legend-toggle').addEventListener('click', function() {
-        var content = document.getElementById('legend-content');
-        var toggle = document.getElementById('legend-toggle');
-        if (content.style.display === 'none') {
-            content.style.display = 'block';
-            toggle.innerHTML = '🏷️ Legend ▼';
-        } else {
-            content.style.display = 'none';
-            toggle.innerHTML = '🏷️ Legend ▶';
-        }
-    });
-    </script>
-    '''
-# Add legend to map (type: ignore for LSP)
-m.get_root().html.add_child(folium.Element(legend_control_html))  # type: ignore[attr-defined]
-    
-# Display comprehensive storm chasing map (full width)
-map_data = st_folium(m, width=None, height=600, key="main_chase_map")
-    
-st.caption("📱 Use layer control (top-right corner of map) to toggle radar, outlooks, and watches")
-
-with st.expander("⚡ SPC Status & Map Info", expanded=False):
-    spc_col1, spc_col2, spc_col3 = st.columns(3)
-    with spc_col1:
-        st.metric("Day 1 Outlook", "Available", help="Current day convective outlook from SPC")
-        st.caption("🎯 Categorical risk levels visible on map")
-    with spc_col2:
-        st.metric("Active Watches", "Real-time", help="Live tornado and severe thunderstorm watches")
-        st.caption("⚠️ Polygon overlays show active warning areas")
-    with spc_col3:
-        st.metric("Mesoscale Discussions", "Updated", help="SPC mesoscale discussions (MCDs)")
-        st.caption("📋 Areas under enhanced surveillance")
-    
-    st.markdown("**Probability Overlays:**")
-    prob_col1, prob_col2 = st.columns(2)
-    with prob_col1:
-        st.markdown("• **🌪️ Tornado Probability** - Shows tornado likelihood areas")
-        st.markdown("• **🧊 Hail Probability** - Significant hail risk zones")
-    with prob_col2:
-        st.markdown("• **⚡ Wind Probability** - Damaging wind potential")
-        st.markdown("• **📋 MCDs** - Areas of enhanced surveillance")
-    
-    st.info("💡 **Pro Tip:** Enable probability layers when targeting specific hazards during a chase")
+        st.info("💡 **Pro Tip:** Enable probability layers when targeting specific hazards during a chase")
+
+
+render_chase_map_panel(lat, lon)
 
 # Weather Parameters Section - Enhanced two-column layout below map
 st.markdown("---")
-header_col, refresh_col = st.columns([5, 1])
-with header_col:
-    st.header("⛈️ Advanced Weather Parameters")
-with refresh_col:
-    st.markdown("<br>", unsafe_allow_html=True)
-    if st.button("🔄 Refresh Data", key="refresh_weather"):
-        st.session_state.pop('cached_weather', None)
-        st.session_state.pop('last_weather_fetch', None)
-        st.rerun()
-st.markdown("Comprehensive meteorological analysis with 16+ professional parameters")
+@st.fragment(run_every=PANEL_REFRESH_SECONDS['parameters'])
+def render_weather_parameters_panel(lat, lon):
+    """Weather parameter panel, refreshed independently of the rest of the page"""
+    weather_data = generate_weather_data(lat, lon)
+    if weather_data:
+        weather_data = {**weather_data, **calculate_composite_indices(weather_data)}
+    header_col, refresh_col = st.columns([5, 1])
+    with header_col:
+        st.header("⛈️ Advanced Weather Parameters")
+    with refresh_col:
+        st.markdown("<br>", unsafe_allow_html=True)
+        if st.button("🔄 Refresh Data", key="refresh_weather"):
+            get_shared_weather_cache().invalidate(quantize_coordinates(lat, lon))
+            st.rerun()
+    st.markdown("Comprehensive meteorological analysis with 16+ professional parameters")
 
-# Two-column layout for weather parameters
-param_col1, param_col2 = st.columns([1, 1])
+    # Two-column layout for weather parameters
+    param_col1, param_col2 = st.columns([1, 1])
 
-with param_col1:
-    st.subheader("🌩️ Primary Parameters")
+    with param_col1:
+        st.subheader("🌩️ Primary Parameters")
     
-    # Add comprehensive diagnostics expander
-    with st.expander("🔬 Advanced Parameter Diagnostics", expanded=False):
-        if weather_data:
-            st.markdown("**📊 Comprehensive Parameter Status:**")
+        # Add comprehensive diagnostics expander
+        with st.expander("🔬 Advanced Parameter Diagnostics", expanded=False):
+            if weather_data:
+                st.markdown("**📊 Comprehensive Parameter Status:**")
             
-            # Group parameters by category
-            base_params = ['CAPE', 'Dewpoint', 'Shear_0_6km', 'CIN', 'SRH_0_1km', 'LCL_Height']
-            phase1_params = ['Mixed_Layer_CAPE', 'SCP', 'STP', 'SRH_0_1km_Enhanced']
-            phase2_params = ['BRN', 'EHI', 'Lapse_Rate_700_500', 'Shear_0_3km', 'Bunkers_Right_U', 'Bunkers_Right_V', 'Storm_Motion_Speed', 'Mean_Wind_0_6km']
+                # Group parameters by category
+                base_params = ['CAPE', 'Dewpoint', 'Shear_0_6km', 'CIN', 'SRH_0_1km', 'LCL_Height']
+                phase1_params = ['Mixed_Layer_CAPE', 'SCP', 'STP', 'SRH_0_1km_Enhanced']
+                phase2_params = ['BRN', 'EHI', 'Lapse_Rate_700_500', 'Shear_0_3km', 'Bunkers_Right_U', 'Bunkers_Right_V', 'Storm_Motion_Speed', 'Mean_Wind_0_6km']
             
-            # Create parameter tables
-            col_diag1, col_diag2, col_diag3 = st.columns(3)
-            
-            with col_diag1:
-                st.markdown("**Base Parameters:**")
-                for param in base_params:
-                    if param in weather_data:
-                        value = weather_data[param]
-                        status = get_parameter_status(value, param)
-                        color = get_status_color(status)
-                        st.markdown(f"<span style='color: {color}'>● {param}: {value:.1f}</span>", unsafe_allow_html=True)
-                    else:
-                        st.markdown(f"❌ {param}: Missing")
-            
-            with col_diag2:
-                st.markdown("**Phase 1 Advanced:**")
-                for param in phase1_params:
-                    if param in weather_data:
-                        value = weather_data[param]
-                        status = get_parameter_status(value, param)
-                        color = get_status_color(status)
-                        st.markdown(f"<span style='color: {color}'>● {param}: {value:.2f}</span>", unsafe_allow_html=True)
-                    else:
-                        st.markdown(f"❌ {param}: Missing")
+                # Create parameter tables
+                col_diag1, col_diag2, col_diag3 = st.columns(3)
             
-            with col_diag3:
-                st.markdown("**Phase 2 Professional:**")
-                for param in phase2_params:
-                    if param in weather_data:
-                        value = weather_data[param]
-                        if param in ['Bunkers_Right_U', 'Bunkers_Right_V']:
-                            st.markdown(f"<span style='color: #17a2b8'>● {param}: {value:.1f}</span>", unsafe_allow_html=True)
-                        else:
+                with col_diag1:
+                    st.markdown("**Base Parameters:**")
+                    for param in base_params:
+                        if param in weather_data:
+                            value = weather_data[param]
                             status = get_parameter_status(value, param)
                             color = get_status_color(status)
                             st.markdown(f"<span style='color: {color}'>● {param}: {value:.1f}</span>", unsafe_allow_html=True)
-                    else:
-                        st.markdown(f"❌ {param}: Missing")
+                        else:
+                            st.markdown(f"❌ {param}: Missing")
             
-            # Parameter availability summary
-            total_params = len(THRESHOLDS)
-            available_params = sum(1 for param in THRESHOLDS.keys() if param in weather_data)
-            st.success(f"**Parameter Coverage: {available_params}/{total_params} ({(available_params/total_params)*100:.1f}%)**")
-        else:
-            st.error("⚠️ Weather data unavailable for diagnostics")
+                with col_diag2:
+                    st.markdown("**Phase 1 Advanced:**")
+                    for param in phase1_params:
+                        if param in weather_data:
+                            value = weather_data[param]
+                            status = get_parameter_status(value, param)
+                            color = get_status_color(status)
+                            st.markdown(f"<span style='color: {color}'>● {param}: {value:.2f}</span>", unsafe_allow_html=True)
+                        else:
+                            st.markdown(f"❌ {param}: Missing")
+            
+                with col_diag3:
+                    st.markdown("**Phase 2 Professional:**")
+                    for param in phase2_params:
+                        if param in weather_data:
+                            value = weather_data[param]
+                            if param in ['Bunkers_Right_U', 'Bunkers_Right_V']:
+                                st.markdown(f"<span style='color: #17a2b8'>● {param}: {value:.1f}</span>", unsafe_allow_html=True)
+                            else:
+                                status = get_parameter_status(value, param)
+                                color = get_status_color(status)
+                                st.markdown(f"<span style='color: {color}'>● {param}: {value:.1f}</span>", unsafe_allow_html=True)
+                        else:
+                            st.markdown(f"❌ {param}: Missing")
+            
+                # Parameter availability summary
+                total_params = len(THRESHOLDS)
+                available_params = sum(1 for param in THRESHOLDS.keys() if param in weather_data)
+                st.success(f"**Parameter Coverage: {available_params}/{total_params} ({(available_params/total_params)*100:.1f}%)**")
+            else:
+                st.error("⚠️ Weather data unavailable for diagnostics")
     
-    # Display primary parameters
-    if weather_data:
-        primary_params = ['CAPE', 'Mixed_Layer_CAPE', 'Dewpoint', 'Shear_0_6km', 'CIN', 'SRH_0_1km']
-        for param_name in primary_params:
-            if param_name in weather_data and param_name in THRESHOLDS:
-                param_info = THRESHOLDS[param_name]
-                value = weather_data[param_name]
-                status = get_parameter_status(value, param_name)
-                color = get_status_color(status)
+        # Display primary parameters
+        if weather_data:
+            primary_params = ['CAPE', 'Mixed_Layer_CAPE', 'Dewpoint', 'Shear_0_6km', 'CIN', 'SRH_0_1km']
+            for param_name in primary_params:
+                if param_name in weather_data and param_name in THRESHOLDS:
+                    param_info = THRESHOLDS[param_name]
+                    value = weather_data[param_name]
+                    status = get_parameter_status(value, param_name)
+                    color = get_status_color(status)
                 
-                # Format parameter name for display
-                display_name = param_name.replace('_', '-')
-                unit = param_info['unit']
-                threshold = param_info['threshold']
-                operator = param_info['operator']
+                    # Format parameter name for display
+                    display_name = param_name.replace('_', '-')
+                    unit = param_info['unit']
+                    threshold = param_info['threshold']
+                    operator = param_info['operator']
                 
-                # Create threshold description
-                if operator == 'between':
-                    threshold_desc = f"{threshold[0]}-{threshold[1]} {unit}"
-                else:
-                    threshold_desc = f"{operator} {threshold} {unit}"
+                    # Create threshold description
+                    if operator == 'between':
+                        threshold_desc = f"{threshold[0]}-{threshold[1]} {unit}"
+                    else:
+                        threshold_desc = f"{operator} {threshold} {unit}"
                 
-                # Display parameter with color coding
-                st.markdown(f"""
-                <div style="
-                    padding: 10px; 
-                    margin: 5px 0; 
-                    border-left: 5px solid {color}; 
-                    background-color: rgba(255,255,255,0.1);
-                    border-radius: 5px;
-                ">
-                    <strong>{display_name}:</strong> {value:.1f} {unit}<br>
-                    <small>Target: {threshold_desc} | Status: <span style="color: {color}; font-weight: bold;">{status.upper() if status else 'UNKNOWN'}</span></small>
-                </div>
-                """, unsafe_allow_html=True)
-    else:
-        st.error("⚠️ Weather data unavailable - check API connections")
+                    # Display parameter with color coding
+                    st.markdown(f"""
+                    <div style="
+                        padding: 10px; 
+                        margin: 5px 0; 
+                        border-left: 5px solid {color}; 
+                        background-color: rgba(255,255,255,0.1);
+                        border-radius: 5px;
+                    ">
+                        <strong>{display_name}:</strong> {value:.1f} {unit}<br>
+                        <small>Target: {threshold_desc} | Status: <span style="color: {color}; font-weight: bold;">{status.upper() if status else 'UNKNOWN'}</span></small>
+                    </div>
+                    """, unsafe_allow_html=True)
+        else:
+            st.error("⚠️ Weather data unavailable - check API connections")
 
-with param_col2:
-    st.subheader("🎯 Composite Indices")
+    with param_col2:
+        st.subheader("🎯 Composite Indices")
     
-    # Display composite parameters
-    if weather_data:
-        composite_params = ['SCP', 'STP', 'EHI', 'BRN', 'Lapse_Rate_700_500', 'Shear_0_3km']
-        for param_name in composite_params:
-            if param_name in weather_data and param_name in THRESHOLDS:
-                param_info = THRESHOLDS[param_name]
-                value = weather_data[param_name]
-                status = get_parameter_status(value, param_name)
-                color = get_status_color(status)
+        # Display composite parameters
+        if weather_data:
+            composite_params = ['SCP', 'STP', 'EHI', 'BRN', 'Lapse_Rate_700_500', 'Shear_0_3km']
+            for param_name in composite_params:
+                if param_name in weather_data and param_name in THRESHOLDS:
+                    param_info = THRESHOLDS[param_name]
+                    value = weather_data[param_name]
+                    status = get_parameter_status(value, param_name)
+                    color = get_status_color(status)
                 
-                # Format parameter name for display
-                display_name = param_name.replace('_', '-')
-                unit = param_info['unit']
-                threshold = param_info['threshold']
-                operator = param_info['operator']
+                    # Format parameter name for display
+                    display_name = param_name.replace('_', '-')
+                    unit = param_info['unit']
+                    threshold = param_info['threshold']
+                    operator = param_info['operator']
                 
-                # Create threshold description
-                if operator == 'between':
-                    threshold_desc = f"{threshold[0]}-{threshold[1]} {unit}"
-                else:
-                    threshold_desc = f"{operator} {threshold} {unit}"
+                    # Create threshold description
+                    if operator == 'between':
+                        threshold_desc = f"{threshold[0]}-{threshold[1]} {unit}"
+                    else:
+                        threshold_desc = f"{operator} {threshold} {unit}"
                 
-                # Display parameter with color coding
-                st.markdown(f"""
-                <div style="
-                    padding: 10px; 
-                    margin: 5px 0; 
-                    border-left: 5px solid {color}; 
-                    background-color: rgba(255,255,255,0.1);
-                    border-radius: 5px;
-                ">
-                    <strong>{display_name}:</strong> {value:.2f} {unit}<br>
-                    <small>Target: {threshold_desc} | Status: <span style="color: {color}; font-weight: bold;">{status.upper() if status else 'UNKNOWN'}</span></small>
-                </div>
-                """, unsafe_allow_html=True)
-    else:
-        st.error("⚠️ Weather data unavailable - check API connections")
+                    # Display parameter with color coding
+                    st.markdown(f"""
+                    <div style="
+                        padding: 10px; 
+                        margin: 5px 0; 
+                        border-left: 5px solid {color}; 
+                        background-color: rgba(255,255,255,0.1);
+                        border-radius: 5px;
+                    ">
+                        <strong>{display_name}:</strong> {value:.2f} {unit}<br>
+                        <small>Target: {threshold_desc} | Status: <span style="color: {color}; font-weight: bold;">{status.upper() if status else 'UNKNOWN'}</span></small>
+                    </div>
+                    """, unsafe_allow_html=True)
+        else:
+            st.error("⚠️ Weather data unavailable - check API connections")
+
+render_weather_parameters_panel(lat, lon)
 
 # Bottom section continues
 st.markdown("---")
@@ -2467,12 +4617,12 @@ st.markdown("---")
 # Two larger columns for radar and mesoscale sectors (enhanced visibility)
 col3, col4 = st.columns(2)
 
-with col3:
+@st.fragment(run_every=PANEL_REFRESH_SECONDS['radar'])
+def render_radar_panel(lat, lon, station_id, station_info, futures):
+    """Radar loop panel, refreshed independently of the rest of the page"""
     st.header("📡 Radar Data")
     
-    # Get closest radar station
-    station_id, station_info = get_radar_stations_near_location(lat, lon)
-    
+    # Closest radar station was resolved before the panel fetches started
     if station_id and station_info:
         # Display station info with distance warning if applicable
         if station_info.get('out_of_range'):
@@ -2498,7 +4648,8 @@ with col3:
                 "N0C": "💨 Low-Level Velocity (0.5° Tilt)",
                 "N0X": "⚡ Differential Phase (Advanced Analysis)"
             }[x],
-            help="Detailed radar analysis - complements real-time map layers above"
+            help="Detailed radar analysis - complements real-time map layers above",
+            key="radar_product"
         )
         
         # Radar comparison note
@@ -2523,16 +4674,24 @@ with col3:
             st.markdown(f"🟢 **Live NEXRAD** • Range: ~230mi • Updated: ~6min")
         with radar_col2:
             if st.button("🔄 Refresh", key="refresh_radar", help="Force reload radar data"):
-                st.rerun()
+                st.rerun(scope="fragment")
         
         # Fetch and display real-time radar image
         with st.spinner(f"🛰️ Loading live {radar_product} radar..."):
-            radar_data = fetch_radar_image(station_id, radar_product)
+            radar_data = fragment_panel_data(futures, 'radar', fetch_radar_image, (station_id, radar_product))
+            shown_station, shown_name = station_id, station_info['name']
+            # Fall back to the closest ranked backup station (one attempt keeps the panel responsive)
+            for alternate in station_info.get('alternates', [])[:1]:
+                if not radar_data:
+                    radar_data = fetch_radar_image(alternate['id'], radar_product)
+                    if radar_data:
+                        shown_station, shown_name = alternate['id'], alternate['name']
+                        st.info(f"📡 {station_id} unavailable - showing backup station {shown_station} ({alternate['distance_km']:.0f}km away)")
             
         if radar_data:
             try:
                 # Display animated GIF directly to preserve radar loop animation
-                st.image(radar_data, caption=f"🎯 Live {radar_product} from {station_id} • {station_info['name']}", width="stretch")
+                st.image(radar_data, caption=f"🎯 Live {radar_product} from {shown_station} • {shown_name}", width="stretch")
                 
                 # Add time warning for critical products
                 if radar_product in ['N0V', 'N0S', 'DVL']:
@@ -2566,17 +4725,17 @@ with col3:
         
         # Show available stations as backup
         if st.button("🗺️ Show Available Stations", key="show_stations"):
-            st.markdown("**Available NEXRAD Stations:**")
-            stations_info = {
-                'KOAX': 'Omaha, NE - Prime for Nebraska chasing',
-                'KGLD': 'Goodland, KS - Western Kansas coverage', 
-                'KUEX': 'Hastings, NE - Central Nebraska',
-                'KEAX': 'Kansas City, MO - Eastern Kansas/Missouri'
-            }
-            for station, desc in stations_info.items():
-                st.markdown(f"- **{station}**: {desc}")
+            st.markdown("**Closest NEXRAD Stations:**")
+            station_index = get_radar_station_index()
+            for station, distance_km in station_index.nearest(lat, lon, k=5):
+                st.markdown(f"- **{station}**: {station_index.stations[station]['name']} ({distance_km:.0f}km away)")
 
-with col4:
+with col3:
+    render_radar_panel(lat, lon, station_id, station_info, panel_futures)
+
+@st.fragment(run_every=PANEL_REFRESH_SECONDS['goes'])
+def render_goes_panel(futures):
+    """GOES mesoscale sector panel, refreshed independently of the rest of the page"""
     st.header("🛰️ GOES Mesoscale Sectors")
     
     # Mesoscale sector status and refresh
@@ -2585,11 +4744,11 @@ with col4:
         st.markdown("🎯 **Live Mesoscale** • Storm-Focused • 30-60sec Updates")
     with meso_col2:
         if st.button("🔄 Refresh", key="refresh_mesoscale", help="Force reload mesoscale data"):
-            st.rerun()
+            st.rerun(scope="fragment")
     
     # Fetch and display mesoscale sector
     with st.spinner("🎯 Loading active mesoscale sectors..."):
-        mesoscale_data = get_goes_mesoscale_sectors()
+        mesoscale_data = fragment_panel_data(futures, 'goes', get_goes_mesoscale_sectors, ())
         
     if mesoscale_data:
         try:
@@ -2629,73 +4788,86 @@ with col4:
         **During severe weather:** These sectors update every 30-60 seconds!
         """)
 
+with col4:
+    render_goes_panel(panel_futures)
+
 # Separate row for HRRR model data (moved down for better visual organization)
 st.markdown("---")
 
-st.header("🌡️ HRRR Weather Model")
-st.caption("High-resolution numerical weather prediction model for short-term forecasting")
+@st.fragment(run_every=PANEL_REFRESH_SECONDS['hrrr'])
+def render_hrrr_panel(lat, lon, futures):
+    """HRRR forecast panel, refreshed independently of the rest of the page"""
+    st.header("🌡️ HRRR Weather Model")
+    st.caption("High-resolution numerical weather prediction model for short-term forecasting")
 
-# Full-width HRRR section with better layout
-hrrr_col1, hrrr_col2 = st.columns([3, 1])
+    # Full-width HRRR section with better layout
+    hrrr_col1, hrrr_col2 = st.columns([3, 1])
 
-with hrrr_col2:
-    # Forecast hour selection
-    forecast_hour = st.selectbox("Forecast Hour", [0, 1, 3, 6, 12, 18], 
-                                format_func=lambda x: f"{x}hr" if x > 0 else "Analysis",
-                                help="Select forecast time - 0hr shows current conditions")
+    with hrrr_col2:
+        # Forecast hour selection
+        forecast_hour = st.selectbox("Forecast Hour", [0, 1, 3, 6, 12, 18], 
+                                    format_func=lambda x: f"{x}hr" if x > 0 else "Analysis",
+                                    help="Select forecast time - 0hr shows current conditions",
+                                    key="hrrr_forecast_hour")
 
-with hrrr_col1:
-    st.markdown("🌤️ **Live HRRR Model** • 3km Resolution • Hourly Updates")
+    with hrrr_col1:
+        st.markdown("🌤️ **Live HRRR Model** • 3km Resolution • Hourly Updates")
 
-# Fetch and display HRRR data
-with st.spinner("Loading HRRR model data..."):
-    hrrr_data = get_hrrr_data(lat, lon, forecast_hour)
+    # Fetch and display HRRR data
+    with st.spinner("Loading HRRR model data..."):
+        hrrr_data = fragment_panel_data(futures, 'hrrr', get_hrrr_data, (lat, lon, forecast_hour))
     
-if hrrr_data and hrrr_data.get('source') != 'API_UNAVAILABLE':
-    st.markdown("**NOAA/NWS Forecast Data:**")
+    if hrrr_data and hrrr_data.get('source') != 'API_UNAVAILABLE':
+        st.markdown("**NOAA/NWS Forecast Data:**")
     
-    # Display real weather parameters
-    col5a, col5b = st.columns(2)
+        # Display real weather parameters
+        col5a, col5b = st.columns(2)
     
-    with col5a:
-        if hrrr_data.get('temperature_2m'):
-            st.metric("Temperature", f"{hrrr_data['temperature_2m']}°F")
-        if hrrr_data.get('wind_speed_10m'):
-            wind_speed = hrrr_data['wind_speed_10m']
-            # Extract number if it's a string like "15 mph"
-            if isinstance(wind_speed, str):
-                wind_speed = wind_speed.split()[0] if wind_speed.split() else "Unknown"
-            st.metric("Wind Speed", f"{wind_speed} mph")
+        with col5a:
+            if hrrr_data.get('temperature_2m'):
+                st.metric("Temperature", f"{hrrr_data['temperature_2m']}°F")
+            if hrrr_data.get('wind_speed_10m'):
+                wind_speed = hrrr_data['wind_speed_10m']
+                # Extract number if it's a string like "15 mph"
+                if isinstance(wind_speed, str):
+                    wind_speed = wind_speed.split()[0] if wind_speed.split() else "Unknown"
+                st.metric("Wind Speed", f"{wind_speed} mph")
     
-    with col5b:
-        if hrrr_data.get('wind_direction_10m'):
-            st.metric("Wind Direction", hrrr_data['wind_direction_10m'])
-        st.metric("Data Source", hrrr_data.get('source', 'NOAA/NWS'))
-        
-    # Show detailed forecast if available
-    if hrrr_data.get('forecast_text'):
-        with st.expander("🌍 Detailed Forecast"):
-            st.info(hrrr_data['forecast_text'])
+        with col5b:
+            if hrrr_data.get('wind_direction_10m'):
+                st.metric("Wind Direction", hrrr_data['wind_direction_10m'])
+            st.metric("Data Source", hrrr_data.get('source', 'NOAA/NWS'))
+        
+        # Show detailed forecast if available
+        if hrrr_data.get('forecast_text'):
+            with st.expander("🌍 Detailed Forecast"):
+                st.info(hrrr_data['forecast_text'])
     
-    st.success(f"🌡️ Real-time NOAA forecast for {lat:.2f}, {lon:.2f}")
-else:
-    st.warning("⚠️ NOAA forecast data unavailable - check internet connection")
-    st.info("The dashboard requires internet access for real-time weather data")
+        st.success(f"🌡️ Real-time NOAA forecast for {lat:.2f}, {lon:.2f}")
+    else:
+        st.warning("⚠️ NOAA forecast data unavailable - check internet connection")
+        st.info("The dashboard requires internet access for real-time weather data")
     
-    # Show SPC status even when HRRR is unavailable
-    st.markdown("---")
-    st.markdown("### ⚡ Storm Prediction Center Status (Independent)")
-    st.success("🎯 **SPC overlays remain active** on the interactive map above")
-    st.info("Day 1-2 outlooks, watches, and MCDs continue to update regardless of HRRR data availability")
+        # Show SPC status even when HRRR is unavailable
+        st.markdown("---")
+        st.markdown("### ⚡ Storm Prediction Center Status (Independent)")
+        st.success("🎯 **SPC overlays remain active** on the interactive map above")
+        st.info("Day 1-2 outlooks, watches, and MCDs continue to update regardless of HRRR data availability")
+
+render_hrrr_panel(lat, lon, panel_futures)
 
 # Voice Alert System - Check for tornado warnings
-current_time = time.time()
-if current_time - st.session_state.last_warning_check > 60:  # Check every minute
-    st.session_state.last_warning_check = current_time
-    tornado_warnings = check_tornado_warnings(lat, lon, 50)  # 50 mile radius
+@st.fragment(run_every=PANEL_REFRESH_SECONDS['warnings'])
+def render_tornado_warning_check(lat, lon, futures):
+    """Announce tornado warnings near the chaser once each, checking at most once a minute"""
+    if tornado_warning_check_due():
+        st.session_state.last_warning_check = time.time()
+        tornado_warnings = fragment_panel_data(futures, 'tornado_warnings', check_tornado_warnings, (lat, lon, 50), [])
     
-    for warning in tornado_warnings:
-        display_voice_alert(warning)
+        for warning in unannounced_tornado_warnings(tornado_warnings, st.session_state.announced_warnings):
+            display_voice_alert(warning)
+
+render_tornado_warning_check(lat, lon, panel_futures)
 
 # Additional sections for storm reports and composite indices
 st.markdown("---")
@@ -2705,13 +4877,17 @@ st.markdown("---")
 col6, col7 = st.columns(2)
 
 # Storm Reports Section
-with col6:
+@st.fragment(run_every=PANEL_REFRESH_SECONDS['alerts'])
+def render_alerts_panel(lat, lon, futures):
+    """Alerts and storm reports panel, refreshed independently of the rest of the page"""
     st.header("⚡ Storm Reports & Alerts")
     
     # Get NWS alerts
     with st.spinner("Loading alerts and reports..."):
-        alerts = get_nws_alerts(lat, lon, 100)
-        storm_reports = get_spc_storm_reports()
+        alerts = fragment_panel_data(futures, 'alerts', get_nws_alerts, (lat, lon, 100), [])
+        storm_reports = fragment_panel_data(
+            futures, 'storm_reports', get_spc_storm_reports, (), empty_storm_reports()
+        )
     
     # Display active alerts
     if alerts:
@@ -2744,35 +4920,52 @@ with col6:
     
     report_tabs = st.tabs(["🌪️ Tornado", "🧊 Hail", "💨 Wind"])
     
-    with report_tabs[0]:
-        tornado_reports = storm_reports.get('tornado', [])
-        if tornado_reports:
-            for report in tornado_reports[:5]:
-                st.markdown(f"**{report['time']}** - {report['location']}")
-                st.markdown(f"Magnitude: {report['magnitude']}")
-        else:
-            st.info("No tornado reports today")
-    
-    with report_tabs[1]:
-        hail_reports = storm_reports.get('hail', [])
-        if hail_reports:
-            for report in hail_reports[:5]:
-                st.markdown(f"**{report['time']}** - {report['location']}")
-                st.markdown(f"Size: {report['magnitude']}")
-        else:
-            st.info("No hail reports today")
-    
-    with report_tabs[2]:
-        wind_reports = storm_reports.get('wind', [])
-        if wind_reports:
-            for report in wind_reports[:5]:
-                st.markdown(f"**{report['time']}** - {report['location']}")
-                st.markdown(f"Speed: {report['magnitude']}")
-        else:
-            st.info("No wind reports today")
+    report_labels = [('tornado', 'Magnitude'), ('hail', 'Size'), ('wind', 'Speed')]
+    for tab, (report_type, magnitude_label) in zip(report_tabs, report_labels):
+        with tab:
+            reports = storm_reports.get(report_type)
+            if reports is not None and len(reports):
+                st.caption(f"{len(reports)} {report_type} reports so far")
+                for report in reports.sort_values('valid', ascending=False).head(5).itertuples():
+                    st.markdown(f"**{report.time}** - {report.location}, {report.state}")
+                    st.markdown(f"{magnitude_label}: {report.magnitude}")
+            else:
+                st.info(f"No {report_type} reports today")
+
+    # Reports near the chaser and the chase targets, from the multi-day report index
+    st.markdown("**📡 Reports Near You:**")
+    near_col1, near_col2 = st.columns(2)
+    with near_col1:
+        near_radius = st.select_slider("Radius (miles)", options=[10, 25, 50, 100, 200], value=50, key="report_radius")
+    with near_col2:
+        near_window = st.selectbox("Time window", list(STORM_REPORT_LOOKBACK_HOURS), key="report_window")
+    since = time.time() - STORM_REPORT_LOOKBACK_HOURS[near_window] * 3600
+
+    report_index = get_storm_report_index()
+    nearby = report_index.query(lat, lon, near_radius, since)
+    if len(nearby):
+        counts = nearby['type'].value_counts()
+        st.warning(f"{len(nearby)} reports within {near_radius} mi: " + ", ".join(
+            f"{counts.get(report_type, 0)} {report_type}" for report_type in SPC_REPORT_FILES
+        ))
+        for report in nearby.head(5).itertuples():
+            st.markdown(f"**{report.valid:%H:%M}Z** {report.type} {report.magnitude} - {report.location}, {report.state} ({report.distance_miles:.0f} mi)")
+    else:
+        st.info(f"No reports within {near_radius} miles ({near_window.lower()})")
+
+    for target in (st.session_state.get('cached_targets') or [])[:5]:
+        target_reports = report_index.query(target['lat'], target['lon'], near_radius, since)
+        if len(target_reports):
+            st.caption(f"🎯 {target['name']}: {len(target_reports)} reports within {near_radius} mi")
+
+with col6:
+    render_alerts_panel(lat, lon, panel_futures)
 
 # Composite Indices Section
-with col7:
+@st.fragment(run_every=PANEL_REFRESH_SECONDS['composite'])
+def render_composite_panel(lat, lon):
+    """Composite index panel, refreshed independently of the rest of the page"""
+    weather_data = generate_weather_data(lat, lon)
     st.header("🌀 Composite Indices")
     st.markdown("Advanced severe weather parameters for storm forecasting")
     
@@ -2841,6 +5034,9 @@ with col7:
     else:
         st.success(f"✅ LOW severe weather potential: {severe_potential:.0f}%")
 
+with col7:
+    render_composite_panel(lat, lon)
+
 # AI Features Section
 st.markdown("---")
 
@@ -2858,9 +5054,12 @@ with voice_col1:
 with voice_col2:
     if st.button("🤖 Ask AI", key="ask_voice_assistant"):
         if voice_query:
-            with st.spinner("AI Assistant thinking..."):
-                ai_response = get_voice_assistant_response(voice_query, weather_data, lat, lon)
-                st.success(f"**AI Assistant:** {ai_response}")
+            # Render tokens as they arrive and speak each sentence as soon as it is complete
+            st.markdown("**AI Assistant:**")
+            speech_container = st.container()
+            st.write_stream(speak_streamed_response(
+                stream_voice_assistant_response(voice_query, weather_data, lat, lon), speech_container
+            ))
         else:
             st.warning("Please enter a question first!")
 
@@ -2932,11 +5131,12 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-# Auto-refresh indicator
+# Auto-refresh indicator: each panel refreshes on its own cadence
+refresh_range = f"{min(PANEL_REFRESH_SECONDS.values())}s–{max(PANEL_REFRESH_SECONDS.values()) // 60}min"
 with st.container():
-    st.markdown("""
+    st.markdown(f"""
     <div style='position: fixed; top: 10px; right: 10px; background: rgba(0,0,0,0.7); color: white; padding: 5px 10px; border-radius: 5px; font-size: 12px;'>
-        🔄 Auto-refresh: 30s
+        🔄 Panels auto-refresh: {refresh_range}
     </div>
     
     <!-- GPS Integration Complete - External file handles all GPS functionality -->
@@ -369,6 +369,8 @@ class StormChaseGPSTracker {
 
 // Initialize GPS tracker when page loads
 document.addEventListener('DOMContentLoaded', () => {
+  // Speech-only component frames load this file for queueVoiceSentence and skip GPS tracking
+  if (window.stormChaseVoiceFrame) return;
   console.log('Initializing Storm Chase GPS Tracker...');
   window.stormChaseGPS = new StormChaseGPSTracker();
 });
@@ -377,4 +379,39 @@ document.addEventListener('DOMContentLoaded', () => {
 window.toggleGPSTracking = () => window.stormChaseGPS?.toggleTracking();
 window.addGPSPosition = () => window.stormChaseGPS?.addCurrentPosition();
 window.toggleVoiceAlerts = () => window.stormChaseGPS?.toggleVoiceAlerts();
-window.announceTornadoWarning = (warning) => window.stormChaseGPS?.announceTornadoWarning(warning);
\ No newline at end of file
+window.announceTornadoWarning = (warning) => window.stormChaseGPS?.announceTornadoWarning(warning);
+
+// Progressive speech for streamed assistant answers
+function voiceSynthesis() {
+  // Speak from the top page so queued sentences outlive the component frame that sent them
+  try {
+    if (window.parent && window.parent.speechSynthesis) return window.parent.speechSynthesis;
+  } catch (error) {
+    // Cross-origin parent: fall back to this frame
+  }
+  return window.speechSynthesis;
+}
+
+window.queueVoiceSentence = (sentence, startNew = false) => {
+  const synth = voiceSynthesis();
+  if (!synth || localStorage.getItem('voice_alerts') === 'disabled') return;
+  
+  // A new answer interrupts the previous one; later sentences queue behind it
+  if (startNew) {
+    synth.cancel();
+  }
+  
+  const utterance = new SpeechSynthesisUtterance(sentence);
+  utterance.volume = 0.8;
+  
+  const voices = synth.getVoices();
+  const preferredVoice = voices.find(voice => 
+    voice.lang.startsWith('en') && voice.name.includes('Siri')
+  ) || voices.find(voice => voice.lang.startsWith('en'));
+  
+  if (preferredVoice) {
+    utterance.voice = preferredVoice;
+  }
+  
+  synth.speak(utterance);
+};
@@ -0,0 +1,25 @@
+import ast
+import os
+
+import pytest
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+
+@pytest.fixture(scope="session")
+def app(tmp_path_factory):
+    """Functions, classes and constants of app.py, loaded without running the page itself"""
+    os.environ["STORM_CHASE_CACHE_PATH"] = str(tmp_path_factory.mktemp("cache") / "responses.sqlite3")
+    with open(APP_PATH, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), APP_PATH)
+    definitions = []
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom, ast.FunctionDef, ast.ClassDef)):
+            definitions.append(node)
+        elif isinstance(node, ast.Assign) and all(
+            isinstance(target, ast.Name) and target.id.isupper() for target in node.targets
+        ):
+            definitions.append(node)
+    namespace = {"__name__": "app"}
+    exec(compile(ast.Module(body=definitions, type_ignores=[]), APP_PATH, "exec"), namespace)
+    return namespace
@@ -0,0 +1,37 @@
+WEATHER = dict(CAPE=3012, Shear_0_6km=47, Dewpoint=66.3, CIN=-31, SRH_0_1km=212, LCL_Height=980,
+               Temperature=85, Wind_Speed=10, Wind_Direction=180, Pressure=1005, Humidity=60)
+NEARBY_WEATHER = dict(WEATHER, CAPE=3040, Shear_0_6km=46.2, Dewpoint=66.6, SRH_0_1km=208)
+
+
+def make_targets(app, weather, lat, lon, score):
+    composite_indices = app['calculate_composite_indices'](weather)
+    return [{
+        'lat': lat, 'lon': lon, 'name': 'Target 1', 'score': score, 'distance_miles': 43.2,
+        'weather_data': weather, 'composite_indices': composite_indices,
+        'storm_mode': 'Supercells Favored', 'target_type': 'Supercell Likely',
+        'reasoning': app['generate_enhanced_target_reasoning'](
+            weather, composite_indices, 'Supercells Favored', 'Supercell Likely', score
+        ),
+    }]
+
+
+def captured_request(app, monkeypatch, targets, weather):
+    requests = []
+    monkeypatch.setitem(app, 'get_openai_client', lambda: object())
+    monkeypatch.setitem(app, 'cached_chat_completion', lambda client, **request: requests.append(request) or "ok")
+    app['target_ai_analysis'](targets, weather)
+    return requests[0]
+
+
+def test_nearly_identical_targets_share_cache_key(app, monkeypatch):
+    first = captured_request(app, monkeypatch, make_targets(app, WEATHER, 41.312, -96.318, 71.2), WEATHER)
+    second = captured_request(app, monkeypatch, make_targets(app, NEARBY_WEATHER, 41.296, -96.336, 72.1), NEARBY_WEATHER)
+    # The raw reasoning strings differ, so only the quantized prompt can make the keys match
+    assert make_targets(app, WEATHER, 0, 0, 71.2)[0]['reasoning'] != make_targets(app, NEARBY_WEATHER, 0, 0, 72.1)[0]['reasoning']
+    assert app['chat_request_key'](first) == app['chat_request_key'](second)
+
+
+def test_different_targets_get_different_cache_keys(app, monkeypatch):
+    first = captured_request(app, monkeypatch, make_targets(app, WEATHER, 41.3, -96.3, 71.2), WEATHER)
+    second = captured_request(app, monkeypatch, make_targets(app, WEATHER, 42.3, -96.3, 71.2), WEATHER)
+    assert app['chat_request_key'](first) != app['chat_request_key'](second)
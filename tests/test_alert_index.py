@@ -0,0 +1,38 @@
+VALLEY = (41.3114, -96.3439)
+
+
+def square(lat, lon, half=0.1):
+    return {
+        'type': 'Polygon',
+        'coordinates': [[
+            [lon - half, lat - half], [lon + half, lat - half], [lon + half, lat + half],
+            [lon - half, lat + half], [lon - half, lat - half],
+        ]],
+    }
+
+
+def alert(event, geometry=None, ugc=()):
+    return {
+        'id': f'https://api.weather.gov/alerts/urn:oid:{event}',
+        'geometry': geometry,
+        'properties': {'event': event, 'geocode': {'UGC': list(ugc)}, 'affectedZones': []},
+    }
+
+
+def test_alerts_with_their_own_polygon_are_matched_by_distance(app):
+    near = alert('Flash Flood Warning', square(41.35, -96.30), ['NEC055'])
+    far = alert('Flash Flood Warning', square(37.19, -100.85), ['KSC175'])  # Seward County, KS
+    index = app['AlertGeometryIndex']([near, far])
+
+    assert index.unlocated == []
+    assert [feature for feature, _ in index.near(*VALLEY, 100)] == [near]
+    assert index.unlocated_near(*VALLEY, 100) == []
+
+
+def test_alerts_without_geometry_fall_back_to_states(app):
+    advisory = alert('Wind Advisory', ugc=['NEZ051'])
+    elsewhere = alert('Wind Advisory', ugc=['TXZ001'])
+    index = app['AlertGeometryIndex']([advisory, elsewhere])
+
+    assert index.near(*VALLEY, 100) == []
+    assert index.unlocated_near(*VALLEY, 100) == [advisory]
@@ -0,0 +1,46 @@
+from datetime import datetime, timedelta, timezone
+
+CSV = b'Time,F_Scale,Location,County,State,Lat,Lon,Comments\n2130,EF1,2 N Valley,Douglas,NE,41.34,-96.35,Brief touchdown\n'
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.status_code = 200
+        self.content = content
+
+
+def fake_spc(app, monkeypatch):
+    requested = []
+
+    def http_get(url, timeout=None, headers=None):
+        requested.append(url)
+        return FakeResponse(CSV)
+
+    monkeypatch.setitem(app, 'http_get', http_get)
+    return requested
+
+
+def test_past_report_day_is_final_after_one_sync(app, monkeypatch):
+    requested = fake_spc(app, monkeypatch)
+    store = app['StormReportStore']()
+    past = (datetime.now(timezone.utc) - timedelta(days=5)).strftime('%y%m%d')
+
+    assert len(store.reports(past)['tornado']) == 1
+    assert len(requested) == len(app['SPC_REPORT_FILES'])
+
+    # Neither the render path nor a forced scheduler refresh goes back to SPC for a closed day
+    requested.clear()
+    store.reports(past)
+    store.reports(past, refresh=True)
+    assert requested == []
+
+
+def test_current_report_day_keeps_syncing(app, monkeypatch):
+    requested = fake_spc(app, monkeypatch)
+    store = app['StormReportStore']()
+    today = app['spc_report_dates']()[0]
+
+    store.reports(today)
+    requested.clear()
+    store.reports(today, refresh=True)
+    assert len(requested) == len(app['SPC_REPORT_FILES'])
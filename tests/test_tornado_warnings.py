@@ -0,0 +1,41 @@
+NWS_ALERTS = 'https://api.weather.gov/alerts/'
+
+
+def tornado_warning(urn, references=()):
+    """Alert feature shaped like api.weather.gov output: a URL id on top, the bare urn in properties"""
+    return {
+        'id': NWS_ALERTS + urn,
+        'properties': {
+            'id': urn,
+            'event': 'Tornado Warning',
+            'headline': f'Tornado Warning {urn}',
+            'references': [{'@id': NWS_ALERTS + ref, 'identifier': ref, 'sender': 'w-nws.webmaster@noaa.gov'} for ref in references],
+        },
+    }
+
+
+def check(app, monkeypatch, features):
+    monkeypatch.setitem(app, 'nearby_alerts', lambda *args, **kwargs: [(feature, 3.0) for feature in features])
+    return app['check_tornado_warnings'](41.3, -96.3)
+
+
+def test_update_to_announced_warning_stays_quiet(app, monkeypatch):
+    announced = set()
+    original = tornado_warning('urn:oid:2.49.0.1.840.0.aaa.001.1')
+    first = app['unannounced_tornado_warnings'](check(app, monkeypatch, [original]), announced)
+    assert [warning['id'] for warning in first] == ['urn:oid:2.49.0.1.840.0.aaa.001.1']
+
+    # The CON update replaces the original in the active list and references it by urn
+    update = tornado_warning('urn:oid:2.49.0.1.840.0.aaa.002.1', ['urn:oid:2.49.0.1.840.0.aaa.001.1'])
+    assert app['unannounced_tornado_warnings'](check(app, monkeypatch, [update]), announced) == []
+
+    # A later update that only references the previous one stays quiet too
+    again = tornado_warning('urn:oid:2.49.0.1.840.0.aaa.003.1', ['urn:oid:2.49.0.1.840.0.aaa.002.1'])
+    assert app['unannounced_tornado_warnings'](check(app, monkeypatch, [again]), announced) == []
+
+
+def test_new_warning_is_announced_once(app, monkeypatch):
+    announced = {'urn:oid:2.49.0.1.840.0.aaa.001.1'}
+    other = tornado_warning('urn:oid:2.49.0.1.840.0.bbb.001.1')
+    assert len(app['unannounced_tornado_warnings'](check(app, monkeypatch, [other]), announced)) == 1
+    assert app['unannounced_tornado_warnings'](check(app, monkeypatch, [other]), announced) == []
@@ -0,0 +1,43 @@
+ANSWER = (
+    'Tornado risk is elevated today near Valley. Storms should fire by 4 PM! '
+    'Stay south of the hook? Ok. Watch the "RFD" surge'
+)
+
+
+def test_split_spoken_sentences_keeps_unfinished_remainder(app):
+    sentences, remainder = app['split_spoken_sentences']('Hi. Ok. This is a longer sentence. And more')
+    # Fragments shorter than VOICE_SENTENCE_MIN_CHARS are held and spoken with the next sentence
+    assert sentences == ['Hi. Ok. This is a longer sentence.']
+    assert remainder == 'And more'
+
+
+def test_split_spoken_sentences_waits_for_whitespace_after_punctuation(app):
+    assert app['split_spoken_sentences']('Storms fire by 4 PM.') == ([], 'Storms fire by 4 PM.')
+    assert app['split_spoken_sentences']('Shear is 4.5') == ([], 'Shear is 4.5')
+
+
+def test_speak_streamed_response_passes_chunks_and_queues_sentences(app, monkeypatch):
+    queued = []
+    monkeypatch.setitem(app, 'queue_voice_sentence', lambda sentence, container, first=False: queued.append((sentence, first)))
+    chunks = [ANSWER[i:i + 7] for i in range(0, len(ANSWER), 7)]
+
+    streamed = []
+    for chunk in app['speak_streamed_response'](iter(chunks), container=None):
+        streamed.append(chunk)
+        # Every sentence queued so far is complete text the reader has already seen
+        assert all(sentence in ''.join(streamed) for sentence, _ in queued)
+
+    assert streamed == chunks
+    assert queued == [
+        ('Tornado risk is elevated today near Valley.', True),
+        ('Storms should fire by 4 PM!', False),
+        ('Stay south of the hook?', False),
+        ('Ok. Watch the "RFD" surge', False),
+    ]
+
+
+def test_speak_streamed_response_speaks_short_answer_once(app, monkeypatch):
+    queued = []
+    monkeypatch.setitem(app, 'queue_voice_sentence', lambda sentence, container, first=False: queued.append((sentence, first)))
+    assert list(app['speak_streamed_response'](iter(['Stay ', 'safe.']), container=None)) == ['Stay ', 'safe.']
+    assert queued == [('Stay safe.', True)]